@@ -25,12 +25,17 @@ TASK_STATS_FORMATS = ("basic", "detailed")
 FLAGS = flags.FLAGS
 
 # Required inputs for either (csv_files, label) or (csv_files, conf_files)
-flags.DEFINE_list("csv_files", None, "List of CSV files containing experiment logs")
+flags.DEFINE_list(
+    "csv_files",
+    None,
+    "List of CSV files containing experiment logs. The directories of the binary "
+    "event logs (see `--event_log_name` in main.py) can be given instead of the CSVs.",
+)
 flags.mark_flag_as_required("csv_files")
 flags.register_validator(
     "csv_files",
-    lambda value: all(f.endswith(".csv") for f in value),
-    message="All files must end with .csv extension",
+    lambda value: all(f.endswith(".csv") or os.path.isdir(f) for f in value),
+    message="All files must end with .csv extension or be event log directories",
 )
 
 flags.DEFINE_list("csv_labels", None, "List of labels to use for the experiment logs")
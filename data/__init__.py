@@ -3,6 +3,7 @@
 from .alibaba_loader import AlibabaLoader
 from .base_workload_loader import BaseWorkloadLoader
 from .csv_reader import CSVReader
+from .event_log import EventLogReader, EventLogWriter
 from .task_loader import TaskLoader
 from .task_loader_benchmark import TaskLoaderBenchmark
 from .task_loader_pylot import TaskLoaderPylot
@@ -1,3 +1,5 @@
+import hashlib
+import logging
 import math
 import os
 import pathlib
@@ -5,9 +7,19 @@ import pickle
 import random
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from functools import partial
-from typing import Callable, List, Mapping, Optional, Tuple
+from typing import (
+    Callable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import absl
 
@@ -22,6 +34,7 @@ from workload import (
     Workload,
     WorkProfile,
 )
+from workload.graph import Graph
 
 from .base_workload_loader import BaseWorkloadLoader
 
@@ -43,10 +56,36 @@ class Task:
     mem_usage: float
 
 
+class PickledTask:
+    """Unpickles the `Task`s of both the current and the earlier traces, which
+    pickled each Task as a namedtuple of (name, job, instances, status, start_time,
+    end_time, duration, cpu, mem) instead of the `Task` dataclass."""
+
+    def __new__(cls, *args):
+        if len(args) == 0:
+            # The state of the Task dataclass is restored by the Unpickler.
+            return object.__new__(Task)
+        name, job, instances, status, start_time, end_time, duration, cpu, mem = args
+        return Task(
+            name=name,
+            job=job,
+            instances=instances,
+            status=status,
+            start_time=start_time,
+            end_time=end_time,
+            expected_duration=duration,
+            actual_duration=duration,
+            cpu_requested=cpu,
+            cpu_usage=cpu,
+            mem_requested=mem,
+            mem_usage=mem,
+        )
+
+
 class AlibabaTaskUnpickler(pickle.Unpickler):
     def find_class(self, module, name):
         if name == "Task":
-            return Task
+            return PickledTask
         return super().find_class(module, name)
 
 
@@ -61,6 +100,321 @@ FILTERED_DAGS = (
     "j_2953716",
 )
 
+# The version of the format of the JobGraph definitions cached on disk. This must be
+# bumped whenever the conversion of the trace into the definitions changes.
+JOB_GRAPH_CACHE_VERSION = 3
+
+
+class JobGraphDefinition(NamedTuple):
+    """The plain-data definition of a `JobGraph` converted from the Alibaba trace.
+
+    The definitions are what the loader caches on disk, and a `JobGraph` is only
+    constructed from a definition when it is sampled for release.
+
+    Args:
+        name (`str`): The name of the JobGraph.
+        jobs (`Tuple[Tuple[str, Tuple[Tuple[str, int, int], ...]], ...]`): The name
+            of each Job along with the (resource name, quantity, runtime in
+            microseconds) of each of its execution strategies.
+        children (`Tuple[Tuple[str, Tuple[str, ...]], ...]`): The name of each Job
+            in the JobGraph along with the names of its children.
+        deadline_variance (`Tuple[int, int]`): The deadline variance of the
+            JobGraph.
+        critical_path_runtime (`int`): The runtime (in microseconds) of the critical
+            path of the JobGraph.
+    """
+
+    name: str
+    jobs: Tuple[Tuple[str, Tuple[Tuple[str, int, int], ...]], ...]
+    children: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    deadline_variance: Tuple[int, int]
+    critical_path_runtime: int
+
+
+class JobGraphConverter(object):
+    """Converts the DAGs of the Alibaba trace into `JobGraphDefinition`s, and filters
+    them by the runtime of their critical path.
+
+    A converter only holds the parameters of the conversion, so that it can be sent
+    to the processes that convert the DAGs of a trace in parallel. The random resource
+    usage of the Jobs of a DAG (if requested) is drawn from a generator seeded by the
+    random seed and the name of the DAG, and thus the conversion of a DAG does not
+    depend on the other DAGs or on the number of processes.
+
+    Args:
+        random_seed (`Optional[int]`): The seed of the generators of the DAGs.
+        task_cpu_multiplier (`int`): The multiplier used on the random resource
+            usage of the Jobs.
+        task_cpu_divisor (`int`): The divisor used to convert the CPU usage of the
+            Tasks into the resource usage of the Jobs.
+        task_cpu_usage_min (`int`): The minimum resource usage of a Job.
+        task_cpu_usage_max (`int`): The maximum resource usage of a Job.
+        task_cpu_usage_random (`bool`): If True, the resource usage of the Jobs is
+            chosen randomly between the minimum and the maximum.
+        bump_resources_of_low_duration_task (`bool`): If True, the Jobs with a
+            duration lower than 4 use the maximum random resource usage.
+        heterogeneous (`bool`): If True, the Jobs can also execute faster on a
+            second resource type.
+        deadline_variance (`Tuple[int, int]`): The deadline variance of the
+            JobGraphs.
+        critical_path_runtime_bounds (`Tuple[int, int]`): The [minimum, maximum)
+            runtime (in microseconds) of the critical path of the JobGraphs that are
+            retained.
+        profile_label (`Optional[str]`): The label appended to the name of the
+            JobGraphs, if any.
+        logger (`Optional[logging.Logger]`): The logger used to log the skipped DAGs.
+    """
+
+    def __init__(
+        self,
+        random_seed: Optional[int],
+        task_cpu_multiplier: int,
+        task_cpu_divisor: int,
+        task_cpu_usage_min: int,
+        task_cpu_usage_max: int,
+        task_cpu_usage_random: bool,
+        bump_resources_of_low_duration_task: bool,
+        heterogeneous: bool,
+        deadline_variance: Tuple[int, int],
+        critical_path_runtime_bounds: Tuple[int, int] = (0, sys.maxsize),
+        profile_label: Optional[str] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self._random_seed = random_seed
+        self._task_cpu_multiplier = task_cpu_multiplier
+        self._task_cpu_divisor = task_cpu_divisor
+        self._task_cpu_usage_min = task_cpu_usage_min
+        self._task_cpu_usage_max = task_cpu_usage_max
+        self._task_cpu_usage_random = task_cpu_usage_random
+        self._bump_resources_of_low_duration_task = bump_resources_of_low_duration_task
+        self._heterogeneous = heterogeneous
+        self._deadline_variance = deadline_variance
+        self._critical_path_runtime_bounds = critical_path_runtime_bounds
+        self._profile_label = profile_label
+        self._logger = logger if logger is not None else logging.getLogger(__name__)
+
+    def __repr__(self) -> str:
+        return (
+            f"JobGraphConverter(random_seed={self._random_seed}, "
+            f"task_cpu_multiplier={self._task_cpu_multiplier}, "
+            f"task_cpu_divisor={self._task_cpu_divisor}, "
+            f"task_cpu_usage_min={self._task_cpu_usage_min}, "
+            f"task_cpu_usage_max={self._task_cpu_usage_max}, "
+            f"task_cpu_usage_random={self._task_cpu_usage_random}, "
+            "bump_resources_of_low_duration_task="
+            f"{self._bump_resources_of_low_duration_task}, "
+            f"heterogeneous={self._heterogeneous}, "
+            f"deadline_variance={self._deadline_variance}, "
+            f"critical_path_runtime_bounds={self._critical_path_runtime_bounds}, "
+            f"profile_label={self._profile_label})"
+        )
+
+    def convert(
+        self, job_graph_name: str, job_tasks: List[Task]
+    ) -> Optional[JobGraphDefinition]:
+        """Convert the raw job data to the definition of a JobGraph.
+
+        Returns:
+            The `JobGraphDefinition` of the job, or `None` if the job cannot be
+            released by the loader.
+        """
+        # The resource usage of the Jobs is randomized with a generator that only
+        # depends on the seed and the DAG.
+        rng = (
+            random.Random(f"{self._random_seed}_{job_graph_name}")
+            if self._task_cpu_usage_random
+            else None
+        )
+
+        # Find the execution strategies of the Jobs corresponding to each Task.
+        job_name_to_execution_strategies = {}
+        for task in job_tasks:
+            # The name of the Job from the Task.
+            job_name = task.name.split("_")[0]
+
+            if self._task_cpu_usage_random:
+                # We randomly generate the task CPU utilization between the bounds.
+                resource_usage = (
+                    rng.randint(self._task_cpu_usage_min, self._task_cpu_usage_max)
+                    * self._task_cpu_multiplier
+                )
+                # bump up the resources of low duration tasks
+                if (
+                    self._bump_resources_of_low_duration_task
+                    and task.actual_duration < 4
+                ):
+                    resource_usage = self._task_cpu_usage_max
+            else:
+                # This code will use the cpu requirements from
+                # the alibaba trace and adjust slots
+                # Note: We divide the CPU by some self._task_cpu_divisor instead
+                # of 100 because this would intorduce more variance into the
+                # resource/slots usage.
+                # We used to divide by 100, but the majority of the tasks
+                # would end up using 1 slot, which is not very interesting and
+                # makes no chance for DAG_Sched to do effective packing that
+                # would beat EDF by a significant margin.
+                resource_usage = int(math.ceil(task.cpu_usage / self._task_cpu_divisor))
+                if resource_usage < self._task_cpu_usage_min:
+                    self._logger.debug(
+                        "Skipping JobGraph %s because the Job %s required %s units "
+                        "of the resource, but the minimum allowed is %s",
+                        job_graph_name,
+                        job_name,
+                        resource_usage,
+                        self._task_cpu_usage_min,
+                    )
+                    return None
+                elif resource_usage > self._task_cpu_usage_max:
+                    self._logger.debug(
+                        "Skipping JobGraph %s because the Job %s required %s units "
+                        "of the resource, but the maximum allowed is %s",
+                        job_graph_name,
+                        job_name,
+                        resource_usage,
+                        self._task_cpu_usage_max,
+                    )
+                    return None
+
+            # If we want to try randomizing the duration of the tasks.
+            # random_task_duration = round(
+            #     self._sample_normal_distribution_random(1, 50, 15)[0]
+            # )
+            # Use this if we want middle heavy distribution of task durations
+            # if i == 0 or i == len(job_tasks) - 1:
+            #     random_task_duration =
+            #       round(self._sample_normal_distribution_random(1, 10, 5)[0])
+            # else:
+            #     random_task_duration =
+            #       round(self._sample_normal_distribution_random(1, 50, 15)[0])
+
+            if task.actual_duration <= 0:
+                # Some loaded TaskGraphs have no duration, skip those.
+                self._logger.debug(
+                    "Skipping JobGraph %s because the Job %s has duration %s",
+                    job_graph_name,
+                    job_name,
+                    task.actual_duration,
+                )
+                return None
+
+            execution_strategies = [
+                ("Slot_1", resource_usage, int(math.ceil(task.actual_duration)))
+            ]
+            if self._heterogeneous:
+                # This is used when self._heterogeneous is True
+                # to support another execution strategy where it runs faster.
+                execution_strategies.append(
+                    (
+                        "Slot_2",
+                        resource_usage,
+                        int(math.ceil(task.actual_duration * 0.8)),
+                    )
+                )
+            job_name_to_execution_strategies[job_name] = tuple(execution_strategies)
+
+        # Index the Jobs by the number in their name (e.g., `M1` and `R1` are both
+        # indexed by `1`), which is how the Tasks refer to their parents.
+        job_name_to_position = {}
+        job_number_to_job_names = defaultdict(list)
+        for position, job_name in enumerate(job_name_to_execution_strategies):
+            job_name_to_position[job_name] = position
+            job_number_to_job_names[job_name[1:]].append(job_name)
+
+        # Find the children of each Job.
+        jobs_to_children = defaultdict(list)
+        for task in job_tasks:
+            job_and_parents = task.name.split("_", 1)
+            if len(job_and_parents) == 1:
+                # This job has no parent, add an empty list.
+                jobs_to_children[job_and_parents[0]].extend([])
+            else:
+                # This job has children, find them from the index. The parents are
+                # visited in the order of the Jobs to keep the order of the edges.
+                current_job = job_and_parents[0]
+                parent_job_names = [
+                    parent_job_name
+                    for parent in set(job_and_parents[1].split("_"))
+                    for parent_job_name in job_number_to_job_names.get(parent, ())
+                ]
+                parent_job_names.sort(key=job_name_to_position.__getitem__)
+                for parent_job_name in parent_job_names:
+                    jobs_to_children[parent_job_name].append(current_job)
+
+        jobs = tuple(job_name_to_execution_strategies.items())
+        children = tuple(
+            (job_name, tuple(children))
+            for job_name, children in jobs_to_children.items()
+        )
+        return JobGraphDefinition(
+            name=(
+                job_graph_name
+                if self._profile_label is None
+                else f"{job_graph_name}_{self._profile_label}"
+            ),
+            jobs=jobs,
+            children=children,
+            deadline_variance=self._deadline_variance,
+            critical_path_runtime=self.get_critical_path_runtime(jobs, children),
+        )
+
+    def convert_and_filter(
+        self, dags: Sequence[Tuple[str, List[Task]]]
+    ) -> List[Tuple[str, Optional[JobGraphDefinition], Optional[str]]]:
+        """Convert the given DAGs, and filter them by the runtime of their critical
+        path.
+
+        Args:
+            dags (`Sequence[Tuple[str, List[Task]]]`): The name and the Tasks of
+                each DAG.
+
+        Returns:
+            The name of each DAG along with its `JobGraphDefinition` (or `None` if
+            the DAG was skipped) and the error with which its conversion failed (if
+            any), in the order of the DAGs.
+        """
+        (
+            min_critical_path_runtime,
+            max_critical_path_runtime,
+        ) = self._critical_path_runtime_bounds
+        results = []
+        for job_graph_name, job_tasks in dags:
+            try:
+                definition = self.convert(job_graph_name, job_tasks)
+                if definition is not None and not (
+                    min_critical_path_runtime
+                    <= definition.critical_path_runtime
+                    < max_critical_path_runtime
+                ):
+                    definition = None
+            except ValueError as e:
+                results.append((job_graph_name, None, f"{e.__class__}: {e}"))
+                continue
+            results.append((job_graph_name, definition, None))
+        return results
+
+    @staticmethod
+    def get_critical_path_runtime(
+        jobs: Tuple[Tuple[str, Tuple[Tuple[str, int, int], ...]], ...],
+        children: Tuple[Tuple[str, Tuple[str, ...]], ...],
+    ) -> int:
+        """Computes the runtime (in microseconds) of the critical path of the
+        JobGraph with the given Jobs and children (as in a `JobGraphDefinition`),
+        as `JobGraph.critical_path_runtime` would, without constructing its `Job`s.
+
+        Raises:
+            `ValueError` if the JobGraph is empty.
+        """
+        runtimes = {
+            job_name: max(runtime for _, _, runtime in execution_strategies)
+            for job_name, execution_strategies in jobs
+        }
+        graph = Graph(dict(children))
+        return sum(
+            runtimes[job_name]
+            for job_name in graph.get_longest_path(weights=runtimes.__getitem__)
+        )
+
 
 class AlibabaLoader(BaseWorkloadLoader):
     """Loads the Alibaba trace from the provided file.
@@ -98,7 +452,13 @@ class AlibabaLoader(BaseWorkloadLoader):
         )
         self._release_times_and_profiles = self._construct_release_times()
 
-        self._job_graphs: Mapping[str, Mapping[str, JobGraph]] = {}
+        # The JobGraphs are kept as their definitions until they are sampled for
+        # release.
+        self._job_graphs: Mapping[
+            str, Mapping[str, Union[JobGraph, JobGraphDefinition]]
+        ] = {}
+        # The names of the JobGraphs of each profile that can be sampled for release.
+        self._release_candidates: Mapping[str, List[str]] = {}
         self._release_times = self._construct_release_times()
         self._current_release_pointer = 0
         self._workload_update_interval = (
@@ -117,6 +477,14 @@ class AlibabaLoader(BaseWorkloadLoader):
         self._alibaba_bump_resources_of_low_duration_task = (
             self._flags.alibaba_bump_resources_of_low_duration_task
         )
+        self._cache_dir = self._flags.alibaba_loader_cache_dir
+        self._num_workers = self._flags.alibaba_loader_num_workers
+        self._min_release_critical_path_runtime = (
+            self._flags.alibaba_loader_min_release_critical_path_runtime
+        )
+        self._max_release_critical_path_runtime = (
+            self._flags.alibaba_loader_max_release_critical_path_runtime
+        )
 
     def _construct_workload_definitions(
         self,
@@ -418,58 +786,88 @@ class AlibabaLoader(BaseWorkloadLoader):
         ):
             if not os.path.isfile(path):
                 raise FileNotFoundError(f"No such file: {path}")
+            converter = self._get_job_graph_converter(
+                min_deadline_variance,
+                max_deadline_variance,
+                min_critical_path_runtime,
+                max_critical_path_runtime,
+                profile_label,
+            )
+
+            # The cache cannot be used to dump the filtered DAGs since it does not
+            # retain the Tasks from the trace.
+            cache_path = None
+            if (
+                self._cache_dir is not None
+                and not self._flags.alibaba_dump_filtered_dags
+            ):
+                cache_path = self._get_cache_path(path, converter)
+                if os.path.isfile(cache_path):
+                    with open(cache_path, "rb") as cache_file:
+                        definitions, skipped_job_graphs = pickle.load(cache_file)
+                    for job_graph_name, definition in definitions:
+                        self._job_graphs[path][job_graph_name] = definition
+                    self._logger.debug(
+                        f"[0] Skipped {skipped_job_graphs} job graphs from path "
+                        f"{path}, loaded {len(definitions)} job graphs from the cache "
+                        f"{cache_path}."
+                    )
+                    return
+
             with open(path, "rb") as pickled_file:
-                data: Mapping[str, List[str]] = AlibabaTaskUnpickler(
+                data: Mapping[str, List[Task]] = AlibabaTaskUnpickler(
                     pickled_file
                 ).load()
-                skipped_job_graphs = 0
-                if self._flags.alibaba_dump_filtered_dags:
-                    new_pickled_file_name = f"{profile_label}_filtered.pkl"
-                    new_pickle = {}
-                for job_graph_name, job_tasks in data.items():
-                    if job_graph_name in FILTERED_DAGS:
-                        continue
-                    try:
-                        job_graph = self._convert_job_data_to_job_graph(
-                            job_graph_name,
-                            job_tasks,
-                            min_deadline_variance,
-                            max_deadline_variance,
-                            profile_label,
-                        )
-                        if job_graph:
-                            cp_runtime = job_graph.critical_path_runtime
-                            if (
-                                min_critical_path_runtime
-                                <= cp_runtime.to(EventTime.Unit.US).time
-                                < max_critical_path_runtime
-                            ):
-                                self._job_graphs[path][job_graph_name] = job_graph
-                                if self._flags.alibaba_dump_filtered_dags:
-                                    new_pickle[job_graph_name] = job_tasks
-                            else:
-                                skipped_job_graphs += 1
-                                # self._logger.debug(
-                                #     f"[0] Skipping job graph {job_graph_name} with "
-                                #     f"critical path runtime "
-                                #     f"{cp_runtime.to(EventTime.Unit.US).time}"
-                                #     f" outside of range [{min_critical_path_runtime},"
-                                #     f" {max_critical_path_runtime})."
-                                # )
-                        else:
-                            skipped_job_graphs += 1
-                    except ValueError as e:
-                        self._logger.warning(
-                            f"Failed to convert job graph {job_graph_name} "
-                            f"with error {e.__class__}: {e}."
-                        )
+            definitions = []
+            skipped_job_graphs = 0
+            for job_graph_name, definition, error in self._convert_job_graphs(
+                converter,
+                [
+                    (job_graph_name, job_tasks)
+                    for job_graph_name, job_tasks in data.items()
+                    if job_graph_name not in FILTERED_DAGS
+                ],
+            ):
+                if error is not None:
+                    self._logger.warning(
+                        f"Failed to convert job graph {job_graph_name} "
+                        f"with error {error}."
+                    )
+                elif definition is None:
+                    skipped_job_graphs += 1
+                else:
+                    self._job_graphs[path][job_graph_name] = definition
+                    definitions.append((job_graph_name, definition))
+            self._logger.debug(
+                f"[0] Skipped {skipped_job_graphs} job graphs from path {path}, "
+                f"loaded {len(self._job_graphs[path])} job graphs."
+            )
+            if self._flags.alibaba_dump_filtered_dags:
+                with open(f"{profile_label}_filtered.pkl", "wb") as f2:
+                    pickle.dump(
+                        {
+                            job_graph_name: data[job_graph_name]
+                            for job_graph_name, _ in definitions
+                        },
+                        f2,
+                    )
+
+            if cache_path is not None:
+                # Write the cache atomically, so that concurrent runs never read a
+                # partially written cache.
+                os.makedirs(self._cache_dir, exist_ok=True)
+                temporary_cache_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(temporary_cache_path, "wb") as cache_file:
+                    pickle.dump(
+                        (definitions, skipped_job_graphs),
+                        cache_file,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+                os.replace(temporary_cache_path, cache_path)
                 self._logger.debug(
-                    f"[0] Skipped {skipped_job_graphs} job graphs from path {path}, "
-                    f"loaded {len(self._job_graphs[path])} job graphs."
+                    f"[0] Cached {len(definitions)} job graphs from path {path} "
+                    f"into {cache_path}."
                 )
-                if self._flags.alibaba_dump_filtered_dags:
-                    with open(new_pickled_file_name, "wb") as f2:
-                        pickle.dump(new_pickle, f2)
 
         path_to_job_graph_generator_mapping = {}
         for index, (path, _) in enumerate(self._workload_paths_and_release_policies):
@@ -516,199 +914,186 @@ class AlibabaLoader(BaseWorkloadLoader):
                 )
         return path_to_job_graph_generator_mapping
 
-    def _sample_normal_distribution_random(self, n, mean, std, min_val=0, max_val=100):
-        samples = []
-        while len(samples) < n:
-            sample = self._rng.normalvariate(mean, std)
-            if min_val <= sample <= max_val:
-                samples.append(sample)
-        return samples
-
-    def _convert_job_data_to_job_graph(
+    def _get_job_graph_converter(
         self,
-        job_graph_name: str,
-        job_tasks: List[str],
         min_deadline_variance: Optional[int] = None,
         max_deadline_variance: Optional[int] = None,
+        min_critical_path_runtime: int = 0,
+        max_critical_path_runtime: int = sys.maxsize,
         profile_label: Optional[str] = None,
-    ) -> Optional[JobGraph]:
-        """
-        Convert the raw job data to a Job object.
+    ) -> JobGraphConverter:
+        """Constructs the converter of the DAGs of a Workload profile according to
+        the flags of the loader and the given parameters of the profile."""
+        return JobGraphConverter(
+            random_seed=self._rng_seed,
+            task_cpu_multiplier=self._task_cpu_multiplier,
+            task_cpu_divisor=self._task_cpu_divisor,
+            task_cpu_usage_min=self._task_cpu_usage_min,
+            task_cpu_usage_max=self._task_cpu_usage_max,
+            task_cpu_usage_random=self._task_cpu_usage_random,
+            bump_resources_of_low_duration_task=(
+                self._alibaba_bump_resources_of_low_duration_task
+            ),
+            heterogeneous=self._heterogeneous,
+            deadline_variance=(
+                (
+                    self._flags.min_deadline_variance
+                    if min_deadline_variance is None
+                    else min_deadline_variance
+                ),
+                (
+                    self._flags.max_deadline_variance
+                    if max_deadline_variance is None
+                    else max_deadline_variance
+                ),
+            ),
+            critical_path_runtime_bounds=(
+                min_critical_path_runtime,
+                max_critical_path_runtime,
+            ),
+            profile_label=profile_label,
+            logger=self._logger,
+        )
 
-        This method should be implemented according to the specifics of the
-        Alibaba trace file format and your Job class.
-        """
-        # Create the individual Job instances corresponding to each Task.
-        task_name_to_simulator_job_mapping = {}
-        for task in job_tasks:
-            # The name of the Job from the Task.
-            job_name = task.name.split("_")[0]
+    def _convert_job_graphs(
+        self, converter: JobGraphConverter, dags: Sequence[Tuple[str, List[Task]]]
+    ) -> List[Tuple[str, Optional[JobGraphDefinition], Optional[str]]]:
+        """Converts the given DAGs with the converter, in a pool of
+        `alibaba_loader_num_workers` processes if more than one is requested.
 
-            if self._task_cpu_usage_random:
-                # We randomly generate the task CPU utilization between the bounds.
-                resource_usage = (
-                    self._rng.randint(
-                        self._task_cpu_usage_min, self._task_cpu_usage_max
-                    )
-                    * self._task_cpu_multiplier
-                )
-                # bump up the resources of low duration tasks
-                if (
-                    self._alibaba_bump_resources_of_low_duration_task
-                    and task.actual_duration < 4
-                ):
-                    resource_usage = self._task_cpu_usage_max
+        Returns:
+            The results of `JobGraphConverter.convert_and_filter` for the DAGs.
+        """
+        if self._num_workers <= 1 or len(dags) <= 1:
+            return converter.convert_and_filter(dags)
 
-                job_resources_1 = Resources(
-                    resource_vector={
-                        Resource(name="Slot_1", _id="any"): resource_usage,
-                    }
-                )
-                job_resources_2 = Resources(
-                    resource_vector={
-                        Resource(name="Slot_2", _id="any"): resource_usage,
-                    }
-                )
-            else:
-                # This code will use the cpu requirements from
-                # the alibaba trace and adjust slots
-                resource_usage = int(math.ceil(task.cpu_usage / self._task_cpu_divisor))
-                job_resources_1 = Resources(
-                    resource_vector={
-                        # Note: We divide the CPU by some self._task_cpu_divisor instead
-                        # of 100 because this would intorduce more variance into the
-                        # resource/slots usage.
-                        # We used to divide by 100, but the majority of the tasks
-                        # would end up using 1 slot, which is not very interesting and
-                        # makes no chance for DAG_Sched to do effective packing that
-                        # would beat EDF by a significant margin.
-                        Resource(name="Slot_1", _id="any"): resource_usage,
-                    }
-                )
-                job_resources_2 = Resources(
-                    resource_vector={
-                        Resource(name="Slot_2", _id="any"): resource_usage,
-                    }
+        # Split the DAGs into a few contiguous chunks per process to balance the
+        # load, and concatenate the results of the chunks in order.
+        chunk_size = math.ceil(len(dags) / (4 * self._num_workers))
+        with ProcessPoolExecutor(max_workers=self._num_workers) as executor:
+            return [
+                result
+                for chunk_results in executor.map(
+                    converter.convert_and_filter,
+                    [
+                        dags[index : index + chunk_size]
+                        for index in range(0, len(dags), chunk_size)
+                    ],
                 )
-                if resource_usage < self._task_cpu_usage_min:
-                    self._logger.debug(
-                        "Skipping JobGraph %s because the Job %s required %s units "
-                        "of the resource, but the minimum allowed is %s",
-                        job_graph_name,
-                        job_name,
-                        resource_usage,
-                        self._task_cpu_usage_min,
-                    )
-                    return None
-                elif resource_usage > self._task_cpu_usage_max:
-                    self._logger.debug(
-                        "Skipping JobGraph %s because the Job %s required %s units "
-                        "of the resource, but the maximum allowed is %s",
-                        job_graph_name,
-                        job_name,
-                        resource_usage,
-                        self._task_cpu_usage_max,
-                    )
-                    return None
+                for result in chunk_results
+            ]
 
-            # If we want to try randomizing the duration of the tasks.
-            # random_task_duration = round(
-            #     self._sample_normal_distribution_random(1, 50, 15)[0]
-            # )
-            # Use this if we want middle heavy distribution of task durations
-            # if i == 0 or i == len(job_tasks) - 1:
-            #     random_task_duration =
-            #       round(self._sample_normal_distribution_random(1, 10, 5)[0])
-            # else:
-            #     random_task_duration =
-            #       round(self._sample_normal_distribution_random(1, 50, 15)[0])
+    def _get_cache_path(self, path: str, converter: JobGraphConverter) -> str:
+        """Constructs the path of the cache of the JobGraph definitions converted
+        from the trace at the given path.
 
-            if task.actual_duration <= 0:
-                # Some loaded TaskGraphs have no duration, skip those.
-                self._logger.debug(
-                    "Skipping JobGraph %s because the Job %s has duration %s",
-                    job_graph_name,
-                    job_name,
-                    task.actual_duration,
-                )
-                return None
+        The cache is keyed by the trace (its path, size and modification time) and
+        the parameters of the converter, which include the random seed and the
+        flags that affect the conversion and the filtering of the trace.
 
-            job_runtime_1 = EventTime(
-                int(math.ceil(task.actual_duration)),
-                EventTime.Unit.US,
+        Returns:
+            The path of the cache file in the cache directory.
+        """
+        trace_stat = os.stat(path)
+        key = repr(
+            (
+                JOB_GRAPH_CACHE_VERSION,
+                os.path.abspath(path),
+                trace_stat.st_size,
+                trace_stat.st_mtime_ns,
+                FILTERED_DAGS,
+                converter,
             )
-            # This is used when self._heterogeneous is True
-            # to support another execution strategy where it runs faster.
-            job_runtime_2 = EventTime(
-                int(math.ceil(task.actual_duration * 0.8)),
-                EventTime.Unit.US,
+        )
+        return os.path.join(
+            self._cache_dir,
+            f"{pathlib.Path(path).stem}_"
+            f"{hashlib.sha256(key.encode()).hexdigest()[:16]}.pkl",
+        )
+
+    def _construct_release_candidates(self, path: str) -> List[str]:
+        """Constructs the names of the JobGraphs loaded from the given path whose
+        TaskGraphs can be released, i.e., whose critical path runtime lies strictly
+        between `alibaba_loader_min_release_critical_path_runtime` and
+        `alibaba_loader_max_release_critical_path_runtime`.
+
+        Returns:
+            The names of the JobGraphs in the order in which they were loaded.
+
+        Raises:
+            `ValueError` if none of the JobGraphs can be released.
+        """
+        release_candidates = [
+            job_graph_name
+            for job_graph_name, definition in self._job_graphs[path].items()
+            if self._min_release_critical_path_runtime
+            < definition.critical_path_runtime
+            < self._max_release_critical_path_runtime
+        ]
+        if len(release_candidates) == 0:
+            raise ValueError(
+                f"None of the {len(self._job_graphs[path])} JobGraphs loaded from "
+                f"{path} has a critical path runtime between "
+                f"{self._min_release_critical_path_runtime} and "
+                f"{self._max_release_critical_path_runtime}."
             )
+        self._logger.debug(
+            f"[0] {len(release_candidates)} of the {len(self._job_graphs[path])} job "
+            f"graphs from path {path} can be released."
+        )
+        return release_candidates
 
-            execution_strategies = [
-                ExecutionStrategy(
-                    resources=job_resources_1,
-                    batch_size=1,
-                    runtime=job_runtime_1,
-                ),
-            ]
-            if self._heterogeneous:
-                execution_strategies.append(
-                    ExecutionStrategy(
-                        resources=job_resources_2,
-                        batch_size=1,
-                        runtime=job_runtime_2,
-                    ),
-                )
+    def _sample_normal_distribution_random(self, n, mean, std, min_val=0, max_val=100):
+        samples = []
+        while len(samples) < n:
+            sample = self._rng.normalvariate(mean, std)
+            if min_val <= sample <= max_val:
+                samples.append(sample)
+        return samples
+
+    def _construct_job_graph(self, definition: JobGraphDefinition) -> JobGraph:
+        """Construct the JobGraph from its definition.
+
+        Args:
+            definition (`JobGraphDefinition`): The definition of the JobGraph.
 
-            task_name_to_simulator_job_mapping[job_name] = Job(
+        Returns:
+            The `JobGraph` with a `Job` for each of the Jobs in the definition.
+        """
+        jobs = {
+            job_name: Job(
                 name=job_name,
                 profile=WorkProfile(
                     name="SlotPolicyFor{}".format(job_name),
-                    execution_strategies=ExecutionStrategies(execution_strategies),
+                    execution_strategies=ExecutionStrategies(
+                        [
+                            ExecutionStrategy(
+                                resources=Resources(
+                                    resource_vector={
+                                        Resource(name=resource_name, _id="any"): (
+                                            resource_usage
+                                        ),
+                                    }
+                                ),
+                                batch_size=1,
+                                runtime=EventTime(runtime, EventTime.Unit.US),
+                            )
+                            for resource_name, resource_usage, runtime in (
+                                execution_strategies
+                            )
+                        ]
+                    ),
                 ),
             )
-
-        # Create the JobGraph.
-        jobs_to_children = defaultdict(list)
-        for task in job_tasks:
-            job_and_parents = task.name.split("_", 1)
-            if len(job_and_parents) == 1:
-                # This job has no parent, add an empty list.
-                jobs_to_children[
-                    task_name_to_simulator_job_mapping[job_and_parents[0]]
-                ].extend([])
-            else:
-                # This job has children, find them from the list.
-                current_job = job_and_parents[0]
-                parents = set(job_and_parents[1].split("_"))
-                for (
-                    parent_job_name,
-                    parent_job,
-                ) in task_name_to_simulator_job_mapping.items():
-                    if parent_job_name[1:] in parents:
-                        jobs_to_children[parent_job].append(
-                            task_name_to_simulator_job_mapping[current_job]
-                        )
-
+            for job_name, execution_strategies in definition.jobs
+        }
         return JobGraph(
-            name=(
-                job_graph_name
-                if profile_label is None
-                else f"{job_graph_name}_{profile_label}"
-            ),
-            jobs=jobs_to_children,
-            deadline_variance=(
-                (
-                    self._flags.min_deadline_variance
-                    if min_deadline_variance is None
-                    else min_deadline_variance
-                ),
-                (
-                    self._flags.max_deadline_variance
-                    if max_deadline_variance is None
-                    else max_deadline_variance
-                ),
-            ),
+            name=definition.name,
+            jobs={
+                jobs[job_name]: [jobs[child_name] for child_name in children]
+                for job_name, children in definition.children
+            },
+            deadline_variance=definition.deadline_variance,
         )
 
     def get_next_workload(self, current_time: EventTime) -> Optional[Workload]:
@@ -741,18 +1126,23 @@ class AlibabaLoader(BaseWorkloadLoader):
                 if workload_profile not in self._job_graphs:
                     self._job_graphs[workload_profile] = {}
                     self._job_graph_generators[workload_profile]()
-                job_graph = self._rng.choice(
-                    list(self._job_graphs[workload_profile].values())
+                    self._release_candidates[workload_profile] = (
+                        self._construct_release_candidates(workload_profile)
+                    )
+                job_graphs = self._job_graphs[workload_profile]
+                job_graph_name = self._rng.choice(
+                    self._release_candidates[workload_profile]
                 )
+                job_graph = job_graphs[job_graph_name]
+                if isinstance(job_graph, JobGraphDefinition):
+                    # Construct the JobGraph on its first release.
+                    job_graph = self._construct_job_graph(job_graph)
+                    job_graphs[job_graph_name] = job_graph
                 task_graph = job_graph.get_next_task_graph(
                     start_time=start_time,
                     _flags=self._flags,
                 )
-                if (
-                    task_graph is not None
-                    and task_graph.critical_path_runtime.time < 1000
-                    and task_graph.critical_path_runtime.time > 100
-                ):
+                if task_graph is not None:
                     self._logger.debug(
                         "[0] Adding TaskGraph %s from path %s to workload with "
                         "release time %s, critical path runtime %s and deadline %s.",
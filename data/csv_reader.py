@@ -1,5 +1,6 @@
 import csv
 import json
+import os
 from collections import defaultdict
 from operator import add, attrgetter
 from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
@@ -16,6 +17,7 @@ from data.csv_types import (
     WorkerPoolStats,
     WorkerPoolUtilization,
 )
+from data.event_log import EventLogReader
 
 
 class CSVReader(object):
@@ -23,20 +25,24 @@ class CSVReader(object):
 
     Args:
         csv_paths (`Sequence[str]`): The paths to the CSVs where the results
-            are stored.
+            are stored. A path may instead refer to the directory of a binary event
+            log, which is read using the `EventLogReader`.
         _flags (`absl.flags`): The flags used to initialize the app, if any.
     """
 
     def __init__(self, csv_paths: str, _flags: Optional["absl.flags"] = None):
+        self._simulators: dict[str, Simulator] = {}
         readings = {}
         for csv_path in csv_paths:
+            if os.path.isdir(csv_path):
+                self._simulators[csv_path] = EventLogReader(csv_path).get_simulator()
+                continue
             with open(csv_path, "r") as csv_file:
                 path_readings = []
                 for line in csv.reader(csv_file):
                     path_readings.append(line)
                 readings[csv_path] = path_readings
 
-        self._simulators: dict[str, Simulator] = {}
         self.parse_events(readings)
 
     def parse_events(self, readings: Mapping[str, Sequence[str]]):
@@ -143,9 +149,9 @@ class CSVReader(object):
                         task_graphs[reading[5]].cancelled = True
                         task_graphs[reading[5]].cancelled_at = int(reading[0])
                     elif reading[1] == "TASK_SKIP":
-                        if reading[4] in tasks:
+                        if reading[5] in tasks:
                             # Update the task with the skip data.
-                            tasks[reading[4]].update_skip(reading)
+                            tasks[reading[5]].update_skip(reading)
                     elif reading[1] == "TASK_PREEMPT":
                         # Update the placement with the preemption time.
                         tasks[reading[4]].update_preempt(reading)
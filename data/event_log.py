@@ -0,0 +1,631 @@
+import os
+import shutil
+from collections import defaultdict
+from typing import Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from data.csv_types import (
+    Placement,
+    Resource,
+    Scheduler,
+    Simulator,
+    Task,
+    TaskGraph,
+    WorkerPool,
+    WorkerPoolStats,
+    WorkerPoolUtilization,
+)
+
+
+def _create_schema(*columns: Tuple[str, type]) -> np.dtype:
+    """Creates the schema of an event type from its columns, which follow the
+    sequence number of the event in the log and the time of the event."""
+    return np.dtype([("sequence", np.int64), ("time", np.int64), *columns])
+
+
+# The columns of the binary log of each of the event types, in the order in which
+# they are logged. The columns mirror the corresponding rows of the CSV. The string
+# columns (see `STRING_COLUMNS`) store indices into the table of strings of the log,
+# and the `resources` columns refer to the resources of a row of the CSV, formatted
+# as in the CSV (i.e., `name,id,quantity` for each of the resources).
+EVENT_LOG_SCHEMAS: Mapping[str, np.dtype] = {
+    "SIMULATOR_START": _create_schema(),
+    "UPDATE_WORKLOAD": _create_schema(
+        ("num_task_graphs", np.int64), ("num_released_tasks", np.int64)
+    ),
+    "SIMULATOR_END": _create_schema(
+        ("finished_tasks", np.int64),
+        ("cancelled_tasks", np.int64),
+        ("missed_deadlines", np.int64),
+        ("finished_task_graphs", np.int64),
+        ("cancelled_task_graphs", np.int64),
+        ("missed_task_graph_deadlines", np.int64),
+    ),
+    "WORKER_POOL": _create_schema(
+        ("name", np.int32), ("worker_pool_id", np.int32), ("resources", np.int32)
+    ),
+    "WORKER_POOL_UTILIZATION": _create_schema(
+        ("worker_pool_id", np.int32),
+        ("resource_name", np.int32),
+        ("allocated_quantity", np.float64),
+        ("available_quantity", np.float64),
+    ),
+    "SCHEDULER_START": _create_schema(
+        ("released_tasks", np.int64), ("previously_placed_tasks", np.int64)
+    ),
+    "SCHEDULER_FINISHED": _create_schema(
+        ("runtime", np.int64),
+        ("placed_tasks", np.int64),
+        ("unplaced_tasks", np.int64),
+        ("true_runtime", np.int64),
+    ),
+    "TASK_GRAPH_RELEASE": _create_schema(
+        ("release_time", np.int64),
+        ("deadline", np.int64),
+        ("task_graph", np.int32),
+        ("num_tasks", np.int64),
+        ("critical_path_time", np.int64),
+    ),
+    "TASK_GRAPH_FINISHED": _create_schema(
+        ("task_graph", np.int32), ("deadline", np.int64), ("tardiness", np.int64)
+    ),
+    "MISSED_TASK_GRAPH_DEADLINE": _create_schema(
+        ("task_graph", np.int32), ("deadline", np.int64)
+    ),
+    "TASK_RELEASE": _create_schema(
+        ("name", np.int32),
+        ("timestamp", np.int64),
+        ("intended_release_time", np.int64),
+        ("release_time", np.int64),
+        ("deadline", np.int64),
+        ("task_id", np.int32),
+        ("task_graph", np.int32),
+        ("slowest_execution_time", np.int64),
+        ("resources", np.int32),
+    ),
+    "TASK_SCHEDULED": _create_schema(
+        ("name", np.int32),
+        ("task_graph", np.int32),
+        ("timestamp", np.int64),
+        ("task_id", np.int32),
+        ("deadline", np.int64),
+        ("placement_time", np.int64),
+        ("worker_pool_id", np.int32),
+        ("runtime", np.int64),
+    ),
+    "TASK_PLACEMENT": _create_schema(
+        ("name", np.int32),
+        ("task_graph", np.int32),
+        ("timestamp", np.int64),
+        ("task_id", np.int32),
+        ("worker_pool_id", np.int32),
+        ("runtime", np.int64),
+        ("resources", np.int32),
+    ),
+    "TASK_SKIP": _create_schema(
+        ("name", np.int32),
+        ("task_graph", np.int32),
+        ("timestamp", np.int64),
+        ("task_id", np.int32),
+    ),
+    "TASK_PREEMPT": _create_schema(
+        ("name", np.int32), ("timestamp", np.int64), ("task_id", np.int32)
+    ),
+    "TASK_MIGRATED": _create_schema(
+        ("name", np.int32),
+        ("timestamp", np.int64),
+        ("task_id", np.int32),
+        ("old_worker_pool_id", np.int32),
+        ("worker_pool_id", np.int32),
+        ("resources", np.int32),
+    ),
+    "TASK_CANCEL": _create_schema(
+        ("name", np.int32),
+        ("timestamp", np.int64),
+        ("task_id", np.int32),
+        ("task_graph", np.int32),
+        ("slowest_execution_time", np.int64),
+    ),
+    "TASK_FINISHED": _create_schema(
+        ("name", np.int32),
+        ("timestamp", np.int64),
+        ("task_graph", np.int32),
+        ("completion_time", np.int64),
+        ("deadline", np.int64),
+        ("task_id", np.int32),
+    ),
+    "MISSED_DEADLINE": _create_schema(
+        ("name", np.int32),
+        ("timestamp", np.int64),
+        ("deadline", np.int64),
+        ("task_id", np.int32),
+    ),
+}
+STRING_COLUMNS = frozenset(
+    (
+        "name",
+        "task_graph",
+        "task_id",
+        "worker_pool_id",
+        "old_worker_pool_id",
+        "resource_name",
+        "resources",
+    )
+)
+STRINGS_FILE_NAME = "strings.npy"
+
+
+class EventLogWriter(object):
+    """Logs the events of a Simulator run into a columnar binary format.
+
+    The events of each type in `EVENT_LOG_SCHEMAS` are stored as a NumPy record
+    array in `<event_type>.npy` inside the given directory, and the strings
+    referenced by the records are stored once in `strings.npy`. Each record is
+    stamped with the sequence number of the event in the log, so that the events of
+    different types can be replayed in the order in which they were logged. The
+    events are buffered in memory, and appended in chunks of records to a partial
+    file of each type upon `flush` (or when the buffer of a type fills up). The
+    partial files are turned into the `.npy` files upon `close`.
+
+    Args:
+        path (`str`): The path of the directory to write the log to.
+        buffer_size (`int`): The number of events of a type to buffer before they
+            are written.
+    """
+
+    def __init__(self, path: str, buffer_size: int = 65536):
+        if buffer_size < 1:
+            raise ValueError(f"The buffer size must be positive, not {buffer_size}.")
+        self._path = path
+        self._buffer_size = buffer_size
+        self._strings: dict[str, int] = {}
+        self._events: Mapping[str, list] = {
+            event_type: [] for event_type in EVENT_LOG_SCHEMAS
+        }
+        # The sequence number is assigned by the writer, and is not logged.
+        self._string_columns: Mapping[str, Sequence[bool]] = {
+            event_type: [name in STRING_COLUMNS for name in schema.names[1:]]
+            for event_type, schema in EVENT_LOG_SCHEMAS.items()
+        }
+        self._num_logged_events = 0
+        # The number of events of each type written to the partial files.
+        self._num_written_events: Mapping[str, int] = {
+            event_type: 0 for event_type in EVENT_LOG_SCHEMAS
+        }
+        self._closed = False
+
+    def log(self, event_type: str, *values) -> None:
+        """Logs an event of the given type.
+
+        Args:
+            event_type (`str`): The type of the event (from `EVENT_LOG_SCHEMAS`).
+            values: The values of the columns of the event (starting with the time
+                of the event), in the schema's order.
+        """
+        strings = self._strings
+        events = self._events[event_type]
+        events.append(
+            (
+                self._num_logged_events,
+                *(
+                    strings.setdefault(str(value), len(strings)) if is_string else value
+                    for value, is_string in zip(
+                        values, self._string_columns[event_type]
+                    )
+                ),
+            )
+        )
+        self._num_logged_events += 1
+        if len(events) >= self._buffer_size:
+            self.__write_events(event_type)
+
+    def flush(self) -> None:
+        """Appends the buffered events to the partial files in the directory."""
+        if self._closed:
+            return
+        for event_type in EVENT_LOG_SCHEMAS:
+            self.__write_events(event_type)
+
+    def close(self) -> None:
+        """Flushes the buffered events, and writes out the `.npy` files of the log.
+
+        The log is only readable by the `EventLogReader` once it is closed. Closing
+        the writer more than once has no effect.
+        """
+        if self._closed:
+            return
+        self.flush()
+        os.makedirs(self._path, exist_ok=True)
+        for event_type, schema in EVENT_LOG_SCHEMAS.items():
+            with open(os.path.join(self._path, f"{event_type}.npy"), "wb") as f:
+                np.lib.format.write_array_header_1_0(
+                    f,
+                    {
+                        "descr": np.lib.format.dtype_to_descr(schema),
+                        "fortran_order": False,
+                        "shape": (self._num_written_events[event_type],),
+                    },
+                )
+                if self._num_written_events[event_type] > 0:
+                    partial_path = self.__get_partial_path(event_type)
+                    with open(partial_path, "rb") as partial_file:
+                        shutil.copyfileobj(partial_file, f)
+                    os.remove(partial_path)
+        np.save(
+            os.path.join(self._path, STRINGS_FILE_NAME),
+            np.array(list(self._strings.keys()), dtype=np.str_),
+        )
+        self._closed = True
+
+    def __write_events(self, event_type: str) -> None:
+        events = self._events[event_type]
+        if not events:
+            return
+        os.makedirs(self._path, exist_ok=True)
+        # Truncate any partial file left behind by a previous run upon the first
+        # write of this writer.
+        mode = "ab" if self._num_written_events[event_type] > 0 else "wb"
+        with open(self.__get_partial_path(event_type), mode) as f:
+            f.write(np.array(events, dtype=EVENT_LOG_SCHEMAS[event_type]).tobytes())
+        self._num_written_events[event_type] += len(events)
+        events.clear()
+
+    def __get_partial_path(self, event_type: str) -> str:
+        return os.path.join(self._path, f"{event_type}.npy.part")
+
+
+class EventLogReader(object):
+    """Reads the columnar binary log of a Simulator run written by the
+    `EventLogWriter`.
+
+    The record arrays are memory-mapped, so that only the columns that are
+    accessed are read from the disk. The tasks, TaskGraphs, WorkerPools and
+    scheduler invocations of the run are constructed (as in the `CSVReader`) upon the
+    first access to them, by replaying the events in the order in which they were
+    logged.
+
+    Args:
+        path (`str`): The path of the directory where the log is stored.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._strings = np.load(os.path.join(path, STRINGS_FILE_NAME), mmap_mode="r")
+        self._events: dict[str, np.ndarray] = {}
+        self._simulator: Optional[Simulator] = None
+
+    def get_events(self, event_type: str) -> np.ndarray:
+        """Retrieves the events of the given type.
+
+        Args:
+            event_type (`str`): The type of the events (from `EVENT_LOG_SCHEMAS`).
+
+        Returns:
+            A (memory-mapped) record array with the columns in the schema of the
+            event type.
+        """
+        if event_type not in EVENT_LOG_SCHEMAS:
+            raise ValueError(f"The event type {event_type} is not logged.")
+        if event_type not in self._events:
+            self._events[event_type] = np.load(
+                os.path.join(self._path, f"{event_type}.npy"), mmap_mode="r"
+            )
+        return self._events[event_type]
+
+    def get_strings(
+        self, event_type: str, column: str, events: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Retrieves the strings referenced by a string column of the events.
+
+        Args:
+            event_type (`str`): The type of the events (from `EVENT_LOG_SCHEMAS`).
+            column (`str`): The name of the string column.
+            events (`Optional[np.ndarray]`): A subset of the events of the given type
+                to retrieve the strings for. If `None`, all the events are used.
+
+        Returns:
+            An array of strings, one for each of the events.
+        """
+        if column not in STRING_COLUMNS:
+            raise ValueError(f"The column {column} is not a string column.")
+        if events is None:
+            events = self.get_events(event_type)
+        return self._strings[events[column]]
+
+    def get_worker_pool_utilizations(self) -> Sequence[WorkerPoolStats]:
+        """Retrieves the statistics of the utilization of the WorkerPools at
+        different points in time.
+
+        Returns:
+            A `Sequence[WorkerPoolStats]` that depicts the usage of resources across
+            all the WorkerPools at each point in time (as in
+            `CSVReader.get_worker_pool_utilizations`).
+        """
+        events = self.get_events("WORKER_POOL_UTILIZATION")
+        resource_names = self.get_strings(
+            "WORKER_POOL_UTILIZATION", "resource_name"
+        ).tolist()
+        times, time_indices = np.unique(events["time"], return_inverse=True)
+        resource_utilizations = [
+            defaultdict(lambda: (0.0, 0.0)) for _ in range(len(times))
+        ]
+        for time_index, resource_name, allocated_quantity, available_quantity in zip(
+            time_indices,
+            resource_names,
+            events["allocated_quantity"],
+            events["available_quantity"],
+        ):
+            allocated, available = resource_utilizations[time_index][resource_name]
+            resource_utilizations[time_index][resource_name] = (
+                allocated + float(allocated_quantity),
+                available + float(available_quantity),
+            )
+        return [
+            WorkerPoolStats(
+                simulator_time=int(simulator_time),
+                resource_utilizations=dict(utilizations),
+            )
+            for simulator_time, utilizations in zip(times, resource_utilizations)
+        ]
+
+    def get_simulator(self) -> Simulator:
+        """Retrieves the Simulator run recorded in the log.
+
+        Returns:
+            The `Simulator` with the tasks, TaskGraphs, WorkerPools and scheduler
+            invocations of the run (as constructed by the `CSVReader`).
+        """
+        if self._simulator is None:
+            self._simulator = self.__replay_events()
+        return self._simulator
+
+    def get_scheduler_invocations(self) -> Sequence[Scheduler]:
+        """Retrieves a sequence of Scheduler invocations from the log.
+
+        Returns:
+            A `Sequence[Scheduler]` that depicts the number of placed, unplaced
+            and total tasks, along with the runtime of the invocation.
+        """
+        return self.get_simulator().scheduler_invocations
+
+    def get_worker_pools(self) -> Sequence[WorkerPool]:
+        """Retrieves the details of the WorkerPools used in the run.
+
+        Returns:
+            A `Sequence[WorkerPool]` that depicts the total resources of the WorkerPools
+            used in this execution.
+        """
+        return self.get_simulator().worker_pools
+
+    def get_goodput(self) -> float:
+        return self.get_simulator().goodput_taskgraphs
+
+    def get_tasks(self) -> Sequence[Task]:
+        """Retrieves the tasks ordered by their release time.
+
+        Returns:
+            A `Sequence[Task]` that depicts the tasks in the execution,
+            ordered by their release time.
+        """
+        return self.get_simulator().tasks
+
+    def get_task_graph(self) -> dict[str, TaskGraph]:
+        """Retrieves the TaskGraphs of the run.
+
+        Returns:
+            A mapping from the name of each TaskGraph to the `TaskGraph`.
+        """
+        return self.get_simulator().task_graphs
+
+    def get_simulator_end_time(self) -> int:
+        """Retrieves the time at which the Simulator ended.
+
+        Returns:
+            The end time of the simulation.
+        """
+        return self.get_simulator().end_time
+
+    def __replay_events(self) -> Simulator:
+        """Constructs the Simulator run by replaying the events of the log in the
+        order in which they were logged, mirroring `CSVReader.parse_events`."""
+        # Convert the columns of the logged event types into lists, and order the
+        # events of all the types by their sequence number.
+        event_types, columns = [], []
+        sequences, type_indices, event_indices = [], [], []
+        for event_type, schema in EVENT_LOG_SCHEMAS.items():
+            events = self.get_events(event_type)
+            if len(events) == 0:
+                continue
+            columns.append(
+                {
+                    name: (
+                        self.get_strings(event_type, name, events)
+                        if name in STRING_COLUMNS
+                        else events[name]
+                    ).tolist()
+                    for name in schema.names
+                }
+            )
+            sequences.append(events["sequence"])
+            type_indices.append(np.full(len(events), len(event_types)))
+            event_indices.append(np.arange(len(events)))
+            event_types.append(event_type)
+        if len(event_types) == 0:
+            raise ValueError(f"No events were logged in {self._path}.")
+        order = np.argsort(np.concatenate(sequences), kind="stable")
+
+        simulator = None
+        tasks: dict[str, Task] = {}
+        task_graphs: dict[str, TaskGraph] = {}
+        worker_pools: dict[str, WorkerPool] = {}
+        schedulers: list[Scheduler] = []
+        resources: dict[str, list[Resource]] = {}
+
+        def get_resources(description: str) -> list[Resource]:
+            if description not in resources:
+                values = description.split(",") if description else []
+                resources[description] = [
+                    Resource(*values[i : i + 3]) for i in range(0, len(values), 3)
+                ]
+            return resources[description]
+
+        for type_index, index in zip(
+            np.concatenate(type_indices)[order].tolist(),
+            np.concatenate(event_indices)[order].tolist(),
+        ):
+            event_type, event = event_types[type_index], columns[type_index]
+            time = event["time"][index]
+            if event_type == "SIMULATOR_START":
+                simulator = Simulator(csv_path=self._path, start_time=time)
+            elif event_type == "UPDATE_WORKLOAD":
+                simulator.total_tasks += event["num_task_graphs"][index]
+            elif event_type == "SIMULATOR_END":
+                simulator.end_time = time
+                simulator.finished_tasks = event["finished_tasks"][index]
+                simulator.dropped_tasks = event["cancelled_tasks"][index]
+                simulator.missed_deadlines = event["missed_deadlines"][index]
+                simulator.finished_task_graphs = event["finished_task_graphs"][index]
+                simulator.dropped_taskgraphs = event["cancelled_task_graphs"][index]
+                simulator.missed_taskgraphs = event["missed_task_graph_deadlines"][
+                    index
+                ]
+                simulator.goodput_taskgraphs = (
+                    simulator.finished_task_graphs - simulator.missed_taskgraphs
+                )
+            elif event_type == "TASK_RELEASE":
+                release_time = event["release_time"][index]
+                deadline = event["deadline"][index]
+                tasks[event["task_id"][index]] = Task(
+                    name=event["name"][index],
+                    task_graph=event["task_graph"][index],
+                    timestamp=event["timestamp"][index],
+                    task_id=event["task_id"][index],
+                    intended_release_time=event["intended_release_time"][index],
+                    release_time=release_time,
+                    deadline=deadline,
+                    window_to_execute=deadline - release_time,
+                    slowest_execution_time=event["slowest_execution_time"][index],
+                )
+            elif event_type == "TASK_FINISHED":
+                task = tasks[event["task_id"][index]]
+                task.completion_time = event["completion_time"][index]
+                task.slack = task.deadline - task.completion_time
+                task.placements[-1].completion_time = task.completion_time
+            elif event_type == "MISSED_DEADLINE":
+                task = tasks[event["task_id"][index]]
+                task.missed_deadline = True
+                task.deadline_miss_detected_at = time
+            elif event_type == "SCHEDULER_START":
+                schedulers.append(
+                    Scheduler(
+                        start_time=time,
+                        released_tasks=event["released_tasks"][index],
+                        previously_placed_tasks=event["previously_placed_tasks"][index],
+                        instance_id=len(schedulers) + 1,
+                    )
+                )
+            elif event_type == "SCHEDULER_FINISHED":
+                scheduler = schedulers[-1]
+                scheduler.end_time = time
+                scheduler.runtime = event["runtime"][index]
+                scheduler.num_placed_tasks = event["placed_tasks"][index]
+                scheduler.num_unplaced_tasks = event["unplaced_tasks"][index]
+                scheduler.true_runtime = event["true_runtime"][index]
+            elif event_type == "WORKER_POOL_UTILIZATION":
+                worker_pools[event["worker_pool_id"][index]].utilizations.append(
+                    WorkerPoolUtilization(
+                        simulator_time=time,
+                        resource_name=event["resource_name"][index],
+                        allocated_quantity=event["allocated_quantity"][index],
+                        available_quantity=event["available_quantity"][index],
+                    )
+                )
+            elif event_type == "WORKER_POOL":
+                worker_pools[event["worker_pool_id"][index]] = WorkerPool(
+                    name=event["name"][index],
+                    id=event["worker_pool_id"][index],
+                    resources=get_resources(event["resources"][index]),
+                )
+            elif event_type in ("TASK_PLACEMENT", "TASK_MIGRATED"):
+                task = tasks[event["task_id"][index]]
+                task.placements.append(
+                    Placement(
+                        task_name=task.name,
+                        timestamp=task.timestamp,
+                        task_id=task.task_id,
+                        task_graph=task.task_graph,
+                        placement_time=time,
+                        deadline=task.deadline,
+                        worker_pool=worker_pools[event["worker_pool_id"][index]],
+                        resources_used=get_resources(event["resources"][index]),
+                    )
+                )
+                if not task.start_time or task.start_time > time:
+                    task.start_time = time
+                if not task.placement_time or task.placement_time > time:
+                    task.placement_time = time
+                if event_type == "TASK_PLACEMENT":
+                    task.runtime = event["runtime"][index]
+            elif event_type == "TASK_CANCEL":
+                task_id = event["task_id"][index]
+                if task_id not in tasks:
+                    tasks[task_id] = Task(
+                        name=event["name"][index],
+                        task_graph=event["task_graph"][index],
+                        timestamp=event["timestamp"][index],
+                        task_id=task_id,
+                        intended_release_time=None,
+                        release_time=None,
+                        deadline=None,
+                        window_to_execute=None,
+                        slowest_execution_time=event["slowest_execution_time"][index],
+                    )
+                tasks[task_id].cancelled = True
+                tasks[task_id].cancelled_at = time
+                task_graphs[event["task_graph"][index]].cancelled = True
+                task_graphs[event["task_graph"][index]].cancelled_at = time
+            elif event_type == "TASK_SKIP":
+                if event["task_id"][index] in tasks:
+                    tasks[event["task_id"][index]].skipped_times.append(time)
+            elif event_type == "TASK_PREEMPT":
+                tasks[event["task_id"][index]].placements[-1].completion_time = time
+            elif event_type == "TASK_SCHEDULED":
+                schedulers[-1].task_placements.append(
+                    Placement(
+                        task_name=event["name"][index],
+                        timestamp=event["timestamp"][index],
+                        task_id=event["task_id"][index],
+                        task_graph=event["task_graph"][index],
+                        placement_time=event["placement_time"][index],
+                        deadline=event["deadline"][index],
+                        worker_pool=event["worker_pool_id"][index],
+                        completion_time=event["placement_time"][index]
+                        + event["runtime"][index],
+                    )
+                )
+            elif event_type == "TASK_GRAPH_RELEASE":
+                task_graphs[event["task_graph"][index]] = TaskGraph(
+                    name=event["task_graph"][index],
+                    release_time=event["release_time"][index],
+                    deadline=event["deadline"][index],
+                    num_tasks=event["num_tasks"][index],
+                    critical_path_time=event["critical_path_time"][index],
+                )
+            elif event_type == "TASK_GRAPH_FINISHED":
+                task_graph = task_graphs[event["task_graph"][index]]
+                task_graph.completion_at = time
+                task_graph.cancelled = False
+                task_graph.slack = task_graph.deadline - task_graph.completion_at
+            elif event_type == "MISSED_TASK_GRAPH_DEADLINE":
+                task_graphs[event["task_graph"][index]].deadline_miss_detected_at = time
+
+        if simulator is None:
+            raise ValueError(f"No SIMULATOR_START was logged in {self._path}.")
+        simulator.worker_pools = list(worker_pools.values())
+        simulator.tasks = list(
+            sorted(tasks.values(), key=lambda x: x.release_time_compare_key)
+        )
+        simulator.scheduler_invocations = schedulers
+        simulator.task_graphs = task_graphs
+        return simulator
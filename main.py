@@ -15,8 +15,10 @@ from data import (
     WorkloadLoader,
     WorkloadLoaderClockworkBursty,
 )
+from schedulers import SCHEDULERS
 from simulator import Simulator
 from utils import EventTime, setup_csv_logging, setup_logging
+from workers import FitPolicy
 from workload import BranchPredictionPolicy, JobGraph, Workload
 
 FLAGS = flags.FLAGS
@@ -54,12 +56,47 @@ flags.DEFINE_string(
     "Name of the CSV file to log the results to.",
     short_name="csv",
 )
+flags.DEFINE_integer(
+    "csv_buffer_size",
+    8192,
+    "The number of rows of the CSV that the simulator buffers in memory before "
+    "writing them to the file. The buffer is also flushed at the end of the "
+    "simulation, and if the simulation crashes. If 0, every row is written "
+    "synchronously through the logging module.",
+    lower_bound=0,
+)
+flags.DEFINE_string(
+    "event_log_name",
+    None,
+    "Name of the directory (in `log_dir`) to additionally write a columnar binary "
+    "log of the events to. The log can be read using `data.EventLogReader`, and "
+    "analyzed by passing the directory to analyze.py in place of a CSV.",
+)
+flags.DEFINE_string(
+    "event_profile_name",
+    None,
+    "Name of the JSON file (in `log_dir`) to write a profile of the simulator to. If "
+    "provided, the simulator records the number of invocations and the wall time of "
+    "the handlers of each event type and of the phases of the scheduler invocations, "
+    "and logs a summary table at the end of the simulation.",
+)
 flags.DEFINE_bool(
     "log_graphs",
     False,
     "If True, the simulator logs the TaskGraphs.",
 )
-flags.DEFINE_string("log_level", "debug", "Level of logging.")
+flags.DEFINE_string(
+    "log_level",
+    "debug",
+    "Level of logging (debug/info/warning/error/critical/none). If 'none', the "
+    "textual logs are disabled entirely.",
+)
+flags.DEFINE_bool(
+    "metrics_only",
+    False,
+    "If True, the simulator disables all the textual per-event logs (equivalent to "
+    "`--log_level=none`), and only writes the metrics to the CSV file.",
+)
 flags.DEFINE_string(
     "workload_profile_path",
     None,
@@ -109,6 +146,34 @@ flags.DEFINE_bool(
     "This option can be used with SAT/ILP based schedulers to stop wastefully"
     "reconsidering tasks that will never meet their deadlines.",
 )
+flags.DEFINE_bool(
+    "event_driven_execution",
+    False,
+    "If True, the simulator tracks the running tasks by their projected completion "
+    "time and only steps the tasks that finish, instead of stepping every Worker "
+    "on each step of the simulator loop.",
+)
+flags.DEFINE_bool(
+    "retire_task_graphs",
+    False,
+    "If True, the TaskGraphs whose tasks have all completed or been cancelled are "
+    "summarized into compact records and dropped from the Workload, so that the "
+    "memory usage of the simulator is bounded by the in-flight TaskGraphs.",
+)
+flags.DEFINE_bool(
+    "incremental_schedulable_tasks",
+    False,
+    "If True, the Workload caches the estimated completion times of the tasks of "
+    "each TaskGraph, and only recomputes them for the TaskGraphs updated by the "
+    "Simulator since the last retrieval of the schedulable tasks.",
+)
+flags.DEFINE_bool(
+    "check_schedulable_tasks",
+    False,
+    "If True, the incrementally maintained schedulable tasks are checked against "
+    "their full recomputation upon each retrieval. Used for debugging the "
+    "--incremental_schedulable_tasks flag.",
+)
 flags.DEFINE_integer(
     "workload_update_interval",
     -1,
@@ -215,6 +280,18 @@ flags.DEFINE_list(
     "set to the maximum critical path duration of the Workload. TaskGraphs higher "
     "than this critical path duration will not be released.",
 )
+flags.DEFINE_integer(
+    "alibaba_loader_min_release_critical_path_runtime",
+    100,
+    "The TaskGraphs released by the Alibaba trace have a critical path duration "
+    "strictly greater than this value.",
+)
+flags.DEFINE_integer(
+    "alibaba_loader_max_release_critical_path_runtime",
+    1000,
+    "The TaskGraphs released by the Alibaba trace have a critical path duration "
+    "strictly lower than this value.",
+)
 flags.DEFINE_bool(
     "alibaba_enable_heterogeneous_resource_type",
     False,
@@ -225,6 +302,21 @@ flags.DEFINE_bool(
     False,
     "If True, we dump the filtered DAGs into a separate file to speed up processing.",
 )
+flags.DEFINE_string(
+    "alibaba_loader_cache_dir",
+    None,
+    "If set, the JobGraphs converted from the Alibaba trace are cached in this "
+    "directory (keyed by the trace, the alibaba_* flags and the random seed), and "
+    "later runs with the same configuration load them from the cache instead of "
+    "converting the trace again.",
+)
+flags.DEFINE_integer(
+    "alibaba_loader_num_workers",
+    1,
+    "The number of processes used to convert the DAGs of the Alibaba trace into "
+    "JobGraphs. The converted JobGraphs do not depend on the number of processes.",
+    lower_bound=1,
+)
 
 # Task related flags.
 flags.DEFINE_integer(
@@ -302,20 +394,7 @@ flags.DEFINE_bool(
 flags.DEFINE_enum(
     "scheduler",
     "EDF",
-    [
-        "FIFO",
-        "EDF",
-        "LSF",
-        "Z3",
-        "BranchPrediction",
-        "ILP",
-        "TetriSched_CPLEX",
-        "TetriSched_Gurobi",
-        "Clockwork",
-        "TetriSched",
-        "GraphenePrime",
-        "Graphene",
-    ],
+    list(SCHEDULERS.keys()),
     "The scheduler to use for this execution.",
 )
 flags.DEFINE_bool(
@@ -425,6 +504,15 @@ flags.DEFINE_enum(
     ["best", "worst", "max", "random"],
     "The policy to be used for the BranchPredictionScheduler.",
 )
+flags.DEFINE_enum(
+    "worker_fit_policy",
+    "first",
+    ["first", "best", "worst"],
+    "The policy used by the EDF, FIFO, LSF and BranchPrediction schedulers to choose "
+    "the Worker of a WorkerPool that a task is placed on. 'first' chooses the first "
+    "Worker that can accomodate the task, while 'best' / 'worst' choose the Worker "
+    "with the least / most free quantity of the requested resource.",
+)
 flags.DEFINE_float(
     "branch_prediction_accuracy",
     0.5,
@@ -605,6 +693,10 @@ def main(args):
     """Main loop that loads the data from the given profile paths, and
     runs the Simulator on the data with the given scheduler.
     """
+    if FLAGS.metrics_only:
+        # Only the CSV is required, so drop the textual logs across all components.
+        FLAGS.log_level = "none"
+
     if FLAGS.log_file_mode == "write":
         # Delete the prior log file if it exists.
         if FLAGS.log_file_name is not None and os.path.exists(FLAGS.log_file_name):
@@ -718,6 +810,18 @@ def main(args):
             f"The policy {FLAGS.scheduler_policy} is not supported."
         )
 
+    # Retrieve the worker fit policy from the flags.
+    if FLAGS.worker_fit_policy == "first":
+        fit_policy = FitPolicy.FIRST_FIT
+    elif FLAGS.worker_fit_policy == "best":
+        fit_policy = FitPolicy.BEST_FIT
+    elif FLAGS.worker_fit_policy == "worst":
+        fit_policy = FitPolicy.WORST_FIT
+    else:
+        raise NotImplementedError(
+            f"The fit policy {FLAGS.worker_fit_policy} is not supported."
+        )
+
     # Instantiate the scheduler based on the given flag.
     scheduler = None
     if FLAGS.scheduler == "FIFO":
@@ -726,6 +830,7 @@ def main(args):
         scheduler = FIFOScheduler(
             preemptive=FLAGS.preemption,
             runtime=EventTime(FLAGS.scheduler_runtime, EventTime.Unit.US),
+            fit_policy=fit_policy,
             _flags=FLAGS,
         )
     elif FLAGS.scheduler == "EDF":
@@ -735,6 +840,7 @@ def main(args):
             preemptive=FLAGS.preemption,
             runtime=EventTime(FLAGS.scheduler_runtime, EventTime.Unit.US),
             enforce_deadlines=FLAGS.enforce_deadlines,
+            fit_policy=fit_policy,
             _flags=FLAGS,
         )
     elif FLAGS.scheduler == "LSF":
@@ -743,6 +849,7 @@ def main(args):
         scheduler = LSFScheduler(
             preemptive=FLAGS.preemption,
             runtime=EventTime(FLAGS.scheduler_runtime, EventTime.Unit.US),
+            fit_policy=fit_policy,
             _flags=FLAGS,
         )
     elif FLAGS.scheduler == "Z3":
@@ -769,6 +876,7 @@ def main(args):
             policy=branch_prediction_policy,
             branch_prediction_accuracy=FLAGS.branch_prediction_accuracy,
             release_taskgraphs=FLAGS.release_taskgraphs,
+            fit_policy=fit_policy,
             _flags=FLAGS,
         )
     elif FLAGS.scheduler == "ILP":
@@ -19,7 +19,7 @@ import grpc
 from absl import app, flags
 from tpch_utils import get_all_stage_info_for_query, verify_and_relable_tpch_app_graph
 
-from schedulers import EDFScheduler, FIFOScheduler
+from schedulers import load_scheduler
 from utils import EventTime, setup_logging
 from workers import Worker, WorkerPool, WorkerPools
 from workload import (
@@ -111,12 +111,7 @@ class SchedulerServiceServicer(erdos_scheduler_pb2_grpc.SchedulerServiceServicer
         self._scheduler_running_lock = asyncio.Lock()
         self._scheduler_running = False
         self._rerun_scheduler = False
-        if FLAGS.scheduler == "EDF":
-            self._scheduler = EDFScheduler()
-        elif FLAGS.scheduler == "FIFO":
-            self._scheduler = FIFOScheduler()
-        else:
-            raise ValueError(f"Unknown scheduler {FLAGS.scheduler}.")
+        self._scheduler = load_scheduler(FLAGS.scheduler)()
 
         # Placement information maintained by the servicer.
         # The placements map the application IDs to the Placement retrieved from the
@@ -1,20 +1,71 @@
 # Expose the BaseScheduler as part of the module.
+import importlib
+from typing import Type
+
 from .base_scheduler import BaseScheduler
 
 # Scheduler implementations
-from .branch_prediction_scheduler import BranchPredictionScheduler
-from .clockwork_scheduler import ClockworkScheduler
-from .edf_scheduler import EDFScheduler
-from .fifo_scheduler import FIFOScheduler
-from .ilp_scheduler import ILPScheduler
-from .lsf_scheduler import LSFScheduler
-from .tetrisched_cplex_scheduler import TetriSchedCPLEXScheduler
-from .tetrisched_gurobi_scheduler import TetriSchedGurobiScheduler
-
-try:
-    from .graphene_scheduler import GrapheneScheduler
-    from .tetrisched_scheduler import TetriSchedScheduler
-except ImportError:
-    pass
-
-from .z3_scheduler import Z3Scheduler
+# The implementations are imported lazily upon their first use, so that the solver
+# libraries that they depend on (e.g., gurobipy, docplex, z3, tetrisched_py) are only
+# loaded (and required to be installed) when the scheduler is actually requested.
+_SCHEDULER_MODULES = {
+    "BranchPredictionScheduler": ".branch_prediction_scheduler",
+    "ClockworkScheduler": ".clockwork_scheduler",
+    "EDFScheduler": ".edf_scheduler",
+    "FIFOScheduler": ".fifo_scheduler",
+    "GrapheneScheduler": ".graphene_scheduler",
+    "ILPScheduler": ".ilp_scheduler",
+    "LSFScheduler": ".lsf_scheduler",
+    "TetriSchedCPLEXScheduler": ".tetrisched_cplex_scheduler",
+    "TetriSchedGurobiScheduler": ".tetrisched_gurobi_scheduler",
+    "TetriSchedScheduler": ".tetrisched_scheduler",
+    "Z3Scheduler": ".z3_scheduler",
+}
+
+# A registry from the names of the schedulers (as specified by the `--scheduler` flag)
+# to the names of the classes that implement them.
+SCHEDULERS = {
+    "FIFO": "FIFOScheduler",
+    "EDF": "EDFScheduler",
+    "LSF": "LSFScheduler",
+    "Z3": "Z3Scheduler",
+    "BranchPrediction": "BranchPredictionScheduler",
+    "ILP": "ILPScheduler",
+    "TetriSched_CPLEX": "TetriSchedCPLEXScheduler",
+    "TetriSched_Gurobi": "TetriSchedGurobiScheduler",
+    "Clockwork": "ClockworkScheduler",
+    "TetriSched": "TetriSchedScheduler",
+    "GraphenePrime": "TetriSchedScheduler",
+    "Graphene": "GrapheneScheduler",
+}
+
+
+def load_scheduler(name: str) -> Type[BaseScheduler]:
+    """Imports and retrieves the class implementing the given scheduler.
+
+    Args:
+        name (`str`): The name of the scheduler (as specified by `--scheduler`).
+
+    Returns:
+        The subclass of `BaseScheduler` that implements the scheduler.
+
+    Raises:
+        `ValueError` if the scheduler is not registered, and `ImportError` if the
+        libraries required by the scheduler are not available.
+    """
+    if name not in SCHEDULERS:
+        raise ValueError(f"Unsupported scheduler implementation: {name}")
+    return __getattr__(SCHEDULERS[name])
+
+
+def __getattr__(name: str):
+    if name not in _SCHEDULER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_SCHEDULER_MODULES[name], __name__)
+    scheduler = getattr(module, name)
+    globals()[name] = scheduler
+    return scheduler
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + list(_SCHEDULER_MODULES.keys()))
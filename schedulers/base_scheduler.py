@@ -6,7 +6,7 @@ from typing import Optional, Sequence, Set
 import absl  # noqa: F401
 
 from utils import EventTime, setup_logging
-from workers import WorkerPool, WorkerPools
+from workers import FitPolicy, Worker, WorkerPool, WorkerPools
 from workload import (
     BranchPredictionPolicy,
     ExecutionStrategy,
@@ -40,6 +40,8 @@ class BaseScheduler(object):
             decisions before they are actually placed on the WorkerPools.
         release_taskgraphs (`bool`): If `True`, the scheduler is given access to the
             entire TaskGraph for any Task that falls within the lookahead defined above.
+        fit_policy (`FitPolicy`): The policy used by the heuristic schedulers to choose
+            the Worker of a WorkerPool that a task is placed on.
         _flags (`Optional[absl.flags]`): The runtime flags that are used to initialize
             a logger instance.
     """
@@ -54,6 +56,7 @@ class BaseScheduler(object):
         branch_prediction_accuracy: float = 0.50,
         retract_schedules: bool = False,
         release_taskgraphs: bool = False,
+        fit_policy: FitPolicy = FitPolicy.FIRST_FIT,
         _flags: Optional["absl.flags"] = None,
     ) -> None:
         self._preemptive = preemptive
@@ -64,6 +67,7 @@ class BaseScheduler(object):
         self._branch_prediction_accuracy = branch_prediction_accuracy
         self._retract_schedules = retract_schedules
         self._release_taskgraphs = release_taskgraphs
+        self._fit_policy = fit_policy
         self._flags = _flags
 
         if self._flags:
@@ -198,6 +202,21 @@ class BaseScheduler(object):
         """
         pass
 
+    def notify_task_graphs_retired(
+        self, sim_time: EventTime, task_graph_names: Sequence[str]
+    ) -> None:
+        """Notifies the Scheduler that the given TaskGraphs were retired from the
+        Workload, since all of their tasks have either completed or been cancelled.
+
+        The Simulator invokes this method so that the Scheduler can drop any state
+        that it cached for these TaskGraphs.
+
+        Args:
+            sim_time (`EventTime`): The time at which the Scheduler was notified.
+            task_graph_names (`Sequence[str]`): The names of the retired TaskGraphs.
+        """
+        pass
+
     def schedule(
         self,
         sim_time: EventTime,
@@ -223,6 +242,16 @@ class BaseScheduler(object):
     def log(self):
         raise NotImplementedError("The `log()` method has not been implemented.")
 
+    def _get_placement_worker_id(self, worker: Worker) -> Optional[str]:
+        """Retrieves the ID of the `Worker` (chosen according to the fit policy of the
+        scheduler) to be requested in the `Placement` of a task.
+
+        The first-fit placements do not request a `Worker`, and are left to the
+        `WorkerPool` to place on the first `Worker` that can accomodate the task at
+        the time of the placement.
+        """
+        return None if self._fit_policy == FitPolicy.FIRST_FIT else worker.id
+
     @property
     def preemptive(self) -> bool:
         return self._preemptive
@@ -255,6 +284,10 @@ class BaseScheduler(object):
     def branch_prediction_accuracy(self) -> float:
         return self._branch_prediction_accuracy
 
+    @property
+    def fit_policy(self) -> FitPolicy:
+        return self._fit_policy
+
     def verify_schedule(
         self,
         sim_time: EventTime,
@@ -1,13 +1,13 @@
+import logging
 import os
 import time
-from copy import copy, deepcopy
 from typing import Optional
 
 import absl  # noqa: F401
 
 from schedulers import BaseScheduler
 from utils import EventTime
-from workers import WorkerPools
+from workers import FitPolicy, WorkerPools
 from workload import BranchPredictionPolicy, Placement, Placements, TaskGraph, Workload
 
 
@@ -20,6 +20,8 @@ class BranchPredictionScheduler(BaseScheduler):
             that are currently running.
         runtime (`EventTime`): The runtime to return to the simulator (in us). If -1,
             the scheduler returns the actual runtime.
+        fit_policy (`FitPolicy`): The policy to choose the Worker of a WorkerPool
+            that a task is placed on.
     """
 
     def __init__(
@@ -29,6 +31,7 @@ class BranchPredictionScheduler(BaseScheduler):
         policy: BranchPredictionPolicy = BranchPredictionPolicy.RANDOM,
         branch_prediction_accuracy: float = 0.50,
         release_taskgraphs: bool = False,
+        fit_policy: FitPolicy = FitPolicy.FIRST_FIT,
         _flags: Optional["absl.flags"] = None,
     ) -> None:
         super(BranchPredictionScheduler, self).__init__(
@@ -37,6 +40,7 @@ class BranchPredictionScheduler(BaseScheduler):
             policy=policy,
             branch_prediction_accuracy=branch_prediction_accuracy,
             release_taskgraphs=release_taskgraphs,
+            fit_policy=fit_policy,
             _flags=_flags,
         )
 
@@ -64,73 +68,104 @@ class BranchPredictionScheduler(BaseScheduler):
             for task in tasks_to_be_scheduled
         ]
 
-        if self.preemptive:
-            # Restart the state of the WorkerPool.
-            schedulable_worker_pools = deepcopy(worker_pools)
-        else:
-            # Create a virtual WorkerPool set to try scheduling decisions on.
-            schedulable_worker_pools = copy(worker_pools)
+        # Try the scheduling decisions on the WorkerPools in a transaction, which is
+        # rolled back upon leaving the block, even if the scheduler fails. If
+        # preemptive, the state of the WorkerPools is restarted at the start of the
+        # transaction.
+        with worker_pools.begin_transaction(
+            reset=self.preemptive
+        ) as schedulable_worker_pools:
+            log_debug = self._logger.isEnabledFor(logging.DEBUG)
+            if log_debug:
+                for worker_pool in schedulable_worker_pools.worker_pools:
+                    self._logger.debug(
+                        "[%s] The state of %s is:%s%s",
+                        sim_time.time,
+                        worker_pool,
+                        os.linesep,
+                        os.linesep.join(worker_pool.get_utilization()),
+                    )
 
-        for worker_pool in schedulable_worker_pools.worker_pools:
-            self._logger.debug(
-                f"[{sim_time.time}] The state of {worker_pool} is:{os.linesep}"
-                f"{os.linesep.join(worker_pool.get_utilization())}"
+            # Sort the tasks according to their slack, and place them on the
+            # worker pools.
+            start_time = time.time()
+            ordered_tasks = list(
+                sorted(tasks_to_be_scheduled, key=lambda item: item[1])
             )
 
-        # Sort the tasks according to their slack, and place them on the
-        # worker pools.
-        start_time = time.time()
-        ordered_tasks = list(sorted(tasks_to_be_scheduled, key=lambda item: item[1]))
-
-        ordered_task_names = [
-            f"{task.unique_name}({slack})" for task, slack in ordered_tasks
-        ]
-        self._logger.info(
-            f"[{sim_time.time}] The order of the tasks is {ordered_task_names}."
-        )
+            if self._logger.isEnabledFor(logging.INFO):
+                ordered_task_names = [
+                    f"{task.unique_name}({slack})" for task, slack in ordered_tasks
+                ]
+                self._logger.info(
+                    "[%s] The order of the tasks is %s.",
+                    sim_time.time,
+                    ordered_task_names,
+                )
 
-        # Run the scheduling loop.
-        placements = []
-        for task, _ in ordered_tasks:
-            self._logger.debug(
-                f"[{sim_time.time}] {self.__class__.__name__} trying to schedule "
-                f"{task} with the resource requirements {task.resource_requirements}."
-            )
-            is_task_placed = False
-            for execution_strategy in task.available_execution_strategies:
-                for worker_pool in schedulable_worker_pools.worker_pools:
-                    if worker_pool.can_accomodate_strategy(execution_strategy):
-                        worker_pool.place_task(task, execution_strategy)
-                        is_task_placed = True
-                        placements.append(
-                            Placement.create_task_placement(
-                                task=task,
-                                placement_time=sim_time,
-                                worker_pool_id=worker_pool.id,
+            # Run the scheduling loop.
+            placements = []
+            for task, _ in ordered_tasks:
+                self._logger.debug(
+                    "[%s] %s trying to schedule %s with the resource requirements %s.",
+                    sim_time.time,
+                    self.__class__.__name__,
+                    task,
+                    task.resource_requirements,
+                )
+                is_task_placed = False
+                for execution_strategy in task.available_execution_strategies:
+                    for worker_pool in schedulable_worker_pools.worker_pools:
+                        worker = worker_pool.get_fitting_worker(
+                            execution_strategy, self.fit_policy
+                        )
+                        if worker is not None:
+                            worker_pool.place_task(
+                                task,
                                 execution_strategy=execution_strategy,
+                                worker_id=worker.id,
                             )
-                        )
-                        self._logger.debug(
-                            f"[{sim_time.time}] Placed {task} on WorkerPool "
-                            f"({worker_pool.id}) to be started at {sim_time}, and "
-                            f"executed using the strategy {execution_strategy}."
-                        )
-                        break
-
-            if is_task_placed:
-                for worker_pool in schedulable_worker_pools.worker_pools:
+                            is_task_placed = True
+                            placements.append(
+                                Placement.create_task_placement(
+                                    task=task,
+                                    placement_time=sim_time,
+                                    worker_pool_id=worker_pool.id,
+                                    worker_id=self._get_placement_worker_id(worker),
+                                    execution_strategy=execution_strategy,
+                                )
+                            )
+                            self._logger.debug(
+                                "[%s] Placed %s on WorkerPool (%s) to be started at "
+                                "%s, and executed using the strategy %s.",
+                                sim_time.time,
+                                task,
+                                worker_pool.id,
+                                sim_time,
+                                execution_strategy,
+                            )
+                            break
+
+                if is_task_placed:
+                    if log_debug:
+                        for worker_pool in schedulable_worker_pools.worker_pools:
+                            self._logger.debug(
+                                "[%s] The state of %s is:%s%s",
+                                sim_time.time,
+                                worker_pool,
+                                os.linesep,
+                                os.linesep.join(worker_pool.get_utilization()),
+                            )
+                else:
                     self._logger.debug(
-                        f"[{sim_time.time}] The state of {worker_pool} is:{os.linesep}"
-                        f"{os.linesep.join(worker_pool.get_utilization())}"
+                        "[%s] Failed to place %s because no worker pool "
+                        "could accomodate the resource requirements.",
+                        sim_time.time,
+                        task,
                     )
-            else:
-                self._logger.debug(
-                    f"[{sim_time.time}] Failed to place {task} because no worker pool "
-                    f"could accomodate the resource requirements."
-                )
-                placements.append(Placement.create_task_placement(task=task))
+                    placements.append(Placement.create_task_placement(task=task))
 
-        end_time = time.time()
+            end_time = time.time()
 
         # Compute and return the Placements object.
         scheduler_runtime = EventTime(
@@ -153,8 +188,12 @@ class BranchPredictionScheduler(BaseScheduler):
         remaining_time = task_graph.get_remaining_time(self.policy)
         expected_completion_time = sim_time + remaining_time
         self._logger.info(
-            f"[{sim_time.time}] The deadline of the TaskGraph {task_graph_name} is "
-            f"{task_graph.deadline}, and the remaining time is {remaining_time}. "
-            f"The graph is expected to complete by {expected_completion_time}."
+            "[%s] The deadline of the TaskGraph %s is %s, and the remaining time is "
+            "%s. The graph is expected to complete by %s.",
+            sim_time.time,
+            task_graph_name,
+            task_graph.deadline,
+            remaining_time,
+            expected_completion_time,
         )
         return task_graph.deadline - expected_completion_time
@@ -1,6 +1,6 @@
+import logging
 import os
 import time
-from copy import copy
 from operator import attrgetter
 from typing import Optional
 
@@ -8,7 +8,7 @@ import absl  # noqa: F401
 
 from schedulers import BaseScheduler
 from utils import EventTime
-from workers import WorkerPools
+from workers import FitPolicy, WorkerPools
 from workload import Placement, Placements, Workload
 
 
@@ -18,6 +18,8 @@ class FIFOScheduler(BaseScheduler):
     Args:
         runtime (`int`): The runtime to return to the simulator (in us). If -1,
             the scheduler returns the actual runtime.
+        fit_policy (`FitPolicy`): The policy to choose the Worker of a WorkerPool
+            that a task is placed on.
     """
 
     def __init__(
@@ -25,6 +27,7 @@ class FIFOScheduler(BaseScheduler):
         preemptive: bool = False,
         runtime: EventTime = EventTime(-1, EventTime.Unit.US),
         enforce_deadlines: bool = False,
+        fit_policy: FitPolicy = FitPolicy.FIRST_FIT,
         _flags: Optional["absl.flags"] = None,
     ):
         assert not preemptive, "FIFO scheduler is not preemptive"
@@ -32,6 +35,7 @@ class FIFOScheduler(BaseScheduler):
             preemptive=preemptive,
             runtime=runtime,
             enforce_deadlines=enforce_deadlines,
+            fit_policy=fit_policy,
             _flags=_flags,
         )
         if _flags is not None:
@@ -45,96 +49,125 @@ class FIFOScheduler(BaseScheduler):
             time=sim_time, preemption=self.preemptive, worker_pools=worker_pools
         )
 
-        # Create a virtual WorkerPool set to try scheduling decisions on.
-        schedulable_worker_pools = copy(worker_pools)
-        for worker_pool in schedulable_worker_pools.worker_pools:
-            self._logger.debug(
-                f"[{sim_time.time}] The state of {worker_pool} is: "
-                f"{os.linesep} {os.linesep.join(worker_pool.get_utilization())}"
-            )
-
-        start_time = time.time()
+        # Try the scheduling decisions on the WorkerPools in a transaction, which is
+        # rolled back upon leaving the block, even if the scheduler fails.
+        with worker_pools.begin_transaction() as schedulable_worker_pools:
+            log_debug = self._logger.isEnabledFor(logging.DEBUG)
+            if log_debug:
+                for worker_pool in schedulable_worker_pools.worker_pools:
+                    self._logger.debug(
+                        "[%s] The state of %s is: %s %s",
+                        sim_time.time,
+                        worker_pool,
+                        os.linesep,
+                        os.linesep.join(worker_pool.get_utilization()),
+                    )
 
-        # Sort the tasks according to their release times, and place them on
-        # the worker pools.
-        ordered_tasks = list(sorted(tasks, key=attrgetter("release_time")))
-        task_descriptions = [
-            f"{task.unique_name} ({task.release_time})" for task in ordered_tasks
-        ]
-        self._logger.debug(
-            f"[{sim_time.time}] The scheduler received {len(ordered_tasks)} tasks to "
-            f"be scheduled. The order of the tasks is {task_descriptions}."
-        )
+            start_time = time.time()
 
-        # Run the scheduling loop.
-        placements = []
-        for task in ordered_tasks:
-            self._logger.debug(
-                f"[{sim_time.time}] Trying to schedule task {task.unique_name} with "
-                f"release time {task.release_time} and available execution strategies: "
-                f"{task.available_execution_strategies}."
-            )
+            # Sort the tasks according to their release times, and place them on
+            # the worker pools.
+            ordered_tasks = list(sorted(tasks, key=attrgetter("release_time")))
+            if log_debug:
+                task_descriptions = [
+                    f"{task.unique_name} ({task.release_time})"
+                    for task in ordered_tasks
+                ]
+                self._logger.debug(
+                    "[%s] The scheduler received %s tasks to be scheduled. The order "
+                    "of the tasks is %s.",
+                    sim_time.time,
+                    len(ordered_tasks),
+                    task_descriptions,
+                )
 
-            # If we are enforcing deadlines, and the Task is past its deadline,
-            # then we should create a cancellation for it. This is only applicable if
-            # the user wants the tasks that cannot meet their deadline to be dropped.
-            if (
-                self.enforce_deadlines
-                and task.deadline
-                < sim_time
-                + task.available_execution_strategies.get_fastest_strategy().runtime
-            ):
-                placements.append(Placement.create_task_cancellation(task=task))
+            # Run the scheduling loop.
+            placements = []
+            for task in ordered_tasks:
                 self._logger.debug(
-                    "[%s] Task %s has a deadline of %s, which has been missed. "
-                    "Cancelling the task.",
+                    "[%s] Trying to schedule task %s with release time %s and "
+                    "available execution strategies: %s.",
                     sim_time.time,
-                    task,
-                    task.deadline,
+                    task.unique_name,
+                    task.release_time,
+                    task.available_execution_strategies,
                 )
-                continue
 
-            # Try to place the task on the worker pools.
-            is_task_placed = False
-            for execution_strategy in task.available_execution_strategies:
-                for worker_pool in schedulable_worker_pools.worker_pools:
-                    if worker_pool.can_accomodate_strategy(execution_strategy):
-                        worker_pool.place_task(
-                            task, execution_strategy=execution_strategy
+                # If we are enforcing deadlines, and the Task is past its deadline,
+                # then we should create a cancellation for it. This is only applicable
+                # if the user wants the tasks that cannot meet their deadline to be
+                # dropped.
+                if (
+                    self.enforce_deadlines
+                    and task.deadline
+                    < sim_time
+                    + task.available_execution_strategies.get_fastest_strategy().runtime
+                ):
+                    placements.append(Placement.create_task_cancellation(task=task))
+                    self._logger.debug(
+                        "[%s] Task %s has a deadline of %s, which has been missed. "
+                        "Cancelling the task.",
+                        sim_time.time,
+                        task,
+                        task.deadline,
+                    )
+                    continue
+
+                # Try to place the task on the worker pools.
+                is_task_placed = False
+                for execution_strategy in task.available_execution_strategies:
+                    for worker_pool in schedulable_worker_pools.worker_pools:
+                        worker = worker_pool.get_fitting_worker(
+                            execution_strategy, self.fit_policy
                         )
-                        is_task_placed = True
-                        placements.append(
-                            Placement.create_task_placement(
-                                task=task,
-                                placement_time=sim_time,
-                                worker_pool_id=worker_pool.id,
+                        if worker is not None:
+                            worker_pool.place_task(
+                                task,
                                 execution_strategy=execution_strategy,
+                                worker_id=worker.id,
                             )
-                        )
-                        self._logger.debug(
-                            f"[{sim_time.time}] Placed {task} on Worker Pool "
-                            f"({worker_pool.id}) to be started at {sim_time} with the "
-                            f"execution strategy: {execution_strategy}."
-                        )
+                            is_task_placed = True
+                            placements.append(
+                                Placement.create_task_placement(
+                                    task=task,
+                                    placement_time=sim_time,
+                                    worker_pool_id=worker_pool.id,
+                                    worker_id=self._get_placement_worker_id(worker),
+                                    execution_strategy=execution_strategy,
+                                )
+                            )
+                            self._logger.debug(
+                                "[%s] Placed %s on Worker Pool (%s) to be started at "
+                                "%s with the execution strategy: %s.",
+                                sim_time.time,
+                                task,
+                                worker_pool.id,
+                                sim_time,
+                                execution_strategy,
+                            )
+                            break
+                    if is_task_placed:
                         break
-                if is_task_placed:
-                    break
 
-            if is_task_placed:
-                for worker_pool in schedulable_worker_pools.worker_pools:
+                if is_task_placed:
+                    if log_debug:
+                        for worker_pool in schedulable_worker_pools.worker_pools:
+                            self._logger.debug(
+                                "[%s] The state of %s is:%s%s",
+                                sim_time.time,
+                                worker_pool,
+                                os.linesep,
+                                os.linesep.join(worker_pool.get_utilization()),
+                            )
+                else:
                     self._logger.debug(
-                        f"[{sim_time.time}] The state of {worker_pool} is:{os.linesep}"
-                        f"{os.linesep.join(worker_pool.get_utilization())}"
+                        "[%s] Failed to place %s because no worker pool "
+                        "could accomodate the resource requirements.",
+                        sim_time.time,
+                        task,
                     )
-            else:
-                self._logger.debug(
-                    "[%s] Failed to place %s because no worker pool "
-                    "could accomodate the resource requirements.",
-                    sim_time.time,
-                    task,
-                )
-                placements.append(Placement.create_task_placement(task=task))
-        end_time = time.time()
+                    placements.append(Placement.create_task_placement(task=task))
+            end_time = time.time()
 
         # Compute and return the Placements object.
         scheduler_runtime = EventTime(
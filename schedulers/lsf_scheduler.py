@@ -1,5 +1,4 @@
 import time
-from copy import copy, deepcopy
 from functools import partial
 from typing import Optional
 
@@ -7,7 +6,7 @@ import absl  # noqa: F401
 
 from schedulers import BaseScheduler
 from utils import EventTime
-from workers import WorkerPools
+from workers import FitPolicy, WorkerPools
 from workload import Placement, Placements, Task, Workload
 
 
@@ -20,16 +19,19 @@ class LSFScheduler(BaseScheduler):
             that are currently running.
         runtime (`int`): The runtime to return to the simulator (in us). If -1,
             the scheduler returns the actual runtime.
+        fit_policy (`FitPolicy`): The policy to choose the Worker of a WorkerPool
+            that a task is placed on.
     """
 
     def __init__(
         self,
         preemptive: bool = False,
         runtime: EventTime = EventTime(-1, EventTime.Unit.US),
+        fit_policy: FitPolicy = FitPolicy.FIRST_FIT,
         _flags: Optional["absl.flags"] = None,
     ):
         super(LSFScheduler, self).__init__(
-            preemptive=preemptive, runtime=runtime, _flags=_flags
+            preemptive=preemptive, runtime=runtime, fit_policy=fit_policy, _flags=_flags
         )
 
     def schedule(
@@ -44,45 +46,53 @@ class LSFScheduler(BaseScheduler):
             time=sim_time, preemption=self.preemptive, worker_pools=worker_pools
         )
 
-        if self.preemptive:
-            # Restart the state of the WorkerPool.
-            schedulable_worker_pools = deepcopy(worker_pools)
-        else:
-            # Create a virtual WorkerPool set to try scheduling decisions on.
-            schedulable_worker_pools = copy(worker_pools)
-
-        # Sort the tasks according to their slacks, and place them on the
-        # worker pools.
-        start_time = time.time()
-        ordered_tasks = list(
-            sorted(tasks_to_be_scheduled, key=partial(self.slack, sim_time))
-        )
-
-        # Run the scheduling loop.
-        placements = []
-        for task in ordered_tasks:
-            is_task_placed = False
-            for execution_strategy in task.available_execution_strategies:
-                for worker_pool in schedulable_worker_pools.worker_pools:
-                    if worker_pool.can_accomodate_strategy(execution_strategy):
-                        worker_pool.place_task(task)
-                        is_task_placed = True
-                        placements.append(
-                            Placement.create_task_placement(
-                                task=task,
-                                worker_pool_id=worker_pool.id,
-                                placement_time=sim_time,
+        # Try the scheduling decisions on the WorkerPools in a transaction, which is
+        # rolled back upon leaving the block, even if the scheduler fails. If
+        # preemptive, the state of the WorkerPools is restarted at the start of the
+        # transaction.
+        with worker_pools.begin_transaction(
+            reset=self.preemptive
+        ) as schedulable_worker_pools:
+            # Sort the tasks according to their slacks, and place them on the
+            # worker pools.
+            start_time = time.time()
+            ordered_tasks = list(
+                sorted(tasks_to_be_scheduled, key=partial(self.slack, sim_time))
+            )
+
+            # Run the scheduling loop.
+            placements = []
+            for task in ordered_tasks:
+                is_task_placed = False
+                for execution_strategy in task.available_execution_strategies:
+                    for worker_pool in schedulable_worker_pools.worker_pools:
+                        worker = worker_pool.get_fitting_worker(
+                            execution_strategy, self.fit_policy
+                        )
+                        if worker is not None:
+                            worker_pool.place_task(
+                                task,
                                 execution_strategy=execution_strategy,
+                                worker_id=worker.id,
                             )
-                        )
+                            is_task_placed = True
+                            placements.append(
+                                Placement.create_task_placement(
+                                    task=task,
+                                    worker_pool_id=worker_pool.id,
+                                    worker_id=self._get_placement_worker_id(worker),
+                                    placement_time=sim_time,
+                                    execution_strategy=execution_strategy,
+                                )
+                            )
+                            break
+                    if is_task_placed:
                         break
-                if is_task_placed:
-                    break
 
-            if not is_task_placed:
-                placements.append(Placement.create_task_placement(task))
+                if not is_task_placed:
+                    placements.append(Placement.create_task_placement(task))
 
-        end_time = time.time()
+            end_time = time.time()
 
         # Compute and return the Placements object.
         scheduler_runtime = EventTime(
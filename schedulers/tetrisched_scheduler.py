@@ -2,7 +2,7 @@ import os
 import time
 from collections import defaultdict
 from math import ceil
-from typing import List, Mapping, Optional, Set, Tuple
+from typing import List, Mapping, Optional, Sequence, Set, Tuple
 
 import absl  # noqa: F401
 import numpy as np
@@ -320,6 +320,12 @@ class TetriSchedScheduler(BaseScheduler):
                 f"Windowed choose not implemented for the goal: {self._goal}."
             )
 
+    def notify_task_graphs_retired(
+        self, sim_time: EventTime, task_graph_names: Sequence[str]
+    ) -> None:
+        # The retired TaskGraphs will not be considered for scheduling again.
+        self._previously_considered_task_graphs.difference_update(task_graph_names)
+
     def _cancel_task_graph_predicate(self, task_graph: TaskGraph) -> bool:
         """Returns True if the TaskGraph should be skipped from scheduling."""
         return False
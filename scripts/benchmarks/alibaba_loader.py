@@ -0,0 +1,99 @@
+"""Benchmarks the conversion of the DAGs of the Alibaba trace into `JobGraph`s.
+
+Every DAG of each of the `--traces` is converted into a `JobGraphDefinition` by
+the `AlibabaLoader` (the same way as on the first release from a Workload profile,
+using `--alibaba_loader_num_workers` processes) and then constructed into a
+`JobGraph` (as happens when it is sampled for release), `--repetitions` times. The
+number of DAGs converted and constructed per second is reported for each trace.
+Run from the root of the repository:
+
+    python scripts/benchmarks/alibaba_loader.py \\
+        --traces=traces/alibaba-cluster-trace-v2018/medium_filtered.pkl \\
+        --alibaba_loader_num_workers=4
+"""
+
+import glob
+import os
+import sys
+import tempfile
+import time
+
+from absl import app, flags
+
+REPOSITORY_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, REPOSITORY_ROOT)
+
+import main as simulator  # noqa: E402, F401 (Defines the flags of the loader.)
+from data.alibaba_loader import (  # noqa: E402
+    FILTERED_DAGS,
+    AlibabaLoader,
+    AlibabaTaskUnpickler,
+)
+from utils import EventTime  # noqa: E402
+
+FLAGS = flags.FLAGS
+flags.DEFINE_list(
+    "traces",
+    sorted(
+        glob.glob(
+            os.path.join(
+                REPOSITORY_ROOT, "traces", "alibaba-cluster-trace-v2018", "*.pkl"
+            )
+        )
+    ),
+    "The Pickle files of the Alibaba trace whose DAGs are converted.",
+)
+flags.DEFINE_integer(
+    "repetitions", 3, "The number of times each trace is converted.", lower_bound=1
+)
+
+
+def main(args):
+    with tempfile.TemporaryDirectory() as log_dir:
+        for trace in FLAGS.traces:
+            with open(trace, "rb") as pickled_file:
+                data = AlibabaTaskUnpickler(pickled_file).load()
+            dags = [
+                (job_graph_name, job_tasks)
+                for job_graph_name, job_tasks in data.items()
+                if job_graph_name not in FILTERED_DAGS
+            ]
+
+            FLAGS.workload_profile_path = trace
+            FLAGS.log_dir = log_dir
+            FLAGS.log_file_name = "benchmark.log"
+            FLAGS.log_level = "warning"
+            loader = AlibabaLoader(workload_interval=EventTime.invalid(), flags=FLAGS)
+
+            converter = loader._get_job_graph_converter()
+            conversion_time, construction_time = 0.0, 0.0
+            for _ in range(FLAGS.repetitions):
+                start_time = time.perf_counter()
+                definitions = [
+                    definition
+                    for _, definition, _ in loader._convert_job_graphs(converter, dags)
+                    if definition is not None
+                ]
+                conversion_time += time.perf_counter() - start_time
+
+                start_time = time.perf_counter()
+                for definition in definitions:
+                    loader._construct_job_graph(definition)
+                construction_time += time.perf_counter() - start_time
+
+            num_tasks = sum(len(job_tasks) for _, job_tasks in dags)
+            print(f"Trace:               {os.path.relpath(trace, REPOSITORY_ROOT)}")
+            print(f"DAGs:                {len(dags)} ({num_tasks} tasks)")
+            print(f"Converted:           {len(definitions)}")
+            print(
+                "Converted/second:    "
+                f"{len(dags) * FLAGS.repetitions / conversion_time:.1f}"
+            )
+            print(
+                "Constructed/second:  "
+                f"{len(definitions) * FLAGS.repetitions / construction_time:.1f}"
+            )
+
+
+if __name__ == "__main__":
+    app.run(main)
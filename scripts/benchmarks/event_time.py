@@ -0,0 +1,64 @@
+"""Microbenchmarks the arithmetic, comparisons and conversions of `EventTime`.
+
+Run from the root of the repository:
+
+    python scripts/benchmarks/event_time.py --number=1000000
+"""
+
+import os
+import sys
+import timeit
+
+from absl import app, flags
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils import EventTime  # noqa: E402
+
+FLAGS = flags.FLAGS
+flags.DEFINE_integer(
+    "number", 1000000, "The number of times each operation is executed.", lower_bound=1
+)
+flags.DEFINE_integer(
+    "repetitions", 5, "The number of times each measurement is repeated.", lower_bound=1
+)
+
+OPERATIONS = [
+    ("EventTime(t, US)", "EventTime(1000, EventTime.Unit.US)"),
+    ("a + b", "a + b"),
+    ("a - b", "a - b"),
+    ("a == b", "a == b"),
+    ("a < b", "a < b"),
+    ("a <= b", "a <= b"),
+    ("hash(a)", "hash(a)"),
+    ("a.to(US)", "a.to(EventTime.Unit.US)"),
+    ("a.to(US).time", "a.to(EventTime.Unit.US).time"),
+    ("EventTime.zero()", "EventTime.zero()"),
+    ("a == EventTime.zero()", "a == EventTime.zero()"),
+    ("ms + a", "ms + a"),
+    ("ms < a", "ms < a"),
+]
+
+
+def main(args):
+    namespace = {
+        "EventTime": EventTime,
+        "a": EventTime(1000, EventTime.Unit.US),
+        "b": EventTime(250, EventTime.Unit.US),
+        "ms": EventTime(1, EventTime.Unit.MS),
+    }
+    print(f"{'Operation':<30}{'Best (ns/op)':>15}")
+    for name, statement in OPERATIONS:
+        best_time = min(
+            timeit.repeat(
+                statement,
+                globals=namespace,
+                number=FLAGS.number,
+                repeat=FLAGS.repetitions,
+            )
+        )
+        print(f"{name:<30}{best_time / FLAGS.number * 1e9:>15.1f}")
+
+
+if __name__ == "__main__":
+    app.run(main)
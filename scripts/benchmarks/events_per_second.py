@@ -0,0 +1,119 @@
+"""Benchmarks the number of events handled per second by the simulator under
+different logging configurations.
+
+Each configuration is run in a fresh interpreter. The number of events is counted
+once from an `info` level log, and the time taken by a `--dry_run` of the same
+configuration (which loads the workers and the workload but does not simulate
+them) is subtracted from the measurements. Run from the root of the repository:
+
+    python scripts/benchmarks/events_per_second.py \\
+        --configs=configs/edf_adversarial.conf --repetitions=3
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from absl import app, flags
+
+FLAGS = flags.FLAGS
+flags.DEFINE_list(
+    "configs",
+    ["configs/edf_adversarial.conf", "configs/sanity_check_homo.conf"],
+    "The flagfiles (relative to the root of the repository) to run the simulator with.",
+)
+flags.DEFINE_list(
+    "overrides",
+    [],
+    "Additional flags (e.g., `--scheduler=EDF`) that are passed to main.py after the "
+    "flagfile, and thus override its values.",
+)
+flags.DEFINE_list(
+    "modes",
+    ["debug", "info", "warning", "metrics_only"],
+    "The logging configurations to measure. Each mode is either a value for "
+    "`--log_level`, or `metrics_only` to run with `--metrics_only`.",
+)
+flags.DEFINE_integer(
+    "repetitions", 3, "The number of times each mode is measured.", lower_bound=1
+)
+
+REPOSITORY_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+RECEIVED_EVENT_MARKER = "from the event queue."
+
+
+def run_simulator(config: str, log_dir: str, extra_flags) -> float:
+    """Runs main.py with the given flagfile, and returns the wall-clock time (in
+    seconds) taken by the run."""
+    command = [
+        sys.executable,
+        "main.py",
+        f"--flagfile={config}",
+        *FLAGS.overrides,
+        f"--log_dir={log_dir}",
+        "--log_file_name=benchmark.log",
+        "--csv_file_name=benchmark.csv",
+        *extra_flags,
+    ]
+    start_time = time.perf_counter()
+    result = subprocess.run(
+        command, cwd=REPOSITORY_ROOT, capture_output=True, text=True
+    )
+    end_time = time.perf_counter()
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"The simulator failed for {config} with the flags {extra_flags}:"
+            f"{os.linesep}{result.stderr}"
+        )
+    return end_time - start_time
+
+
+def count_events(config: str, log_dir: str) -> int:
+    """Counts the number of events handled by the simulator for the flagfile."""
+    run_simulator(config, log_dir, ["--log_level=info"])
+    with open(os.path.join(log_dir, "benchmark.log"), "r") as log_file:
+        return sum(RECEIVED_EVENT_MARKER in line for line in log_file)
+
+
+def mode_flags(mode: str):
+    if mode == "metrics_only":
+        return ["--metrics_only"]
+    return [f"--log_level={mode}"]
+
+
+def main(args):
+    print(
+        f"{'Config':<40}{'Mode':>14}{'Events':>10}{'Median (s)':>12}"
+        f"{'Events/s':>12}"
+    )
+    for config in FLAGS.configs:
+        with tempfile.TemporaryDirectory() as log_dir:
+            num_events = count_events(config, log_dir)
+            setup_time = np.median(
+                [
+                    run_simulator(config, log_dir, ["--log_level=warning", "--dry_run"])
+                    for _ in range(FLAGS.repetitions)
+                ]
+            )
+            for mode in FLAGS.modes:
+                simulation_time = (
+                    np.median(
+                        [
+                            run_simulator(config, log_dir, mode_flags(mode))
+                            for _ in range(FLAGS.repetitions)
+                        ]
+                    )
+                    - setup_time
+                )
+                events_per_second = num_events / max(simulation_time, 1e-6)
+                print(
+                    f"{config:<40}{mode:>14}{num_events:>10}"
+                    f"{simulation_time:>12.3f}{events_per_second:>12.1f}"
+                )
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,72 @@
+"""Benchmarks the time taken to import the schedulers.
+
+Each measurement is taken in a fresh interpreter so that the modules cached by
+earlier imports do not affect the results. Run from the root of the repository:
+
+    python scripts/benchmarks/import_time.py --repetitions=5
+"""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+from absl import app, flags
+
+FLAGS = flags.FLAGS
+flags.DEFINE_integer(
+    "repetitions", 5, "The number of times each import is measured.", lower_bound=1
+)
+flags.DEFINE_list(
+    "schedulers",
+    ["EDF", "FIFO", "LSF", "Z3", "ILP", "TetriSched_CPLEX", "TetriSched_Gurobi"],
+    "The schedulers (as specified by `--scheduler` to main.py) to measure.",
+)
+
+REPOSITORY_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+MEASUREMENT_TEMPLATE = """
+import time
+start_time = time.perf_counter()
+{statement}
+print(time.perf_counter() - start_time)
+"""
+
+
+def measure(statement: str) -> float:
+    """Returns the time (in seconds) taken to execute the statement in a fresh
+    interpreter, or NaN if the statement failed (e.g., a solver is not installed)."""
+    result = subprocess.run(
+        [sys.executable, "-c", MEASUREMENT_TEMPLATE.format(statement=statement)],
+        cwd=REPOSITORY_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return float("nan")
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main(args):
+    statements = [("import schedulers", "import schedulers")]
+    for scheduler in FLAGS.schedulers:
+        statements.append(
+            (
+                f"load_scheduler({scheduler!r})",
+                "from schedulers import load_scheduler\n"
+                f"load_scheduler({scheduler!r})",
+            )
+        )
+    statements.append(("import main", "import main"))
+
+    print(f"{'Statement':<40}{'Median (ms)':>15}{'Min (ms)':>15}")
+    for name, statement in statements:
+        times = [measure(statement) * 1e3 for _ in range(FLAGS.repetitions)]
+        if any(np.isnan(times)):
+            print(f"{name:<40}{'unavailable':>15}{'':>15}")
+        else:
+            print(f"{name:<40}{np.median(times):>15.1f}{np.min(times):>15.1f}")
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,127 @@
+"""Benchmarks the creation of the `Task`s of a synthetic workload that are not
+given a logger upon their construction.
+
+The workload consists of `--num_tasks` Tasks, spread over `--num_jobs` Jobs, with
+each Task of a Job being released at a distinct timestamp. The workload is created
+twice: once to measure the time taken per Task, and once (with `tracemalloc`) to
+measure the memory retained per Task. The number of loggers and handlers registered
+with `logging` by the creation of both the workloads is reported as well. Run from
+the root of the repository:
+
+    python scripts/benchmarks/task_creation.py --num_tasks=100000
+"""
+
+import gc
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from typing import Sequence
+
+from absl import app, flags
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils import EventTime  # noqa: E402
+from workload import (  # noqa: E402
+    ExecutionStrategies,
+    ExecutionStrategy,
+    Job,
+    Resource,
+    Resources,
+    Task,
+    WorkProfile,
+)
+
+FLAGS = flags.FLAGS
+flags.DEFINE_integer(
+    "num_tasks", 100000, "The number of Tasks in the workload.", lower_bound=1
+)
+flags.DEFINE_integer(
+    "num_jobs", 10, "The number of Jobs that the Tasks are spread over.", lower_bound=1
+)
+
+
+def count_handlers() -> int:
+    return sum(
+        len(logger.handlers)
+        for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    )
+
+
+def create_jobs(prefix: str) -> Sequence[Job]:
+    return [
+        Job(
+            name=f"{prefix}_Job_{index}",
+            profile=WorkProfile(
+                name=f"{prefix}_Job_{index}_Work_Profile",
+                execution_strategies=ExecutionStrategies(
+                    strategies=[
+                        ExecutionStrategy(
+                            resources=Resources(
+                                resource_vector={Resource(name="CPU", _id="any"): 1}
+                            ),
+                            batch_size=1,
+                            runtime=EventTime(1000, EventTime.Unit.US),
+                        )
+                    ]
+                ),
+            ),
+        )
+        for index in range(FLAGS.num_jobs)
+    ]
+
+
+def create_tasks(jobs: Sequence[Job]) -> Sequence[Task]:
+    deadline = EventTime(5000, EventTime.Unit.US)
+    release_time = EventTime(0, EventTime.Unit.US)
+    num_tasks, num_jobs = FLAGS.num_tasks, FLAGS.num_jobs
+    tasks = [None] * num_tasks
+    for index in range(num_tasks):
+        job = jobs[index % num_jobs]
+        tasks[index] = Task(
+            name=job.name,
+            task_graph=f"TaskGraph_{index // num_jobs}",
+            job=job,
+            deadline=deadline,
+            timestamp=index // num_jobs,
+            release_time=release_time,
+        )
+    return tasks
+
+
+def main(args):
+    # The time and the memory are measured over different sets of Jobs (and thus,
+    # Task names), so that the tracing of the allocations does not skew the time.
+    timed_jobs, traced_jobs = create_jobs("Timed"), create_jobs("Traced")
+    num_loggers = len(logging.Logger.manager.loggerDict)
+    num_handlers = count_handlers()
+
+    gc.collect()
+    start_time = time.perf_counter()
+    tasks = create_tasks(timed_jobs)
+    end_time = time.perf_counter()
+    del tasks
+
+    gc.collect()
+    tracemalloc.start()
+    start_memory, _ = tracemalloc.get_traced_memory()
+    tasks = create_tasks(traced_jobs)
+    gc.collect()
+    end_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Tasks created:       {len(tasks)} (x2)")
+    print(f"Total time (s):      {end_time - start_time:.3f}")
+    print(f"Time/task (us):      {(end_time - start_time) / FLAGS.num_tasks * 1e6:.2f}")
+    print(f"Bytes/task:          {(end_memory - start_memory) / FLAGS.num_tasks:.1f}")
+    print(
+        f"Loggers registered:  {len(logging.Logger.manager.loggerDict) - num_loggers}"
+    )
+    print(f"Handlers registered: {count_handlers() - num_handlers}")
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,121 @@
+"""Benchmarks the generation of the `TaskGraph`s released by a `JobGraph`.
+
+The JobGraph is a random DAG of `--num_jobs` Jobs in which every Job depends on up
+to `--max_parents` of the Jobs before it, similar to the DAGs of the Alibaba trace.
+`--num_task_graphs` TaskGraphs are generated from it using `get_next_task_graph`,
+the way the workload loaders release the instances of a JobGraph, and the time
+taken and the memory retained per TaskGraph are reported. Run from the root of
+the repository:
+
+    python scripts/benchmarks/task_graph_generation.py --num_jobs=100
+"""
+
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from absl import app, flags
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils import EventTime  # noqa: E402
+from workload import (  # noqa: E402
+    ExecutionStrategies,
+    ExecutionStrategy,
+    Job,
+    JobGraph,
+    Resource,
+    Resources,
+    WorkProfile,
+)
+
+FLAGS = flags.FLAGS
+flags.DEFINE_integer(
+    "num_jobs", 100, "The number of Jobs in the JobGraph.", lower_bound=1
+)
+flags.DEFINE_integer(
+    "max_parents", 3, "The maximum number of parents of each Job.", lower_bound=1
+)
+flags.DEFINE_integer(
+    "num_task_graphs",
+    1000,
+    "The number of TaskGraphs to generate from the JobGraph.",
+    lower_bound=1,
+)
+flags.DEFINE_integer("seed", 42, "The seed used to generate the JobGraph.")
+
+
+def create_job_graph() -> JobGraph:
+    rng = random.Random(FLAGS.seed)
+    jobs = [
+        Job(
+            name=f"Job_{index}",
+            profile=WorkProfile(
+                name=f"Job_{index}_Work_Profile",
+                execution_strategies=ExecutionStrategies(
+                    strategies=[
+                        ExecutionStrategy(
+                            resources=Resources(
+                                resource_vector={Resource(name="Slot", _id="any"): 1}
+                            ),
+                            batch_size=1,
+                            runtime=EventTime(rng.randint(1, 100), EventTime.Unit.US),
+                        )
+                    ]
+                ),
+            ),
+        )
+        for index in range(FLAGS.num_jobs)
+    ]
+    job_graph = JobGraph(name="JobGraph")
+    for index, job in enumerate(jobs):
+        job_graph.add_job(job)
+        if index > 0:
+            for parent in rng.sample(
+                jobs[:index], rng.randint(1, min(index, FLAGS.max_parents))
+            ):
+                job_graph.add_child(parent, job)
+    return job_graph
+
+
+def generate_task_graphs(job_graph: JobGraph):
+    return [
+        job_graph.get_next_task_graph(start_time=EventTime(index, EventTime.Unit.US))
+        for index in range(FLAGS.num_task_graphs)
+    ]
+
+
+def main(args):
+    job_graph = create_job_graph()
+
+    gc.collect()
+    start_time = time.perf_counter()
+    task_graphs = generate_task_graphs(job_graph)
+    end_time = time.perf_counter()
+    del task_graphs
+
+    gc.collect()
+    tracemalloc.start()
+    start_memory, _ = tracemalloc.get_traced_memory()
+    task_graphs = generate_task_graphs(job_graph)
+    gc.collect()
+    end_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    num_edges = len(job_graph.get_edges())
+    total_time = end_time - start_time
+    print(f"JobGraph:            {FLAGS.num_jobs} Jobs, {num_edges} edges")
+    print(f"TaskGraphs:          {len(task_graphs)} (x2)")
+    print(f"Total time (s):      {total_time:.3f}")
+    print(f"Time/graph (us):     {total_time / FLAGS.num_task_graphs * 1e6:.2f}")
+    print(
+        "Bytes/graph:         "
+        f"{(end_memory - start_memory) / FLAGS.num_task_graphs:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    app.run(main)
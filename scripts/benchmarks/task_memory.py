@@ -0,0 +1,109 @@
+"""Measures the memory retained by each `Task`, and by the `Event`s, `Placement`s
+and `ExecutionStrategy`s that the simulator creates alongside it.
+
+The objects are constructed the way that `JobGraph._generate_task_graph` and the
+simulator construct them (with a shared logger, and the time and resources shared
+across the objects), so that the reported numbers only account for the objects
+themselves. Run from the root of the repository:
+
+    python scripts/benchmarks/task_memory.py --num_tasks=100000
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+from absl import app, flags
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from simulator import Event, EventType  # noqa: E402
+from utils import EventTime, setup_logging  # noqa: E402
+from workload import (  # noqa: E402
+    ExecutionStrategies,
+    ExecutionStrategy,
+    Job,
+    Placement,
+    Resource,
+    Resources,
+    Task,
+    WorkProfile,
+)
+
+FLAGS = flags.FLAGS
+flags.DEFINE_integer(
+    "num_tasks", 100000, "The number of objects of each type to create.", lower_bound=1
+)
+
+
+def measure(create_object) -> float:
+    """Returns the number of bytes retained by each object returned by
+    `create_object`, averaged over `--num_tasks` objects."""
+    objects = [None] * FLAGS.num_tasks
+    gc.collect()
+    tracemalloc.start()
+    start_memory, _ = tracemalloc.get_traced_memory()
+    for index in range(FLAGS.num_tasks):
+        objects[index] = create_object(index)
+    gc.collect()
+    end_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (end_memory - start_memory) / FLAGS.num_tasks
+
+
+def main(args):
+    resources = Resources(resource_vector={Resource(name="CPU", _id="any"): 1})
+    runtime = EventTime(1000, EventTime.Unit.US)
+    execution_strategy = ExecutionStrategy(
+        resources=resources, batch_size=1, runtime=runtime
+    )
+    job = Job(
+        name="Job",
+        profile=WorkProfile(
+            name="Job_Work_Profile",
+            execution_strategies=ExecutionStrategies(strategies=[execution_strategy]),
+        ),
+    )
+    task_logger = setup_logging(name="Task", log_level="warning")
+    release_time = EventTime(0, EventTime.Unit.US)
+    deadline = EventTime(5000, EventTime.Unit.US)
+
+    def create_task(index: int) -> Task:
+        return Task(
+            name="Job",
+            task_graph="TaskGraph",
+            job=job,
+            deadline=deadline,
+            timestamp=index,
+            release_time=release_time,
+            _logger=task_logger,
+        )
+
+    task = create_task(0)
+    results = [
+        ("Task", measure(create_task)),
+        (
+            "Event",
+            measure(lambda _: Event(EventType.TASK_RELEASE, release_time, task=task)),
+        ),
+        (
+            "Placement",
+            measure(
+                lambda _: Placement.create_task_placement(
+                    task, release_time, "WorkerPool", None, execution_strategy
+                )
+            ),
+        ),
+        (
+            "ExecutionStrategy",
+            measure(lambda _: ExecutionStrategy(resources, 1, runtime)),
+        ),
+    ]
+    print(f"{'Object':<20}{'Bytes/object':>15}")
+    for name, bytes_per_object in results:
+        print(f"{name:<20}{bytes_per_object:>15.1f}")
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,116 @@
+"""Benchmarks the stepping of a sparsely utilized `WorkerPool`.
+
+The WorkerPool consists of `--num_workers` Workers, a `--utilization` fraction of
+which are running a Task (that does not finish during the benchmark), and is
+stepped `--num_steps` times, as the simulator does when it is not running in the
+event-driven mode. Run from the root of the repository:
+
+    python scripts/benchmarks/worker_pool_step.py --num_workers=2000 --utilization=0.05
+"""
+
+import logging
+import os
+import sys
+import time
+
+from absl import app, flags
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils import EventTime  # noqa: E402
+from workers import Worker, WorkerPool  # noqa: E402
+from workload import (  # noqa: E402
+    ExecutionStrategies,
+    ExecutionStrategy,
+    Job,
+    Placement,
+    Resource,
+    Resources,
+    Task,
+    WorkProfile,
+)
+
+FLAGS = flags.FLAGS
+flags.DEFINE_integer(
+    "num_workers", 2000, "The number of Workers in the WorkerPool.", lower_bound=1
+)
+flags.DEFINE_float(
+    "utilization",
+    0.05,
+    "The fraction of the Workers that are running a Task.",
+    lower_bound=0.0,
+    upper_bound=1.0,
+)
+flags.DEFINE_integer(
+    "num_steps", 1000, "The number of times the WorkerPool is stepped.", lower_bound=1
+)
+
+
+def main(args):
+    logger = logging.getLogger("WorkerPoolStepBenchmark")
+    logger.setLevel(logging.WARNING)
+    workers = [
+        Worker(
+            name=f"Worker_{index}",
+            resources=Resources({Resource(name="Slot"): 1}, _logger=logger),
+            _logger=logger,
+        )
+        for index in range(FLAGS.num_workers)
+    ]
+    worker_pool = WorkerPool(name="WorkerPool", workers=workers, _logger=logger)
+
+    # Place a long-running Task on every `1 / utilization`-th Worker.
+    execution_strategy = ExecutionStrategy(
+        resources=Resources({Resource(name="Slot", _id="any"): 1}),
+        batch_size=1,
+        runtime=EventTime(10 * FLAGS.num_steps, EventTime.Unit.US),
+    )
+    job = Job(
+        name="Job",
+        profile=WorkProfile(
+            name="Job_Work_Profile",
+            execution_strategies=ExecutionStrategies(strategies=[execution_strategy]),
+        ),
+    )
+    num_tasks = int(FLAGS.num_workers * FLAGS.utilization)
+    start_time = EventTime.zero()
+    for index in range(num_tasks):
+        task = Task(
+            name="Job",
+            task_graph=f"TaskGraph_{index}",
+            job=job,
+            deadline=EventTime(20 * FLAGS.num_steps, EventTime.Unit.US),
+            _logger=logger,
+        )
+        worker = workers[index * FLAGS.num_workers // max(num_tasks, 1)]
+        worker_pool.place_task(task, execution_strategy, worker_id=worker.id)
+        task.release(start_time)
+        task.schedule(
+            start_time,
+            placement=Placement.create_task_placement(
+                task=task,
+                placement_time=start_time,
+                worker_pool_id=worker_pool.id,
+                worker_id=worker.id,
+                execution_strategy=execution_strategy,
+            ),
+        )
+        task.start(start_time)
+
+    step_size = EventTime(1, EventTime.Unit.US)
+    current_time = start_time
+    benchmark_start_time = time.perf_counter()
+    for _ in range(FLAGS.num_steps):
+        worker_pool.step(current_time, step_size)
+        current_time += step_size
+    benchmark_end_time = time.perf_counter()
+
+    total_time = benchmark_end_time - benchmark_start_time
+    print(f"Workers:             {FLAGS.num_workers} ({num_tasks} running a Task)")
+    print(f"Steps:               {FLAGS.num_steps}")
+    print(f"Total time (s):      {total_time:.3f}")
+    print(f"Time/step (us):      {total_time / FLAGS.num_steps * 1e6:.2f}")
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -1,17 +1,21 @@
 import heapq
+import json
 import logging
 import os
 import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
 from enum import Enum
 from functools import total_ordering
 from operator import attrgetter, itemgetter
-from typing import Mapping, Optional, Sequence
+from typing import Mapping, Optional, Sequence, Tuple
 
 import absl  # noqa: F401
 
-from data import BaseWorkloadLoader
+from data import BaseWorkloadLoader, EventLogWriter
 from schedulers import BaseScheduler
-from utils import EventTime, setup_csv_logging, setup_logging
+from utils import BufferedCSVWriter, EventTime, setup_csv_logging, setup_logging
 from workers import WorkerPools
 from workload import (
     Placement,
@@ -70,6 +74,8 @@ class Event(object):
         and no associated task is provided, or if the time is not of type `EventTime`.
     """
 
+    __slots__ = ("_event_type", "_time", "_task", "_task_graph", "_placement")
+
     def __init__(
         self,
         event_type: EventType,
@@ -148,22 +154,72 @@ class Event(object):
         return self._placement
 
 
+class _EventQueueEntry(object):
+    """A heap entry that wraps an `Event` in the `EventQueue`.
+
+    The entry snapshots the time of the event at insertion, so that in-place updates
+    to the time of an `Event` do not silently violate the heap invariant. Entries are
+    never removed from the heaps eagerly; instead, they are marked as `removed` and
+    skipped when they bubble up to the top of a heap.
+
+    Args:
+        event (`Event`): The event wrapped by this entry.
+    """
+
+    __slots__ = ("event", "time", "removed")
+
+    def __init__(self, event: Event):
+        self.event = event
+        self.time = event.time
+        self.removed = False
+
+    def __lt__(self, other: "_EventQueueEntry") -> bool:
+        if self.time == other.time:
+            event, other_event = self.event, other.event
+            if (
+                event.event_type == other_event.event_type
+                and event.task is not None
+                and other_event.task is not None
+            ):
+                return event.task.unique_name < other_event.task.unique_name
+            return event.event_type < other_event.event_type
+        return self.time < other.time
+
+
 class EventQueue(object):
     """An `EventQueue` provides an abstraction that is used by the simulator
     to add the events into, and retrieve events from according to their
     release time.
+
+    The queue is implemented as a lazy-deletion heap. Along with the primary heap
+    ordered by the release time, the queue maintains a secondary heap per `EventType`
+    and an index from each `Event` to its live heap entry. Removals and time updates
+    mark the existing entry as removed (a tombstone) instead of rebuilding the heap,
+    which makes `remove_event`, `update_event_time` and `get_next_event_of_type`
+    logarithmic (amortized) in the size of the queue.
     """
 
     def __init__(self):
         self._event_queue = []
+        # A secondary heap of the entries for each EventType (keyed by its value).
+        self._event_type_queues: Mapping[int, list] = defaultdict(list)
+        # A mapping from the Event to its live entry in the heaps.
+        self._entries: Mapping[Event, _EventQueueEntry] = {}
+        # The number of removed entries still lingering across all the heaps.
+        self._num_tombstones = 0
 
     def add_event(self, event: Event):
         """Add the given event to the queue.
 
         Args:
             event (`Event`): The event to be added to the queue.
+
+        Raises:
+            `ValueError` if the event is already in the queue.
         """
-        heapq.heappush(self._event_queue, event)
+        if event in self._entries:
+            raise ValueError(f"The event {event} is already in the queue.")
+        self.__push_entry(_EventQueueEntry(event))
 
     def remove_event(self, event: Event):
         """Removes the event from the queue.
@@ -174,16 +230,43 @@ class EventQueue(object):
         Raises:
             `ValueError` if the event was not found.
         """
-        self._event_queue.remove(event)
-        self.reheapify()
+        entry = self._entries.pop(event, None)
+        if entry is None:
+            raise ValueError(f"The event {event} was not found in the queue.")
+        self.__tombstone_entry(entry)
+
+    def update_event_time(self, event: Event, time: EventTime):
+        """Updates the time of an event that is already in the queue.
+
+        Args:
+            event (`Event`): The event whose time is to be updated.
+            time (`EventTime`): The new time of the event.
+
+        Raises:
+            `ValueError` if the event was not found.
+        """
+        self.remove_event(event)
+        event._time = time
+        self.add_event(event)
 
     def next(self) -> Event:
         """Retrieve the next event from the queue.
 
         Returns:
             The next event in the queue ordered according to the release time.
+
+        Raises:
+            `IndexError` if the queue is empty.
         """
-        return heapq.heappop(self._event_queue)
+        self.__prune(self._event_queue)
+        entry = heapq.heappop(self._event_queue)
+        del self._entries[entry.event]
+        # Mark the entry as removed so that the secondary heap skips it. The entry
+        # lingers in its secondary heap, which is only pruned from the top when its
+        # type is queried, so it counts towards the compaction of the heaps.
+        entry.removed = True
+        self.__count_tombstones(1)
+        return entry.event
 
     def peek(self) -> Optional[Event]:
         """Peek at the next event in the queue without popping it.
@@ -191,15 +274,14 @@ class EventQueue(object):
         Returns:
             The next event in the queue ordered according to the release time.
         """
+        self.__prune(self._event_queue)
         if len(self._event_queue) == 0:
             return None
-        return self._event_queue[0]
+        return self._event_queue[0].event
 
     def get_next_event_of_type(self, event_type: EventType) -> Optional[Event]:
         """Retrieve the next event of the given type from the queue.
 
-        Note that this method iterates over the entire queue, and can be slow.
-
         Args:
             event_type (`EventType`): The type of the event to retrieve.
 
@@ -207,21 +289,231 @@ class EventQueue(object):
             The next event of the given type in the queue ordered according to the
             release time.
         """
-        filtered_values = list(
-            filter(lambda event: event.event_type == event_type, self._event_queue)
-        )
-        return min(filtered_values) if len(filtered_values) > 0 else None
+        event_type_queue = self._event_type_queues.get(event_type.value)
+        if event_type_queue is None:
+            return None
+        self.__prune(event_type_queue)
+        if len(event_type_queue) == 0:
+            return None
+        return event_type_queue[0].event
 
     def reheapify(self):
         """Reheapify the current queue.
 
         This method should be used if any in-place changes have been made to
-        the events already inserted into the queue.
+        the events already inserted into the queue. Prefer `update_event_time`,
+        which avoids rebuilding the heaps.
         """
+        self._event_queue = []
+        self._event_type_queues = defaultdict(list)
+        self._num_tombstones = 0
+        for entry in self._entries.values():
+            entry.time = entry.event.time
+            self._event_queue.append(entry)
+            self._event_type_queues[entry.event.event_type.value].append(entry)
         heapq.heapify(self._event_queue)
+        for event_type_queue in self._event_type_queues.values():
+            heapq.heapify(event_type_queue)
+
+    def __push_entry(self, entry: _EventQueueEntry):
+        self._entries[entry.event] = entry
+        heapq.heappush(self._event_queue, entry)
+        heapq.heappush(self._event_type_queues[entry.event.event_type.value], entry)
+
+    def __tombstone_entry(self, entry: _EventQueueEntry):
+        entry.removed = True
+        # The entry lingers in both the primary and its secondary heap.
+        self.__count_tombstones(2)
+
+    def __count_tombstones(self, num_tombstones: int):
+        self._num_tombstones += num_tombstones
+        # Compact the heaps if the tombstones start dominating the live entries.
+        if self._num_tombstones > max(len(self._entries), 64):
+            self.reheapify()
+
+    def __prune(self, queue: list):
+        """Pops the removed entries from the top of the given heap."""
+        while queue and queue[0].removed:
+            heapq.heappop(queue)
+            self._num_tombstones -= 1
 
     def __len__(self) -> int:
-        return len(self._event_queue)
+        return len(self._entries)
+
+
+class TaskCompletionQueue(object):
+    """A `TaskCompletionQueue` tracks the running `Task`s in the system ordered by
+    their projected completion time.
+
+    The queue is used by the event-driven execution mode of the `Simulator` to find
+    the `Task`s that finish within a step without stepping every running `Task`.
+    Like the `EventQueue`, it is a lazy-deletion heap: removing a `Task` drops it
+    from the index, and its heap entry is skipped once it reaches the top.
+    """
+
+    def __init__(self):
+        self._completion_queue = []
+        # A mapping from the Task to its (projected completion time, sequence number).
+        self._entries: Mapping[Task, Tuple[int, int]] = {}
+        self._sequence_number = 0
+
+    def add_task(self, task: Task, completion_time: EventTime):
+        """Adds (or updates) the projected completion time of the given task.
+
+        Args:
+            task (`Task`): The running task to be tracked.
+            completion_time (`EventTime`): The time at which the task is projected to
+                finish its execution.
+        """
+        entry = (completion_time.to(EventTime.Unit.US).time, self._sequence_number)
+        self._sequence_number += 1
+        self._entries[task] = entry
+        heapq.heappush(self._completion_queue, (*entry, task))
+
+    def remove_task(self, task: Task):
+        """Stops tracking the completion of the given task.
+
+        Args:
+            task (`Task`): The task to be removed from the queue.
+
+        Raises:
+            `ValueError` if the task was not found.
+        """
+        if self._entries.pop(task, None) is None:
+            raise ValueError(f"The task {task} was not found in the queue.")
+        if len(self._completion_queue) > max(2 * len(self._entries), 64):
+            # Compact the heap if the removed entries start dominating it.
+            self._completion_queue = [
+                (*entry, task) for task, entry in self._entries.items()
+            ]
+            heapq.heapify(self._completion_queue)
+
+    def peek_time(self) -> Optional[EventTime]:
+        """Retrieves the earliest projected completion time across the tasks.
+
+        Returns:
+            The earliest projected completion time, or `None` if the queue is empty.
+        """
+        self.__prune()
+        if len(self._completion_queue) == 0:
+            return None
+        return EventTime(self._completion_queue[0][0], EventTime.Unit.US)
+
+    def pop_completed_tasks(self, time: EventTime) -> Sequence[Task]:
+        """Removes and returns the tasks that are projected to finish by `time`.
+
+        Args:
+            time (`EventTime`): The time until which the completed tasks are popped.
+
+        Returns:
+            The tasks that finish by `time`, ordered by their completion time.
+        """
+        time_us = time.to(EventTime.Unit.US).time
+        completed_tasks = []
+        self.__prune()
+        while self._completion_queue and self._completion_queue[0][0] <= time_us:
+            _, _, task = heapq.heappop(self._completion_queue)
+            del self._entries[task]
+            completed_tasks.append(task)
+            self.__prune()
+        return completed_tasks
+
+    def __prune(self):
+        """Pops the entries of removed or updated tasks from the top of the heap."""
+        while self._completion_queue:
+            completion_time, sequence_number, task = self._completion_queue[0]
+            if self._entries.get(task) == (completion_time, sequence_number):
+                break
+            heapq.heappop(self._completion_queue)
+
+    def __contains__(self, task: Task) -> bool:
+        return task in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class HandlerProfiler(object):
+    """A `HandlerProfiler` records the number of invocations and the wall time spent
+    in the handlers of the different `EventType`s and in the phases of a scheduler
+    invocation of the `Simulator`.
+
+    The wall time of each invocation is bucketed into a histogram with power-of-two
+    bucket boundaries (in microseconds), such that the bucket with the upper bound
+    `2^i` counts the invocations that took less than `2^i` us.
+    """
+
+    def __init__(self):
+        # A mapping from the name of the profiled section to its
+        # [count, total time (ns), maximum time (ns), histogram].
+        self._sections: Mapping[str, list] = {}
+
+    def record(self, name: str, duration: int):
+        """Records an invocation of the given section.
+
+        Args:
+            name (`str`): The name of the profiled section.
+            duration (`int`): The wall time spent in the invocation (in ns).
+        """
+        section = self._sections.get(name)
+        if section is None:
+            section = [0, 0, 0, defaultdict(int)]
+            self._sections[name] = section
+        section[0] += 1
+        section[1] += duration
+        if duration > section[2]:
+            section[2] = duration
+        section[3][(duration // 1000).bit_length()] += 1
+
+    @contextmanager
+    def measure(self, name: str):
+        """Records the wall time spent in the body of the `with` statement."""
+        start_time = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter_ns() - start_time)
+
+    def to_dict(self) -> Mapping[str, Mapping]:
+        """Summarizes the recorded invocations of each section.
+
+        Returns:
+            A mapping from the name of each section to its invocation count, the
+            total, mean and maximum wall time (in us), and the histogram of the wall
+            times as a list of (bucket upper bound (in us), count) pairs.
+        """
+        return {
+            name: {
+                "count": count,
+                "total_us": total_time / 1000,
+                "mean_us": total_time / count / 1000,
+                "max_us": max_time / 1000,
+                "histogram_us": [
+                    [2**bucket, histogram[bucket]] for bucket in sorted(histogram)
+                ],
+            }
+            for name, (count, total_time, max_time, histogram) in sorted(
+                self._sections.items(), key=lambda item: item[1][1], reverse=True
+            )
+        }
+
+    def dump(self, path: str):
+        """Writes the summary of the recorded invocations as JSON to the given path."""
+        with open(path, "w") as profile_file:
+            json.dump(self.to_dict(), profile_file, indent=2)
+
+    def format_table(self) -> str:
+        """Formats the summary of the recorded invocations as a table."""
+        lines = [
+            f"{'Section':<40}{'Count':>10}{'Total (ms)':>14}{'Mean (us)':>12}"
+            f"{'Max (us)':>12}"
+        ]
+        for name, summary in self.to_dict().items():
+            lines.append(
+                f"{name:<40}{summary['count']:>10}{summary['total_us'] / 1000:>14.2f}"
+                f"{summary['mean_us']:>12.1f}{summary['max_us']:>12.1f}"
+            )
+        return os.linesep.join(lines)
 
 
 class Simulator(object):
@@ -297,14 +589,31 @@ class Simulator(object):
                 name=self.__class__.__name__,
                 log_dir=_flags.log_dir,
                 log_file=_flags.csv_file_name,
+                buffer_size=_flags.csv_buffer_size,
             )
             self._log_dir = _flags.log_dir
+            self._event_log = (
+                EventLogWriter(
+                    os.path.join(self._log_dir or os.getcwd(), _flags.event_log_name)
+                )
+                if _flags.event_log_name
+                else None
+            )
+            self._profiler = HandlerProfiler() if _flags.event_profile_name else None
+            self._event_profile_path = (
+                os.path.join(self._log_dir or os.getcwd(), _flags.event_profile_name)
+                if _flags.event_profile_name
+                else None
+            )
         else:
             self._logger = setup_logging(name=self.__class__.__name__)
             self._csv_logger = setup_csv_logging(
                 name=self.__class__.__name__, log_file=None
             )
             self._log_dir = os.getcwd()
+            self._event_log = None
+            self._profiler = None
+            self._event_profile_path = None
         if not self._logger.isEnabledFor(logging.DEBUG):
             self._logger.addFilter(event_representation_filter)
 
@@ -332,6 +641,10 @@ class Simulator(object):
             self._csv_logger.debug(
                 f"0,WORKER_POOL,{worker_pool.name},{worker_pool.id},{resources_str}"
             )
+            if self._event_log is not None:
+                self._event_log.log(
+                    "WORKER_POOL", 0, worker_pool.name, worker_pool.id, resources_str
+                )
             for worker in worker_pool.workers:
                 self._logger.info(f"\t{worker}")
         self.__log_utilization(self._simulator_time)
@@ -362,6 +675,19 @@ class Simulator(object):
             else EventTime.invalid()
         )
         self._log_task_graphs = _flags.log_graphs if _flags else False
+        self._event_driven_execution = (
+            _flags.event_driven_execution if _flags else False
+        )
+
+        # The running Tasks ordered by their projected completion time, and the
+        # WorkerPools that are loading profiles. These are only maintained in the
+        # event-driven execution mode, which steps only the Tasks that finish instead
+        # of stepping every Worker on every step of the Simulator.
+        self._task_completion_queue = TaskCompletionQueue()
+        # The clock that the running tasks compute their remaining time against in the
+        # event-driven execution mode, instead of being stepped until they finish.
+        self._clock = lambda: self._simulator_time
+        self._worker_pools_loading_profiles = set()
 
         # Statistics about the Task.
         self._finished_tasks = 0
@@ -463,6 +789,7 @@ class Simulator(object):
                     task_graph.to_dot(
                         os.path.join(self._log_dir, f"{task_graph.name}.dot")
                     )
+        self.__flush_logs()
 
     def simulate(self) -> None:
         """Run the simulator loop.
@@ -470,20 +797,22 @@ class Simulator(object):
         This loop requires the `Workload` to be populated with the `TaskGraph`s whose
         execution is to be simulated using the Scheduler.
         """
-        # Run the simulator loop.
+        try:
+            self.__simulate()
+        finally:
+            # Write out any buffered logs, including when the simulation crashes.
+            self.__flush_logs(close=True)
+
+    def __simulate(self) -> None:
+        """Runs the simulator loop until the SIMULATOR_END event is handled."""
         while True:
             time_until_next_event = self._event_queue.peek().time - self._simulator_time
 
             # If there are any running tasks, step through the execution of the
             # Simulator until the closest remaining time.
-            running_tasks = self._worker_pools.get_placed_tasks()
+            min_task_remaining_time = self.__get_minimum_task_remaining_time()
 
-            if len(running_tasks) > 0:
-                # There are running tasks, figure out the minimum remaining
-                # time across all the tasks.
-                min_task_remaining_time = min(
-                    map(attrgetter("remaining_time"), running_tasks)
-                )
+            if min_task_remaining_time is not None:
                 self._logger.debug(
                     "[%s] The minimum task remaining time was %s, "
                     "and the time until next event was %s.",
@@ -496,21 +825,83 @@ class Simulator(object):
                 # the next event in the queue, step all workers until the
                 # completion of that task, otherwise, handle the next event.
                 if min_task_remaining_time < time_until_next_event:
-                    self.__step(step_size=min_task_remaining_time)
+                    with self.__profile("simulator.step"):
+                        self.__step(step_size=min_task_remaining_time)
                 else:
                     # NOTE: We step here so that all the Tasks that are going
                     # to finish as a result of this step have their TASK_FINISHED
                     # events processed first before any future placement occurs
                     # that is decided prior.
-                    self.__step(step_size=time_until_next_event)
+                    with self.__profile("simulator.step"):
+                        self.__step(step_size=time_until_next_event)
                     if self.__handle_event(self._event_queue.next()):
                         break
             else:
                 # Step until the next event is supposed to be executed.
-                self.__step(step_size=time_until_next_event)
+                with self.__profile("simulator.step"):
+                    self.__step(step_size=time_until_next_event)
                 if self.__handle_event(self._event_queue.next()):
                     break
 
+    def __flush_logs(self, close: bool = False) -> None:
+        """Writes out the CSV rows that were buffered by the `BufferedCSVWriter`, and
+        the events logged into the binary event log, if requested.
+
+        Args:
+            close (`bool`): If `True`, the binary event log is finalized as well.
+        """
+        if isinstance(self._csv_logger, BufferedCSVWriter):
+            self._csv_logger.flush()
+        if self._event_log is not None:
+            if close:
+                self._event_log.close()
+            else:
+                self._event_log.flush()
+
+    def __get_minimum_task_remaining_time(self) -> Optional[EventTime]:
+        """Computes the minimum remaining time across all the running tasks.
+
+        In the event-driven execution mode, the remaining time is retrieved from the
+        earliest projected completion time, instead of scanning all the placed tasks.
+
+        Returns:
+            The minimum remaining time, or `None` if there are no running tasks.
+        """
+        if self._event_driven_execution:
+            next_completion_time = self._task_completion_queue.peek_time()
+            if next_completion_time is None:
+                return None
+            return next_completion_time - self._simulator_time
+
+        running_tasks = self._worker_pools.get_placed_tasks()
+        if len(running_tasks) == 0:
+            return None
+        return min(map(attrgetter("remaining_time"), running_tasks))
+
+    def __synchronize_running_task(self, task: Task) -> None:
+        """Brings the remaining time of a running task up to the current simulator
+        time in the event-driven execution mode, where tasks are not stepped until
+        they finish.
+
+        Args:
+            task (`Task`): The task whose remaining time is to be synchronized.
+        """
+        if self._event_driven_execution and task in self._task_completion_queue:
+            task.step(self._simulator_time, EventTime.zero())
+
+    def __track_task_completion(self, task: Task, time: EventTime) -> None:
+        """Tracks the projected completion time of a task that started (or resumed)
+        its execution at the given time in the event-driven execution mode.
+
+        Args:
+            task (`Task`): The task that started running.
+            time (`EventTime`): The time at which the task started running.
+        """
+        if self._event_driven_execution:
+            self._task_completion_queue.add_task(task, time + task.remaining_time)
+            # Compute the remaining time of the task on demand from now on.
+            task.track_remaining_time(self._clock)
+
     def __handle_scheduler_start(self, event: Event) -> None:
         """Handle the SCHEDULER_START event. The method invokes the scheduler, and adds
         a SCHEDULER_FINISHED event to the event queue.
@@ -534,6 +925,13 @@ class Simulator(object):
             f"{event.time.time},SCHEDULER_START,{len(schedulable_tasks)},"
             f"{len(currently_placed_tasks)}"
         )
+        if self._event_log is not None:
+            self._event_log.log(
+                "SCHEDULER_START",
+                event.time.time,
+                len(schedulable_tasks),
+                len(currently_placed_tasks),
+            )
         self.__log_utilization(event.time)
 
         # Execute the scheduler, and insert an event notifying the
@@ -618,6 +1016,8 @@ class Simulator(object):
                 event.placement.loading_strategy,
                 event.placement.worker_id,
             )
+            if self._event_driven_execution:
+                self._worker_pools_loading_profiles.add(worker_pool)
 
     def __create_events_from_task_placement_skip(
         self,
@@ -661,6 +1061,7 @@ class Simulator(object):
             if task_graph is None:
                 raise ValueError(f"No TaskGraph found for {placement.task.task_graph}")
 
+            self._workload.notify_task_update(placement.task)
             for cancelled_task in task_graph.cancel(placement.task, time):
                 task_events.append(
                     Event(
@@ -698,6 +1099,15 @@ class Simulator(object):
                 f"{placement.task.task_graph},{placement.task.timestamp},"
                 f"{placement.task.id}"
             )
+            if self._event_log is not None:
+                self._event_log.log(
+                    "TASK_SKIP",
+                    time.to(EventTime.Unit.US).time,
+                    placement.task.name,
+                    placement.task.task_graph,
+                    placement.task.timestamp,
+                    placement.task.id,
+                )
             if placement.task.id in self._future_placement_events:
                 future_placement_event = self._future_placement_events[
                     placement.task.id
@@ -714,6 +1124,7 @@ class Simulator(object):
 
                 # Unschedule the Task.
                 placement.task.unschedule(time)
+                self._workload.notify_task_update(placement.task)
             else:
                 self._logger.warning(
                     "[%s] Failed to place %s, skipping it for future reconsideration.",
@@ -758,6 +1169,7 @@ class Simulator(object):
                     placement.placement_time,
                 )
                 placement.task.schedule(event_time, placement)
+                self._workload.notify_task_update(placement.task)
 
                 simulator_event = Event(
                     event_type=EventType.TASK_PLACEMENT,
@@ -790,6 +1202,7 @@ class Simulator(object):
                         placement.placement_time,
                     )
                     placement.task.schedule(event_time, placement)
+                    self._workload.notify_task_update(placement.task)
                     simulator_event = Event(
                         event_type=EventType.TASK_PLACEMENT,
                         time=placement.placement_time,
@@ -813,10 +1226,11 @@ class Simulator(object):
                         placement.placement_time,
                     )
                     placement.task.schedule(event_time, placement)
-                    cached_placement_event._time = placement.placement_time
+                    self._workload.notify_task_update(placement.task)
                     cached_placement_event._placement = placement
-                    # Reheapify since we changed the time of some already cached events.
-                    self._event_queue.reheapify()
+                    self._event_queue.update_event_time(
+                        cached_placement_event, placement.placement_time
+                    )
             else:
                 simulator_events.extend(
                     self.__create_events_from_task_placement_skip(
@@ -930,6 +1344,15 @@ class Simulator(object):
             f"{num_placed},{num_unplaced},"
             f"{self._last_scheduler_placements.true_runtime.to(EventTime.Unit.US).time}"
         )
+        if self._event_log is not None:
+            self._event_log.log(
+                "SCHEDULER_FINISHED",
+                event.time.time,
+                scheduler_runtime.to(EventTime.Unit.US).time,
+                num_placed,
+                num_unplaced,
+                self._last_scheduler_placements.true_runtime.to(EventTime.Unit.US).time,
+            )
 
         if self._verify_schedule:
             self._scheduler.verify_schedule(
@@ -971,6 +1394,19 @@ class Simulator(object):
                         f"{placement.placement_time.time},{placement.worker_pool_id},"
                         f"{placement.execution_strategy.runtime.time}"
                     )
+                    if self._event_log is not None:
+                        self._event_log.log(
+                            "TASK_SCHEDULED",
+                            event.time.time,
+                            placement.task.name,
+                            placement.task.task_graph,
+                            placement.task.timestamp,
+                            placement.task.id,
+                            placement.task.deadline.time,
+                            placement.placement_time.time,
+                            placement.worker_pool_id,
+                            placement.execution_strategy.runtime.time,
+                        )
                 simulator_events.extend(
                     self.__create_events_from_task_placement(event.time, placement)
                 )
@@ -1029,12 +1465,13 @@ class Simulator(object):
 
         # The scheduler has finished its execution, insert an event for the next
         # invocation of the scheduler.
-        next_sched_event = self.__get_next_scheduler_event(
-            event,
-            self._scheduler_frequency,
-            self._last_scheduler_start_time,
-            self._loop_timeout,
-        )
+        with self.__profile("scheduler.get_next_scheduler_event"):
+            next_sched_event = self.__get_next_scheduler_event(
+                event,
+                self._scheduler_frequency,
+                self._last_scheduler_start_time,
+                self._loop_timeout,
+            )
         self._event_queue.add_event(next_sched_event)
         self._logger.info(
             "[%s] Added %s to the event queue.", event.time.time, next_sched_event
@@ -1066,6 +1503,16 @@ class Simulator(object):
             f"{event.task.timestamp},{event.task.id},{event.task.task_graph},"
             f"{event.task.slowest_execution_strategy.runtime.time}"
         )
+        if self._event_log is not None:
+            self._event_log.log(
+                "TASK_CANCEL",
+                event.time.to(EventTime.Unit.US).time,
+                event.task.name,
+                event.task.timestamp,
+                event.task.id,
+                event.task.task_graph,
+                event.task.slowest_execution_strategy.runtime.time,
+            )
 
         # If the task already had a placement, we remove the placement from our queue.
         if event.task.id in self._future_placement_events:
@@ -1079,6 +1526,9 @@ class Simulator(object):
             self._event_queue.remove_event(placement_event)
             del self._future_placement_events[event.task.id]
 
+        # Notify the Workload so that it can retire the TaskGraph, if needed.
+        self._workload.notify_task_cancellation(event.task, event.time)
+
     def __handle_task_release(self, event: Event) -> None:
         """Handle the release of a task. If the task is not already scheduled and the
         next scheduler event is too far into the future, we bring the next scheduler
@@ -1089,6 +1539,7 @@ class Simulator(object):
         """
         # Release a task for the scheduler.
         event.task.release(event.time)
+        self._workload.notify_task_update(event.task)
 
         slowest_execution_strategy = (
             event.task.available_execution_strategies.get_slowest_strategy()
@@ -1109,6 +1560,20 @@ class Simulator(object):
             f"{slowest_execution_strategy.runtime.to(EventTime.Unit.US).time},"
             f"{resources_str}"
         )
+        if self._event_log is not None:
+            self._event_log.log(
+                "TASK_RELEASE",
+                event.time.time,
+                event.task.name,
+                event.task.timestamp,
+                event.task.intended_release_time.to(EventTime.Unit.US).time,
+                event.task.release_time.to(EventTime.Unit.US).time,
+                event.task.deadline.to(EventTime.Unit.US).time,
+                event.task.id,
+                event.task.task_graph,
+                slowest_execution_strategy.runtime.to(EventTime.Unit.US).time,
+                resources_str,
+            )
 
         # If we are not in the midst of a scheduler invocation, and the task hasn't
         # already been scheduled and next scheduled invocation is too late, then
@@ -1132,8 +1597,9 @@ class Simulator(object):
                     self._next_scheduler_event._time,
                     new_scheduler_event_time,
                 )
-                self._next_scheduler_event._time = new_scheduler_event_time
-                self._event_queue.reheapify()
+                self._event_queue.update_event_time(
+                    self._next_scheduler_event, new_scheduler_event_time
+                )
 
     def __handle_task_finished(self, event: Event) -> None:
         """Handle the completion of a task. The Task is first removed from the Worker
@@ -1160,6 +1626,17 @@ class Simulator(object):
             f"{event.task.completion_time.to(EventTime.Unit.US).time},"
             f"{event.task.deadline.to(EventTime.Unit.US).time},{event.task.id}"
         )
+        if self._event_log is not None:
+            self._event_log.log(
+                "TASK_FINISHED",
+                event.time.time,
+                event.task.name,
+                event.task.timestamp,
+                event.task.task_graph,
+                event.task.completion_time.to(EventTime.Unit.US).time,
+                event.task.deadline.to(EventTime.Unit.US).time,
+                event.task.id,
+            )
 
         # If the TaskGraph corresponding to this task finished too, log that event.
         task_graph = self._workload.get_task_graph(event.task.task_graph)
@@ -1175,6 +1652,14 @@ class Simulator(object):
                 f"{task_graph.deadline.to(EventTime.Unit.US).time},"
                 f"{tardiness.to(EventTime.Unit.US).time}"
             )
+            if self._event_log is not None:
+                self._event_log.log(
+                    "TASK_GRAPH_FINISHED",
+                    event.time.time,
+                    task_graph.name,
+                    task_graph.deadline.to(EventTime.Unit.US).time,
+                    tardiness.to(EventTime.Unit.US).time,
+                )
             if task_graph.deadline < event.time:
                 self._missed_task_graph_deadlines += 1
             self._logger.info(
@@ -1195,6 +1680,15 @@ class Simulator(object):
                 f"{event.task.timestamp},"
                 f"{event.task.deadline.to(EventTime.Unit.US).time},{event.task.id}"
             )
+            if self._event_log is not None:
+                self._event_log.log(
+                    "MISSED_DEADLINE",
+                    event.time.time,
+                    event.task.name,
+                    event.task.timestamp,
+                    event.task.deadline.to(EventTime.Unit.US).time,
+                    event.task.id,
+                )
 
         # Log if the TaskGraph missed its deadline.
         if task_graph is not None and event.time > task_graph.deadline:
@@ -1209,6 +1703,13 @@ class Simulator(object):
                 f"{event.time.time},MISSED_TASK_GRAPH_DEADLINE,{task_graph.name},"
                 f"{task_graph.deadline.to(EventTime.Unit.US).time}"
             )
+            if self._event_log is not None:
+                self._event_log.log(
+                    "MISSED_TASK_GRAPH_DEADLINE",
+                    event.time.time,
+                    task_graph.name,
+                    task_graph.deadline.to(EventTime.Unit.US).time,
+                )
 
         # The given task has finished execution, unlock dependencies from the `Workload`
         released_tasks, cancelled_tasks = self._workload.notify_task_completion(
@@ -1281,9 +1782,18 @@ class Simulator(object):
         self._csv_logger.debug(
             f"{event.time.time},TASK_PREEMPT,{task.name},{task.timestamp},{task.id}"
         )
+        if self._event_log is not None:
+            self._event_log.log(
+                "TASK_PREEMPT", event.time.time, task.name, task.timestamp, task.id
+            )
         worker_pool = self._worker_pools.get_worker_pool(task.worker_pool_id)
         worker_pool.remove_task(current_time=event.time, task=task)
+        if self._event_driven_execution:
+            self.__synchronize_running_task(task)
+            self._task_completion_queue.remove_task(task)
+            task.track_remaining_time(None)
         task.preempt(event.time)
+        self._workload.notify_task_update(task)
 
     def __handle_task_placement(self, event: Event, workload: Workload) -> None:
         """Handles the TASK_PLACEMENT event. The `Task` is placed on the `WorkerPool`
@@ -1319,6 +1829,7 @@ class Simulator(object):
                     # If the TaskGraph was cancelled, but the Task was not, then we
                     # emit a specific cancellation event for all the tasks from this
                     # task so that the status is correctly available to the schedulers.
+                    workload.notify_task_update(task)
                     for cancelled_task in task_graph.cancel(task, event.time):
                         self._event_queue.add_event(
                             Event(
@@ -1331,8 +1842,9 @@ class Simulator(object):
             else:
                 # If the Task is not ready to run and wasn't cancelled,
                 # find the next possible time to try executing the task.
+                parents = task_graph.get_parents(task)
                 parent_completion_time = max(
-                    parent.remaining_time for parent in task_graph.get_parents(task)
+                    parent.remaining_time for parent in parents
                 )
                 next_placement_time = event.time + max(
                     parent_completion_time, EventTime(1, EventTime.Unit.US)
@@ -1370,6 +1882,8 @@ class Simulator(object):
         )
         if success:
             task.start(event.time, variance=self._runtime_variance)
+            workload.notify_task_update(task)
+            self.__track_task_completion(task, event.time)
             resource_allocation_str = ",".join(
                 [
                     ",".join((resource.name, resource.id, str(quantity)))
@@ -1383,6 +1897,18 @@ class Simulator(object):
                 f"{event.placement.execution_strategy.runtime.time},"
                 f"{resource_allocation_str}"
             )
+            if self._event_log is not None:
+                self._event_log.log(
+                    "TASK_PLACEMENT",
+                    event.time.time,
+                    task.name,
+                    task.task_graph,
+                    task.timestamp,
+                    task.id,
+                    event.placement.worker_pool_id,
+                    event.placement.execution_strategy.runtime.time,
+                    resource_allocation_str,
+                )
             self._logger.info(
                 "[%s] Placed %s on %s.", event.time.time, task, worker_pool
             )
@@ -1443,6 +1969,8 @@ class Simulator(object):
         success = worker_pool.place_task(task)
         if success:
             task.resume(event.time, worker_pool_id=event.placement.worker_pool_id)
+            self._workload.notify_task_update(task)
+            self.__track_task_completion(task, event.time)
             self._logger.debug(
                 "[%s] The state of the WorkerPool(%s) is %s.",
                 event.time.time,
@@ -1460,6 +1988,17 @@ class Simulator(object):
                 f"{task.id},{last_preemption.old_worker_pool},"
                 f"{event.placement.worker_pool_id},{resource_allocation_str}"
             )
+            if self._event_log is not None:
+                self._event_log.log(
+                    "TASK_MIGRATED",
+                    event.time.time,
+                    task.name,
+                    task.timestamp,
+                    task.id,
+                    last_preemption.old_worker_pool,
+                    event.placement.worker_pool_id,
+                    resource_allocation_str,
+                )
         else:
             self._logger.warning(
                 "[%s] Task %s cannot be migrated to worker %s.",
@@ -1489,6 +2028,16 @@ class Simulator(object):
             len(task_graph.get_nodes()),
             task_graph.critical_path_runtime.to(EventTime.Unit.US).time,
         )
+        if self._event_log is not None:
+            self._event_log.log(
+                "TASK_GRAPH_RELEASE",
+                event.time.to(EventTime.Unit.US).time,
+                task_graph.release_time.to(EventTime.Unit.US).time,
+                task_graph.deadline.to(EventTime.Unit.US).time,
+                task_graph.name,
+                len(task_graph.get_nodes()),
+                task_graph.critical_path_runtime.to(EventTime.Unit.US).time,
+            )
         if self._log_task_graphs:
             # Log a DOT representation of the TaskGraph, if requested.
             task_graph.to_dot(os.path.join(self._log_dir, f"{task_graph.name}.dot"))
@@ -1514,6 +2063,8 @@ class Simulator(object):
                 type(self._workload_loader).__name__,
             )
             self._csv_logger.info("%s,UPDATE_WORKLOAD,0,0", self._simulator_time.time)
+            if self._event_log is not None:
+                self._event_log.log("UPDATE_WORKLOAD", self._simulator_time.time, 0, 0)
         else:
             self._workload = updated_workload
             # Notify the Scheduler of the updated Workload.
@@ -1529,15 +2080,22 @@ class Simulator(object):
                 "[%s] The WorkloadLoader %s has %s TaskGraphs that released %s tasks.",
                 self._simulator_time.to(EventTime.Unit.US).time,
                 type(self._workload_loader).__name__,
-                len(self._workload.task_graphs),
+                self._workload.num_task_graphs,
                 len(releasable_tasks),
             )
             self._csv_logger.info(
                 "%s,UPDATE_WORKLOAD,%s,%s",
                 event.time.to(EventTime.Unit.US).time,
-                len(self._workload.task_graphs),
+                self._workload.num_task_graphs,
                 len(releasable_tasks),
             )
+            if self._event_log is not None:
+                self._event_log.log(
+                    "UPDATE_WORKLOAD",
+                    event.time.to(EventTime.Unit.US).time,
+                    self._workload.num_task_graphs,
+                    len(releasable_tasks),
+                )
 
             # # Add the TaskGraphRelease events into the system.
             # for task_graph_name, task_graph in self._workload.task_graphs.items():
@@ -1584,11 +2142,51 @@ class Simulator(object):
                 next_update_event,
             )
 
+    def __profile(self, name: str):
+        """Returns a context manager that profiles the wall time of the given section
+        if the profiling of the simulator was requested."""
+        if self._profiler is None:
+            return nullcontext()
+        return self._profiler.measure(name)
+
+    def __export_profile(self) -> None:
+        """Logs the summary of the profile of the simulator, and writes it to the
+        requested file."""
+        self._logger.info(
+            "[%s] The profile of the simulator was:%s%s",
+            self._simulator_time.time,
+            os.linesep,
+            self._profiler.format_table(),
+        )
+        self._profiler.dump(self._event_profile_path)
+
     def __handle_event(self, event: Event) -> bool:
         """Handles the next event from the EventQueue.
 
         Invoked by the simulator loop, and tested using unit tests.
 
+        Args:
+            event (`Event`): The event to handle.
+
+        Returns:
+            `True` if the event is a SIMULATOR_END and the simulator loop
+            should be stopped, `False` otherwise.
+        """
+        if self._profiler is None:
+            return self.__dispatch_event(event)
+
+        start_time = time.perf_counter_ns()
+        simulator_end = self.__dispatch_event(event)
+        self._profiler.record(
+            f"event.{event.event_type.name}", time.perf_counter_ns() - start_time
+        )
+        if simulator_end:
+            self.__export_profile()
+        return simulator_end
+
+    def __dispatch_event(self, event: Event) -> bool:
+        """Invokes the handler of the given event.
+
         Args:
             event (`Event`): The event to handle.
 
@@ -1603,6 +2201,8 @@ class Simulator(object):
         if event.event_type == EventType.SIMULATOR_START:
             # Start of the simulator loop.
             self._csv_logger.debug(f"{event.time.time},SIMULATOR_START")
+            if self._event_log is not None:
+                self._event_log.log("SIMULATOR_START", event.time.time)
             self._logger.info(
                 "[%s] Starting the simulator loop.",
                 event.time.to(EventTime.Unit.US).time,
@@ -1661,10 +2261,22 @@ class Simulator(object):
                 f"{event.time.time},SIMULATOR_END,{self._finished_tasks},"
                 f"{self._cancelled_tasks},{self._missed_task_deadlines},"
                 f"{self._finished_task_graphs},"
-                f"{len(self._workload.get_cancelled_task_graphs())},"
+                f"{self._workload.get_num_cancelled_task_graphs()},"
                 f"{self._missed_task_graph_deadlines}"
             )
+            if self._event_log is not None:
+                self._event_log.log(
+                    "SIMULATOR_END",
+                    event.time.time,
+                    self._finished_tasks,
+                    self._cancelled_tasks,
+                    self._missed_task_deadlines,
+                    self._finished_task_graphs,
+                    self._workload.get_num_cancelled_task_graphs(),
+                    self._missed_task_graph_deadlines,
+                )
             self._logger.info("[%s] Ending the simulator loop.", event.time.time)
+            self.__flush_logs(close=True)
             return True
         elif event.event_type == EventType.LOG_UTILIZATION:
             self.__log_utilization(event.time)
@@ -1690,23 +2302,29 @@ class Simulator(object):
             step_size,
         )
         task_finished_events = []
-        for worker_pool in self._worker_pools.worker_pools:
-            for task in worker_pool.step(self._simulator_time, step_size):
-                task_finished_event = Event(
-                    event_type=EventType.TASK_FINISHED,
-                    time=self._simulator_time + step_size,
-                    task=task,
-                )
-                task_finished_events.append(task_finished_event)
+        if self._event_driven_execution:
+            finished_tasks = self.__step_event_driven(step_size)
+        else:
+            finished_tasks = []
+            for worker_pool in self._worker_pools.worker_pools:
+                finished_tasks.extend(worker_pool.step(self._simulator_time, step_size))
+        for task in finished_tasks:
+            task_finished_event = Event(
+                event_type=EventType.TASK_FINISHED,
+                time=self._simulator_time + step_size,
+                task=task,
+            )
+            task_finished_events.append(task_finished_event)
 
         # Update the simulator time, and add the TASK_FINISHED events to the queue for
         # further processing.
         self._simulator_time += step_size
-        self._logger.debug(
-            "[%s] The stepping yielded the following completed tasks: %s.",
-            self._simulator_time.time,
-            [event.task.unique_name for event in task_finished_events],
-        )
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "[%s] The stepping yielded the following completed tasks: %s.",
+                self._simulator_time.time,
+                [event.task.unique_name for event in task_finished_events],
+            )
         for task_finished_event in task_finished_events:
             self._event_queue.add_event(task_finished_event)
             self._logger.info(
@@ -1715,6 +2333,38 @@ class Simulator(object):
                 task_finished_event,
             )
 
+    def __step_event_driven(self, step_size: EventTime) -> Sequence[Task]:
+        """Steps only the tasks that finish within the given `step_size`, along with
+        the WorkerPools that are loading profiles.
+
+        Args:
+            step_size (`EventTime`): The amount by which to advance the clock (in us).
+
+        Returns:
+            The tasks that finished their execution within this step.
+        """
+        for worker_pool in list(self._worker_pools_loading_profiles):
+            worker_pool.step_profiles(self._simulator_time, step_size)
+            if not worker_pool.has_pending_profiles():
+                self._worker_pools_loading_profiles.remove(worker_pool)
+
+        finished_tasks = []
+        for task in self._task_completion_queue.pop_completed_tasks(
+            self._simulator_time + step_size
+        ):
+            # Bring the task up to the current time, and step it to its completion.
+            if task.step(self._simulator_time, EventTime.zero()) or task.step(
+                self._simulator_time, step_size
+            ):
+                finished_tasks.append(task)
+            else:
+                raise RuntimeError(
+                    f"The task {task.unique_name} was projected to finish by "
+                    f"{self._simulator_time + step_size}, but has a remaining time "
+                    f"of {task.remaining_time}."
+                )
+        return finished_tasks
+
     def __get_next_scheduler_event(
         self,
         event: Event,
@@ -1787,10 +2437,28 @@ class Simulator(object):
             return Event(event_type=EventType.SIMULATOR_END, time=loop_timeout)
 
         # Find sources of existing or ongoing work in the Simulator.
+        future_placed_tasks = [
+            placement.task for placement in self._future_placement_events.values()
+        ]
+        if self._event_driven_execution:
+            # The running tasks are tracked by their projected completion time, and
+            # the tasks that finished within the last step have their TASK_FINISHED
+            # events pending in the queue. Only the future placements are inspected.
+            next_completion_time = self._task_completion_queue.peek_time()
+            if (
+                self._event_queue.get_next_event_of_type(EventType.TASK_FINISHED)
+                is not None
+            ):
+                next_completion_time = self._simulator_time
+            running_tasks = future_placed_tasks
+            has_running_tasks = (
+                next_completion_time is not None or len(future_placed_tasks) > 0
+            )
+        else:
+            next_completion_time = None
+            running_tasks = self._worker_pools.get_placed_tasks() + future_placed_tasks
+            has_running_tasks = len(running_tasks) > 0
         # Find the minimum remaining time from all the running / scheduled tasks.
-        running_tasks: Sequence[Task] = self._worker_pools.get_placed_tasks() + list(
-            [placement.task for placement in self._future_placement_events.values()]
-        )
         remaining_times = []
         for task in running_tasks:
             if task.state == TaskState.SCHEDULED:
@@ -1823,13 +2491,15 @@ class Simulator(object):
                 for task_name, start_time, completion_time in remaining_times
             ],
         )
-        minimum_running_task_completion_time = (
-            min(
-                map(itemgetter(2), remaining_times),
-                default=EventTime(sys.maxsize, EventTime.Unit.US),
-            )
-            + self._scheduler_delay
+        minimum_running_task_completion_time = min(
+            map(itemgetter(2), remaining_times),
+            default=EventTime(sys.maxsize, EventTime.Unit.US),
         )
+        if next_completion_time is not None:
+            minimum_running_task_completion_time = min(
+                minimum_running_task_completion_time, next_completion_time
+            )
+        minimum_running_task_completion_time += self._scheduler_delay
 
         # Get the schedulable tasks that are waiting to be executed.
         schedulable_tasks = self._workload.get_schedulable_tasks(
@@ -1842,11 +2512,12 @@ class Simulator(object):
             branch_prediction_accuracy=self._scheduler.branch_prediction_accuracy,
             release_taskgraphs=self._scheduler.release_taskgraphs,
         )
-        self._logger.debug(
-            "[%s] The schedulable tasks are %s.",
-            event.time.time,
-            [task.unique_name for task in schedulable_tasks],
-        )
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "[%s] The schedulable tasks are %s.",
+                event.time.time,
+                [task.unique_name for task in schedulable_tasks],
+            )
         next_task_release_event = self._event_queue.get_next_event_of_type(
             EventType.TASK_RELEASE
         )
@@ -1866,11 +2537,7 @@ class Simulator(object):
         # If there is either existing work in the form of events in the queue or tasks
         # waiting to be scheduled, or currently running tasks that can lead to more
         # work, adjust the scheduler invocation time accordingly, or end the loop.
-        if (
-            next_event is None
-            and len(schedulable_tasks) == 0
-            and len(running_tasks) == 0
-        ):
+        if next_event is None and len(schedulable_tasks) == 0 and not has_running_tasks:
             self._logger.info(
                 "[%s] There are no currently schedulable tasks, no running tasks, "
                 "and no events available in the event queue. Ending the loop.",
@@ -1880,7 +2547,7 @@ class Simulator(object):
                 event_type=EventType.SIMULATOR_END,
                 time=event.time + EventTime(1, EventTime.Unit.US),
             )
-        elif len(running_tasks) > 0 and self._run_scheduler_at_worker_free:
+        elif has_running_tasks and self._run_scheduler_at_worker_free:
             # The scheduler was requested to be invoked at the completion of the next
             # task event. We move the scheduler event to the time when the earliest
             # task ends.
@@ -1995,12 +2662,22 @@ class Simulator(object):
         if not (event.event_type == EventType.SCHEDULER_START):
             raise ValueError("Incorrect event type passed.")
 
+        # Let the scheduler drop its state for the TaskGraphs retired since its
+        # last invocation.
+        retired_task_graphs = self._workload.pop_retired_task_graphs()
+        if len(retired_task_graphs) > 0:
+            with self.__profile("scheduler.notify_task_graphs_retired"):
+                self._scheduler.notify_task_graphs_retired(
+                    event.time, [task_graph.name for task_graph in retired_task_graphs]
+                )
+
         # Run the scheduler.
-        placements = self._scheduler.schedule(
-            event.time,
-            self._workload,
-            self._worker_pools,
-        )
+        with self.__profile("scheduler.schedule"):
+            placements = self._scheduler.schedule(
+                event.time,
+                self._workload,
+                self._worker_pools,
+            )
         if placements is None:
             raise ValueError(
                 f"Received no Placements object from the Scheduler at {event.time}.",
@@ -2038,3 +2715,12 @@ class Simulator(object):
                     f"{worker_pool_resources.get_allocated_quantity(resource)},"
                     f"{worker_pool_resources.get_available_quantity(resource)}"
                 )
+                if self._event_log is not None:
+                    self._event_log.log(
+                        "WORKER_POOL_UTILIZATION",
+                        sim_time.time,
+                        worker_pool.id,
+                        resource_name,
+                        worker_pool_resources.get_allocated_quantity(resource),
+                        worker_pool_resources.get_available_quantity(resource),
+                    )
@@ -0,0 +1,247 @@
+import os
+import pickle
+import random
+import sys
+import types
+from collections import namedtuple
+
+import pytest
+
+from data.alibaba_loader import AlibabaLoader, AlibabaTaskUnpickler, Task
+from main import FLAGS
+from utils import EventTime
+
+
+def __create_trace(path: str, num_dags: int = 12) -> None:
+    """Writes a synthetic Alibaba trace with `num_dags` random DAGs, along with an
+    empty DAG that fails to convert, to the given path."""
+    rng = random.Random(42)
+    trace = {}
+    for dag_index in range(num_dags):
+        job_graph_name = f"j_{dag_index}"
+        tasks = []
+        for task_index in range(1, rng.randint(2, 5) + 1):
+            parents = [
+                str(parent) for parent in range(1, task_index) if rng.random() < 0.5
+            ]
+            duration = rng.randint(50, 300)
+            tasks.append(
+                Task(
+                    name="_".join([f"M{task_index}"] + parents),
+                    job=job_graph_name,
+                    instances=1,
+                    status="Terminated",
+                    start_time=0,
+                    end_time=duration,
+                    expected_duration=duration,
+                    actual_duration=duration,
+                    cpu_requested=100,
+                    cpu_usage=rng.choice((50, 100, 200)),
+                    mem_requested=0.5,
+                    mem_usage=0.5,
+                )
+            )
+        trace[job_graph_name] = tasks
+    trace["j_empty"] = []
+    with open(path, "wb") as trace_file:
+        pickle.dump(trace, trace_file)
+
+
+def __create_alibaba_loader(trace_path: str, *flags) -> AlibabaLoader:
+    """Creates an AlibabaLoader for the trace with the given additional flags."""
+    FLAGS.unparse_flags()
+    FLAGS(
+        [
+            "main",
+            f"--workload_profile_path={trace_path}",
+            "--override_release_policy=fixed",
+            "--override_arrival_period=10",
+            "--override_num_invocation=10",
+            "--random_seed=42",
+            "--alibaba_loader_min_release_critical_path_runtime=0",
+            *flags,
+        ]
+    )
+    return AlibabaLoader(
+        workload_interval=EventTime(100, EventTime.Unit.US), flags=FLAGS
+    )
+
+
+def __load_job_graph_definitions(loader: AlibabaLoader, trace_path: str):
+    """Loads the JobGraph definitions of the trace as the first release would."""
+    loader._job_graphs[trace_path] = {}
+    loader._job_graph_generators[trace_path]()
+    return loader._job_graphs[trace_path]
+
+
+def test_alibaba_loader_parallel_conversion(tmp_path):
+    """Test that the DAGs converted in a pool of processes are identical to the
+    DAGs converted in a single process."""
+    trace_path = str(tmp_path / "trace.pkl")
+    __create_trace(trace_path)
+
+    results, definitions = [], []
+    for num_workers in (1, 3):
+        loader = __create_alibaba_loader(
+            trace_path,
+            f"--alibaba_loader_num_workers={num_workers}",
+            "--alibaba_loader_task_cpu_usage_random",
+            "--alibaba_loader_task_cpu_usage_max=10",
+        )
+        with open(trace_path, "rb") as trace_file:
+            dags = list(pickle.load(trace_file).items())
+        results.append(
+            loader._convert_job_graphs(loader._get_job_graph_converter(), dags)
+        )
+        definitions.append(
+            list(__load_job_graph_definitions(loader, trace_path).items())
+        )
+
+    assert results[0] == results[1], "Incorrect results of the parallel conversion."
+    assert [job_graph_name for job_graph_name, _, _ in results[1]] == [
+        job_graph_name for job_graph_name, _ in dags
+    ], "Incorrect order of the converted DAGs."
+    assert (
+        results[1][-1][1] is None and results[1][-1][2] is not None
+    ), "The error of the conversion of the empty DAG was not propagated."
+    assert len(definitions[0]) == 12, "Incorrect number of converted DAGs."
+    assert definitions[0] == definitions[1], "Incorrect parallel definitions."
+
+
+def test_alibaba_loader_cache(tmp_path, monkeypatch):
+    """Test that the JobGraph definitions are cached on disk, reused by the later
+    runs with the same configuration, and converted again otherwise."""
+    trace_path = str(tmp_path / "trace.pkl")
+    __create_trace(trace_path)
+    cache_dir = tmp_path / "cache"
+
+    # The first run converts the trace, and writes the cache.
+    loader = __create_alibaba_loader(
+        trace_path, f"--alibaba_loader_cache_dir={cache_dir}"
+    )
+    definitions = list(__load_job_graph_definitions(loader, trace_path).items())
+    assert len(definitions) == 12, "Incorrect number of converted DAGs."
+    assert len(os.listdir(cache_dir)) == 1, "Incorrect number of cache files."
+
+    # The second run loads the definitions from the cache without the trace.
+    def load(self):
+        raise RuntimeError("The trace was read despite the cache.")
+
+    monkeypatch.setattr(AlibabaTaskUnpickler, "load", load)
+    loader = __create_alibaba_loader(
+        trace_path, f"--alibaba_loader_cache_dir={cache_dir}"
+    )
+    assert (
+        list(__load_job_graph_definitions(loader, trace_path).items()) == definitions
+    ), "Incorrect definitions loaded from the cache."
+    with pytest.raises(RuntimeError):
+        loader = __create_alibaba_loader(
+            trace_path,
+            f"--alibaba_loader_cache_dir={cache_dir}",
+            "--alibaba_loader_task_cpu_divisor=50",
+        )
+        __load_job_graph_definitions(loader, trace_path)
+    monkeypatch.undo()
+
+    # Changing a flag of the conversion or the random seed misses the cache.
+    for flags in (["--alibaba_loader_task_cpu_divisor=50"], ["--random_seed=7"]):
+        loader = __create_alibaba_loader(
+            trace_path, f"--alibaba_loader_cache_dir={cache_dir}", *flags
+        )
+        __load_job_graph_definitions(loader, trace_path)
+    assert sorted(os.listdir(cache_dir)) == sorted(
+        path for path in os.listdir(cache_dir) if path.endswith(".pkl")
+    ), "The temporary cache files were not removed."
+    assert len(os.listdir(cache_dir)) == 3, "Incorrect number of cache files."
+
+
+def test_alibaba_task_unpickler(tmp_path, monkeypatch):
+    """Test that the Tasks of both the current and the earlier traces, which stored
+    the Tasks as a namedtuple, are unpickled into equal `Task`s."""
+    # The earlier traces pickled a namedtuple named `Task` from another module.
+    legacy_module = types.ModuleType("legacy_trace")
+    legacy_module.Task = namedtuple(
+        "Task",
+        "name job instances status start_time end_time duration cpu mem",
+        module="legacy_trace",
+    )
+    monkeypatch.setitem(sys.modules, "legacy_trace", legacy_module)
+
+    task = Task(
+        name="M2_1",
+        job="j_1",
+        instances=1,
+        status="Terminated",
+        start_time=10,
+        end_time=110,
+        expected_duration=100,
+        actual_duration=100,
+        cpu_requested=50,
+        cpu_usage=50,
+        mem_requested=0.5,
+        mem_usage=0.5,
+    )
+    legacy_task = legacy_module.Task(
+        name="M2_1",
+        job="j_1",
+        instances=1,
+        status="Terminated",
+        start_time=10,
+        end_time=110,
+        duration=100,
+        cpu=50,
+        mem=0.5,
+    )
+    for trace_task in (task, legacy_task):
+        with open(tmp_path / "trace.pkl", "wb") as trace_file:
+            pickle.dump({"j_1": [trace_task]}, trace_file)
+        with open(tmp_path / "trace.pkl", "rb") as trace_file:
+            trace = AlibabaTaskUnpickler(trace_file).load()
+        assert type(trace["j_1"][0]) is Task, "Incorrect type of the unpickled Task."
+        assert trace["j_1"][0] == task, "Incorrect unpickled Task."
+
+
+def test_alibaba_loader_release_window(tmp_path):
+    """Test that only the JobGraphs whose critical path runtime lies within the
+    release window are released, and that an empty window raises an error."""
+    trace_path = str(tmp_path / "trace.pkl")
+    __create_trace(trace_path)
+    loader = __create_alibaba_loader(trace_path)
+    critical_path_runtimes = {
+        job_graph_name: definition.critical_path_runtime
+        for job_graph_name, definition in __load_job_graph_definitions(
+            loader, trace_path
+        ).items()
+    }
+    sorted_runtimes = sorted(critical_path_runtimes.values())
+    min_runtime, max_runtime = sorted_runtimes[3], sorted_runtimes[8]
+    eligible_job_graph_names = {
+        job_graph_name
+        for job_graph_name, runtime in critical_path_runtimes.items()
+        if min_runtime < runtime < max_runtime
+    }
+    assert (
+        0 < len(eligible_job_graph_names) < len(critical_path_runtimes)
+    ), "Incorrect bounds of the release window."
+
+    loader = __create_alibaba_loader(
+        trace_path,
+        f"--alibaba_loader_min_release_critical_path_runtime={min_runtime}",
+        f"--alibaba_loader_max_release_critical_path_runtime={max_runtime}",
+    )
+    workload = loader.get_next_workload(EventTime.zero())
+    released_job_graph_names = {
+        task_graph_name.split("@")[0] for task_graph_name in workload.task_graphs
+    }
+    assert len(released_job_graph_names) > 0, "No JobGraphs were released."
+    assert (
+        released_job_graph_names <= eligible_job_graph_names
+    ), "Incorrect JobGraphs released outside of the window."
+
+    loader = __create_alibaba_loader(
+        trace_path,
+        f"--alibaba_loader_min_release_critical_path_runtime={max_runtime}",
+        f"--alibaba_loader_max_release_critical_path_runtime={max_runtime}",
+    )
+    with pytest.raises(ValueError):
+        loader.get_next_workload(EventTime.zero())
@@ -0,0 +1,178 @@
+from dataclasses import asdict
+
+import pytest
+
+from data import CSVReader, EventLogReader, EventLogWriter
+
+
+def test_event_log_round_trip(tmp_path):
+    """Test that the events written by the EventLogWriter are read back."""
+    writer = EventLogWriter(str(tmp_path / "event_log"))
+    writer.log("TASK_RELEASE", 0, "T1", 0, 0, 0, 100, "id-1", "TG1", 50, "CPU,any,1")
+    writer.log("TASK_RELEASE", 10, "T2", 0, 10, 10, 110, "id-2", "TG1", 50, "")
+    writer.log("TASK_FINISHED", 60, "T1", 0, "TG1", 60, 100, "id-1")
+    writer.close()
+
+    reader = EventLogReader(str(tmp_path / "event_log"))
+    task_releases = reader.get_events("TASK_RELEASE")
+    assert len(task_releases) == 2, "Incorrect number of TASK_RELEASE events."
+    assert list(task_releases["release_time"]) == [0, 10], "Incorrect release times."
+    assert list(reader.get_strings("TASK_RELEASE", "name")) == [
+        "T1",
+        "T2",
+    ], "Incorrect names of the released tasks."
+    assert list(reader.get_strings("TASK_RELEASE", "task_graph")) == [
+        "TG1",
+        "TG1",
+    ], "Incorrect TaskGraphs of the released tasks."
+    assert list(reader.get_strings("TASK_RELEASE", "resources")) == [
+        "CPU,any,1",
+        "",
+    ], "Incorrect resources of the released tasks."
+    assert list(task_releases["sequence"]) == [0, 1], "Incorrect sequence numbers."
+    assert (
+        reader.get_strings("TASK_FINISHED", "task_id")[0] == "id-1"
+    ), "Incorrect ID of the finished task."
+    assert (
+        len(reader.get_events("TASK_PLACEMENT")) == 0
+    ), "Incorrect number of TASK_PLACEMENT events."
+
+    with pytest.raises(ValueError):
+        reader.get_events("TASK_UNKNOWN")
+    with pytest.raises(ValueError):
+        reader.get_strings("TASK_RELEASE", "deadline")
+
+
+def test_event_log_worker_pool_utilizations(tmp_path):
+    """Test that the utilizations are aggregated across the WorkerPools."""
+    writer = EventLogWriter(str(tmp_path / "event_log"))
+    writer.log("WORKER_POOL_UTILIZATION", 0, "WP1", "CPU", 1, 3)
+    writer.log("WORKER_POOL_UTILIZATION", 0, "WP2", "CPU", 2, 2)
+    writer.log("WORKER_POOL_UTILIZATION", 0, "WP2", "GPU", 1, 0)
+    writer.log("WORKER_POOL_UTILIZATION", 5, "WP1", "CPU", 0, 4)
+    writer.close()
+
+    stats = EventLogReader(str(tmp_path / "event_log")).get_worker_pool_utilizations()
+    assert [stat.simulator_time for stat in stats] == [0, 5], "Incorrect times."
+    assert stats[0].resource_utilizations == {
+        "CPU": (3.0, 5.0),
+        "GPU": (1.0, 0.0),
+    }, "Incorrect utilizations at time 0."
+    assert stats[1].resource_utilizations == {
+        "CPU": (0.0, 4.0)
+    }, "Incorrect utilizations at time 5."
+
+
+def test_event_log_chunked_writes(tmp_path):
+    """Test that the events written in chunks are read back in order, and that the
+    buffers are cleared after each chunk."""
+    writer = EventLogWriter(str(tmp_path / "event_log"), buffer_size=3)
+    for time in range(10):
+        writer.log("TASK_FINISHED", time, f"T{time}", 0, "TG1", time, 100, time)
+        if time == 4:
+            writer.flush()
+    assert (
+        len(writer._events["TASK_FINISHED"]) < 3
+    ), "The buffered events were not cleared."
+    writer.close()
+    writer.close()
+    writer.flush()
+
+    reader = EventLogReader(str(tmp_path / "event_log"))
+    task_finishes = reader.get_events("TASK_FINISHED")
+    assert list(task_finishes["time"]) == list(range(10)), "Incorrect times."
+    assert list(reader.get_strings("TASK_FINISHED", "name")) == [
+        f"T{time}" for time in range(10)
+    ], "Incorrect names of the finished tasks."
+    assert (
+        len(reader.get_events("TASK_RELEASE")) == 0
+    ), "Incorrect number of TASK_RELEASE events."
+    assert not any(
+        path.name.endswith(".part") for path in (tmp_path / "event_log").iterdir()
+    ), "The partial files were not removed."
+
+
+def test_event_log_reader_matches_csv_reader(tmp_path):
+    """Test that the Simulator run replayed from the binary log is identical to the
+    one parsed by the CSVReader from the corresponding CSV."""
+    events = [
+        ("SIMULATOR_START", 0),
+        ("WORKER_POOL", 0, "WP1", "wp-1", "CPU,cpu-1,5.0,CPU,cpu-2,5.0"),
+        ("UPDATE_WORKLOAD", 0, 2, 2),
+        ("TASK_GRAPH_RELEASE", 0, 0, 100, "TG1", 2, 50),
+        ("TASK_GRAPH_RELEASE", 0, 0, 20, "TG2", 1, 10),
+        ("TASK_RELEASE", 0, "T1", 0, 0, 0, 60, "id-1", "TG1", 30, "CPU,any,5.0"),
+        ("TASK_RELEASE", 0, "T3", 0, -1, 0, 20, "id-3", "TG2", 10, "CPU,any,5.0"),
+        ("SCHEDULER_START", 0, 2, 0),
+        ("WORKER_POOL_UTILIZATION", 0, "wp-1", "CPU", 0.0, 10.0),
+        ("TASK_SKIP", 0, "T3", "TG2", 0, "id-3"),
+        ("TASK_SCHEDULED", 0, "T1", "TG1", 0, "id-1", 60, 1, "wp-1", 30),
+        ("SCHEDULER_FINISHED", 1, 1, 1, 1, 1),
+        ("TASK_PLACEMENT", 1, "T1", "TG1", 0, "id-1", "wp-1", 30, "CPU,cpu-1,5.0"),
+        ("WORKER_POOL_UTILIZATION", 1, "wp-1", "CPU", 5.0, 5.0),
+        ("TASK_PREEMPT", 10, "T1", 0, "id-1"),
+        ("TASK_PLACEMENT", 15, "T1", "TG1", 0, "id-1", "wp-1", 30, "CPU,cpu-2,5.0"),
+        ("TASK_CANCEL", 25, "T3", 0, "id-3", "TG2", 10),
+        ("TASK_FINISHED", 70, "T1", 0, "TG1", 70, 60, "id-1"),
+        ("MISSED_DEADLINE", 70, "T1", 0, 60, "id-1"),
+        ("TASK_RELEASE", 70, "T2", 0, 70, 70, 100, "id-2", "TG1", 20, "CPU,any,5.0"),
+        ("TASK_PLACEMENT", 70, "T2", "TG1", 0, "id-2", "wp-1", 20, "CPU,cpu-1,5.0"),
+        ("TASK_FINISHED", 90, "T2", 0, "TG1", 90, 100, "id-2"),
+        ("TASK_GRAPH_FINISHED", 90, "TG1", 100, 0),
+        ("SIMULATOR_END", 100, 2, 1, 1, 1, 1, 0),
+    ]
+    csv_path = str(tmp_path / "run.csv")
+    event_log_path = str(tmp_path / "event_log")
+    writer = EventLogWriter(event_log_path)
+    with open(csv_path, "w") as csv_file:
+        for event_type, time, *values in events:
+            csv_file.write(",".join(map(str, (time, event_type, *values))) + "\n")
+            writer.log(event_type, time, *values)
+    writer.close()
+
+    csv_reader = CSVReader(csv_paths=[csv_path, event_log_path])
+    reader = EventLogReader(event_log_path)
+    tasks = reader.get_tasks()
+    assert [task.task_id for task in tasks] == [
+        "id-1",
+        "id-3",
+        "id-2",
+    ], "Incorrect tasks."
+    assert [asdict(task) for task in tasks] == [
+        asdict(task) for task in csv_reader.get_tasks(csv_path)
+    ], "Incorrect tasks compared to the CSV."
+    assert [asdict(task) for task in csv_reader.get_tasks(event_log_path)] == [
+        asdict(task) for task in tasks
+    ], "Incorrect tasks read by the CSVReader from the event log."
+    assert [placement.completion_time for placement in tasks[0].placements] == [
+        10,
+        70,
+    ], "Incorrect completion times of the placements."
+    assert (
+        tasks[0].placements[1].resources_used[0].id == "cpu-2"
+    ), "Incorrect resources."
+    assert tasks[1].skipped_times == [0] and tasks[1].cancelled, "Incorrect T3."
+    assert {
+        name: asdict(task_graph) for name, task_graph in reader.get_task_graph().items()
+    } == {
+        name: asdict(task_graph)
+        for name, task_graph in csv_reader.get_task_graph(csv_path).items()
+    }, "Incorrect TaskGraphs compared to the CSV."
+    assert [
+        (vars(scheduler) | {"task_placements": scheduler.task_placements[0].task_id})
+        for scheduler in reader.get_scheduler_invocations()
+    ] == [
+        (vars(scheduler) | {"task_placements": scheduler.task_placements[0].task_id})
+        for scheduler in csv_reader.get_scheduler_invocations(csv_path)
+    ], "Incorrect scheduler invocations compared to the CSV."
+    assert [asdict(worker_pool) for worker_pool in reader.get_worker_pools()] == [
+        asdict(worker_pool) for worker_pool in csv_reader.get_worker_pools(csv_path)
+    ], "Incorrect WorkerPools compared to the CSV."
+    utilizations = csv_reader.get_worker_pool_utilizations(csv_path)
+    assert (
+        reader.get_worker_pool_utilizations() == utilizations
+    ), "Incorrect utilizations compared to the CSV."
+    assert (
+        reader.get_simulator_end_time() == csv_reader.get_simulator_end_time(csv_path)
+        and reader.get_goodput() == csv_reader.get_goodput(csv_path) == 1
+    ), "Incorrect end of the simulation."
@@ -742,6 +742,74 @@ def test_job_graph_to_task_graph_conversion():
     ), "Incorrect number of children."
 
 
+def test_job_graph_template():
+    """Tests that the Template of a JobGraph reflects its structure, and is shared by
+    the TaskGraphs generated from it until the structure of the JobGraph changes."""
+    jobs = [
+        Job(
+            name=name,
+            profile=WorkProfile(
+                name=f"{name}_Work_Profile",
+                execution_strategies=ExecutionStrategies(
+                    strategies=[
+                        ExecutionStrategy(
+                            resources=Resources(),
+                            batch_size=1,
+                            runtime=EventTime(runtime, EventTime.Unit.US),
+                        )
+                    ]
+                ),
+            ),
+        )
+        for name, runtime in (
+            ("Camera", 100),
+            ("Detection", 300),
+            ("Tracking", 200),
+            ("Planning", 100),
+        )
+    ]
+    camera_job, detection_job, tracking_job, planning_job = jobs
+    job_graph = JobGraph(
+        name="test_job_graph",
+        jobs={
+            camera_job: [detection_job, tracking_job],
+            detection_job: [planning_job],
+            tracking_job: [planning_job],
+        },
+    )
+    template = job_graph.template
+    assert template.jobs == (
+        camera_job,
+        detection_job,
+        tracking_job,
+        planning_job,
+    ), "Incorrect order of the Jobs in the template."
+    assert list(template.children_offsets) == [0, 2, 3, 4, 4], "Incorrect offsets."
+    assert list(template.children) == [1, 2, 3, 3], "Incorrect children."
+    assert list(template.generation_order) == [0, 1, 2, 3], "Incorrect order."
+    assert template.is_source == (True, False, False, False), "Incorrect sources."
+    assert template.critical_path_time == EventTime(
+        500, EventTime.Unit.US
+    ), "Incorrect critical path time."
+    assert job_graph.template is template, "The template should be cached."
+
+    # Generate a TaskGraph, and check that it has the structure of the JobGraph.
+    task_graph = job_graph.get_next_task_graph(EventTime(10, EventTime.Unit.US))
+    assert len(task_graph) == 4, "Incorrect number of tasks in `TaskGraph`."
+    assert {(parent.job, child.job) for parent, child in task_graph.get_edges()} == set(
+        job_graph.get_edges()
+    ), "Incorrect edges in `TaskGraph`."
+    assert [task.release_time for task in task_graph.get_nodes()] == [
+        EventTime(10, EventTime.Unit.US),
+        *[EventTime(-1, EventTime.Unit.US)] * 3,
+    ], "Incorrect release times of the Tasks."
+
+    # Change the structure of the JobGraph, and check that the template is updated.
+    job_graph.add_child(camera_job, planning_job)
+    assert job_graph.template is not template, "The template should be rebuilt."
+    assert list(job_graph.template.children) == [1, 2, 3, 3, 3], "Incorrect children."
+
+
 def test_periodic_release_policy():
     """Tests that a JobGraph correctly releases TaskGraphs according
     to the periodic release policy."""
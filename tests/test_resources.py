@@ -436,6 +436,58 @@ def test_resources_get_allocated_quantity():
     ), "Incorrect quantity of allocated GPU resources."
 
 
+def test_resources_quantities_with_any_and_specific_instances():
+    """Test that the quantities of a mix of generic and specific resource instances
+    are correctly maintained across allocations, deallocations and additions."""
+    cpu_resource_1 = Resource(name="CPU")
+    cpu_resource_any = Resource(name="CPU", _id="any")
+    gpu_resource_1 = Resource(name="GPU")
+    resources = Resources({cpu_resource_1: 4, cpu_resource_any: 2})
+    resources.add_resource(gpu_resource_1, 3)
+
+    task_1 = create_default_task()
+    task_2 = create_default_task()
+    resources.allocate(cpu_resource_any, task_1, 5)
+    resources.allocate(gpu_resource_1, task_2, 1)
+    assert (
+        resources.get_available_quantity(cpu_resource_any) == 1
+    ), "Incorrect quantity of available CPU resources."
+    assert (
+        resources.get_available_quantity(cpu_resource_1) == 1
+    ), "Incorrect quantity of available CPU resources for the specific instance."
+    assert (
+        resources.get_total_quantity(cpu_resource_1) == 6
+    ), "Incorrect total quantity of CPU resources for the specific instance."
+    assert resources.get_allocated_computation(cpu_resource_any) == [
+        (task_1, 4),
+        (task_1, 1),
+    ], "Incorrect allocations of the CPU resources."
+    assert resources.get_allocated_computation(gpu_resource_1) == [
+        (task_2, 1)
+    ], "Incorrect allocations of the GPU resource."
+
+    combined_resources = resources + Resources({gpu_resource_1: 1})
+    assert (
+        combined_resources.get_available_quantity(Resource(name="GPU", _id="any")) == 3
+    ), "Incorrect quantity of available GPU resources after addition."
+    assert combined_resources.get_allocated_computation(gpu_resource_1) == [
+        (task_2, 1)
+    ], "Incorrect allocations of the GPU resource after addition."
+
+    resources.deallocate(task_1)
+    assert (
+        resources.get_available_quantity(cpu_resource_any) == 6
+    ), "Incorrect quantity of available CPU resources after deallocation."
+    assert (
+        resources.get_allocated_computation(cpu_resource_any) == []
+    ), "The deallocated Task is still allocated the CPU resources."
+    assert resources.get_unique_resource_types() == {
+        cpu_resource_any: 6,
+        Resource(name="GPU", _id="any"): 3,
+    }, "Incorrect unique resource types."
+    assert not resources.empty(), "The Resources should not be empty."
+
+
 def test_resources_addition():
     """Test that the addition of two Resources works correctly."""
     # Construct the first set of Resources, and allocate some to a task.
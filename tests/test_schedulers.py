@@ -1,4 +1,11 @@
-from schedulers import BranchPredictionScheduler, EDFScheduler, LSFScheduler
+import pytest
+
+from schedulers import (
+    BranchPredictionScheduler,
+    EDFScheduler,
+    LSFScheduler,
+    load_scheduler,
+)
 from tests.utils import create_default_task
 from utils import EventTime
 from workers import Worker, WorkerPool, WorkerPools
@@ -12,6 +19,14 @@ from workload import (
 )
 
 
+def test_load_scheduler():
+    """Test that the schedulers are retrieved from the registry by their name."""
+    assert load_scheduler("EDF") is EDFScheduler, "Incorrect scheduler loaded."
+    assert load_scheduler("LSF") is LSFScheduler, "Incorrect scheduler loaded."
+    with pytest.raises(ValueError):
+        load_scheduler("Unknown")
+
+
 def test_edf_scheduler_success():
     """Scenario:
 
@@ -258,6 +273,66 @@ def test_edf_scheduler_preemptive_higher_priority():
     ].is_placed(), "Incorrect placement of the low priority task."
 
 
+def test_edf_scheduler_failure_rolls_back(monkeypatch):
+    """Scenario:
+
+    Preemptive EDF scheduler fails midway through placing the tasks, and leaves the
+    WorkerPools in the state that they were in before the scheduler was invoked.
+    """
+    edf_scheduler = EDFScheduler(preemptive=True)
+
+    # Create the tasks and the TaskGraph.
+    task_lower_priority = create_default_task(name="task_low_priority", deadline=200)
+    task_lower_priority.release(EventTime(1, EventTime.Unit.US))
+    task_higher_priority = create_default_task(name="task_high_priority", deadline=50)
+    task_higher_priority.release(EventTime(1, EventTime.Unit.US))
+    task_graph = TaskGraph(
+        name="TestTaskGraph", tasks={task_lower_priority: [], task_higher_priority: []}
+    )
+    workload = Workload.from_task_graphs({"TestTaskGraph": task_graph})
+
+    # Create the WorkerPool, and place the lower priority task on it.
+    worker = Worker(
+        name="Worker",
+        resources=Resources({Resource(name="CPU"): 2, Resource(name="GPU"): 2}),
+    )
+    worker_pool = WorkerPool(name="WorkerPool", workers=[worker])
+    worker_pool.place_task(task_lower_priority)
+
+    # Fail the scheduler after it tentatively places the first task.
+    place_task = WorkerPool.place_task
+
+    def failing_place_task(self, task, *args, **kwargs):
+        place_task(self, task, *args, **kwargs)
+        raise RuntimeError("Failed to place the task.")
+
+    monkeypatch.setattr(WorkerPool, "place_task", failing_place_task)
+    with pytest.raises(RuntimeError):
+        edf_scheduler.schedule(
+            EventTime(1, EventTime.Unit.US),
+            workload=workload,
+            worker_pools=WorkerPools([worker_pool]),
+        )
+    monkeypatch.undo()
+
+    assert worker_pool.get_placed_tasks() == [
+        task_lower_priority
+    ], "The WorkerPool was not restored after the failure."
+    assert worker.get_placed_tasks() == [
+        task_lower_priority
+    ], "The Worker was not restored after the failure."
+
+    # The WorkerPools can be scheduled on again after the failure.
+    placements = edf_scheduler.schedule(
+        EventTime(1, EventTime.Unit.US),
+        workload=workload,
+        worker_pools=WorkerPools([worker_pool]),
+    )
+    assert (
+        len(placements.get_placements(task_higher_priority)) == 1
+    ), "The task was not found in placements."
+
+
 def test_lsf_scheduler_success():
     """Scenario:
 
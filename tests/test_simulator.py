@@ -1,10 +1,18 @@
+import json
 from typing import Optional, Sequence
 
 import pytest
 
 from data import BaseWorkloadLoader
 from schedulers import BaseScheduler
-from simulator import Event, EventQueue, EventType, Simulator
+from simulator import (
+    Event,
+    EventQueue,
+    EventType,
+    HandlerProfiler,
+    Simulator,
+    TaskCompletionQueue,
+)
 from tests.utils import create_default_task
 from utils import EventTime
 from workers import Worker, WorkerPool, WorkerPools
@@ -158,6 +166,208 @@ def test_event_queue_two():
     ), "Incorrect event returned by the queue."
 
 
+def test_event_queue_remove_event():
+    """Test that an EventQueue correctly removes events from the queue."""
+    event_queue = EventQueue()
+    scheduler_start = Event(
+        event_type=EventType.SCHEDULER_START, time=EventTime(1, EventTime.Unit.US)
+    )
+    scheduler_finished = Event(
+        event_type=EventType.SCHEDULER_FINISHED, time=EventTime(2, EventTime.Unit.US)
+    )
+    event_queue.add_event(scheduler_start)
+    event_queue.add_event(scheduler_finished)
+
+    event_queue.remove_event(scheduler_start)
+    assert len(event_queue) == 1, "Incorrect number of events in the queue."
+    assert event_queue.peek() == scheduler_finished, "Incorrect event peeked."
+    assert (
+        event_queue.get_next_event_of_type(EventType.SCHEDULER_START) is None
+    ), "Removed event returned by the queue."
+    with pytest.raises(ValueError):
+        event_queue.remove_event(scheduler_start)
+    assert event_queue.next() == scheduler_finished, "Incorrect event returned."
+    assert len(event_queue) == 0, "Incorrect number of events in the queue."
+    assert event_queue.peek() is None, "Incorrect event peeked."
+
+
+def test_event_queue_next_event_of_type():
+    """Test that an EventQueue returns the earliest event of the given type."""
+    event_queue = EventQueue()
+    task_release_events = []
+    for time in (5, 3, 4):
+        task_release_events.append(
+            Event(
+                event_type=EventType.TASK_RELEASE,
+                time=EventTime(time, EventTime.Unit.US),
+                task=create_default_task(),
+            )
+        )
+        event_queue.add_event(task_release_events[-1])
+    event_queue.add_event(
+        Event(
+            event_type=EventType.SCHEDULER_START, time=EventTime(1, EventTime.Unit.US)
+        )
+    )
+
+    assert (
+        event_queue.get_next_event_of_type(EventType.TASK_RELEASE)
+        == task_release_events[1]
+    ), "Incorrect event of type TASK_RELEASE returned."
+    assert (
+        event_queue.get_next_event_of_type(EventType.UPDATE_WORKLOAD) is None
+    ), "Incorrect event of type UPDATE_WORKLOAD returned."
+
+    event_queue.remove_event(task_release_events[1])
+    assert (
+        event_queue.get_next_event_of_type(EventType.TASK_RELEASE)
+        == task_release_events[2]
+    ), "Incorrect event of type TASK_RELEASE returned."
+    assert (
+        event_queue.next().event_type == EventType.SCHEDULER_START
+    ), "Incorrect event returned by the queue."
+    assert event_queue.next() == task_release_events[2], "Incorrect event returned."
+    assert (
+        event_queue.get_next_event_of_type(EventType.TASK_RELEASE)
+        == task_release_events[0]
+    ), "Incorrect event of type TASK_RELEASE returned."
+
+
+def test_event_queue_update_event_time():
+    """Test that an EventQueue correctly reorders events whose time changed."""
+    event_queue = EventQueue()
+    scheduler_start = Event(
+        event_type=EventType.SCHEDULER_START, time=EventTime(10, EventTime.Unit.US)
+    )
+    update_workload = Event(
+        event_type=EventType.UPDATE_WORKLOAD, time=EventTime(5, EventTime.Unit.US)
+    )
+    event_queue.add_event(scheduler_start)
+    event_queue.add_event(update_workload)
+
+    event_queue.update_event_time(scheduler_start, EventTime(2, EventTime.Unit.US))
+    assert len(event_queue) == 2, "Incorrect number of events in the queue."
+    assert scheduler_start.time == EventTime(
+        2, EventTime.Unit.US
+    ), "Incorrect time of the updated event."
+    assert event_queue.next() == scheduler_start, "Incorrect event returned."
+    assert event_queue.next() == update_workload, "Incorrect event returned."
+    assert len(event_queue) == 0, "Incorrect number of events in the queue."
+
+
+def test_event_queue_bounded_heaps():
+    """Test that an EventQueue compacts the entries left behind by the popped and
+    removed events in the heaps of the types that are never queried."""
+    event_queue = EventQueue()
+    for time in range(10000):
+        event_queue.add_event(
+            Event(
+                event_type=EventType.SCHEDULER_START,
+                time=EventTime(time, EventTime.Unit.US),
+            )
+        )
+        assert (
+            event_queue.next().event_type == EventType.SCHEDULER_START
+        ), "Incorrect event returned by the queue."
+    assert (
+        len(event_queue._event_type_queues[EventType.SCHEDULER_START.value]) <= 128
+    ), "The secondary heap was not compacted."
+    for time in range(10000):
+        scheduler_finished = Event(
+            event_type=EventType.SCHEDULER_FINISHED,
+            time=EventTime(time, EventTime.Unit.US),
+        )
+        event_queue.add_event(scheduler_finished)
+        event_queue.remove_event(scheduler_finished)
+    assert len(event_queue) == 0, "Incorrect number of events in the queue."
+    assert len(event_queue._event_queue) <= 128, "The primary heap was not compacted."
+    for event_type_queue in event_queue._event_type_queues.values():
+        assert len(event_type_queue) <= 128, "The secondary heap was not compacted."
+
+
+def test_event_queue_reheapify():
+    """Test that an EventQueue respects in-place changes after a reheapify."""
+    event_queue = EventQueue()
+    scheduler_start = Event(
+        event_type=EventType.SCHEDULER_START, time=EventTime(10, EventTime.Unit.US)
+    )
+    update_workload = Event(
+        event_type=EventType.UPDATE_WORKLOAD, time=EventTime(5, EventTime.Unit.US)
+    )
+    event_queue.add_event(scheduler_start)
+    event_queue.add_event(update_workload)
+
+    scheduler_start._time = EventTime(2, EventTime.Unit.US)
+    event_queue.reheapify()
+    assert event_queue.peek() == scheduler_start, "Incorrect event peeked."
+    assert (
+        event_queue.get_next_event_of_type(EventType.SCHEDULER_START) == scheduler_start
+    ), "Incorrect event of type SCHEDULER_START returned."
+
+
+def test_task_completion_queue():
+    """Test that a TaskCompletionQueue returns tasks by their completion time."""
+    completion_queue = TaskCompletionQueue()
+    task_one = create_default_task(name="Task_One")
+    task_two = create_default_task(name="Task_Two")
+    task_three = create_default_task(name="Task_Three")
+    completion_queue.add_task(task_one, EventTime(5, EventTime.Unit.US))
+    completion_queue.add_task(task_two, EventTime(3, EventTime.Unit.US))
+    completion_queue.add_task(task_three, EventTime(4, EventTime.Unit.US))
+    assert len(completion_queue) == 3, "Incorrect number of tasks in the queue."
+    assert completion_queue.peek_time() == EventTime(
+        3, EventTime.Unit.US
+    ), "Incorrect earliest completion time."
+
+    completion_queue.remove_task(task_two)
+    assert task_two not in completion_queue, "Removed task found in the queue."
+    assert completion_queue.peek_time() == EventTime(
+        4, EventTime.Unit.US
+    ), "Incorrect earliest completion time."
+    with pytest.raises(ValueError):
+        completion_queue.remove_task(task_two)
+
+    # Update the completion time of a task already in the queue.
+    completion_queue.add_task(task_three, EventTime(6, EventTime.Unit.US))
+    assert completion_queue.pop_completed_tasks(EventTime(5, EventTime.Unit.US)) == [
+        task_one
+    ], "Incorrect tasks completed."
+    assert len(completion_queue) == 1, "Incorrect number of tasks in the queue."
+    assert (
+        completion_queue.pop_completed_tasks(EventTime(5, EventTime.Unit.US)) == []
+    ), "Incorrect tasks completed."
+    assert completion_queue.pop_completed_tasks(EventTime(6, EventTime.Unit.US)) == [
+        task_three
+    ], "Incorrect tasks completed."
+    assert completion_queue.peek_time() is None, "Incorrect earliest completion time."
+
+
+def test_handler_profiler(tmp_path):
+    """Test that the HandlerProfiler summarizes the recorded invocations."""
+    profiler = HandlerProfiler()
+    profiler.record("event.TASK_RELEASE", 500)
+    profiler.record("event.TASK_RELEASE", 3000)
+    profiler.record("scheduler.schedule", 10000)
+    with profiler.measure("simulator.step"):
+        pass
+
+    summary = profiler.to_dict()
+    assert list(summary.keys())[0] == "scheduler.schedule", "Incorrect order."
+    assert summary["event.TASK_RELEASE"]["count"] == 2, "Incorrect count."
+    assert summary["event.TASK_RELEASE"]["total_us"] == 3.5, "Incorrect total."
+    assert summary["event.TASK_RELEASE"]["max_us"] == 3.0, "Incorrect maximum."
+    assert summary["event.TASK_RELEASE"]["histogram_us"] == [
+        [1, 1],
+        [4, 1],
+    ], "Incorrect histogram."
+    assert summary["simulator.step"]["count"] == 1, "Incorrect count."
+
+    profiler.dump(str(tmp_path / "profile.json"))
+    with open(tmp_path / "profile.json", "r") as profile_file:
+        assert json.load(profile_file) == summary, "Incorrect profile written."
+    assert "event.TASK_RELEASE" in profiler.format_table(), "Section not found."
+
+
 def test_simulator_construction():
     """Test that a simulator can be correctly constructed."""
     worker_pool = __create_default_worker_pool()
@@ -354,6 +564,58 @@ def test_simulator_step():
     assert next_event.event_type == EventType.TASK_FINISHED, "Incorrect event type."
 
 
+def test_simulator_step_event_driven():
+    """Test that the event-driven execution only finishes the completed tasks."""
+    worker_pool = __create_default_worker_pool()
+    simulator = Simulator(
+        worker_pools=WorkerPools([worker_pool]),
+        scheduler=MockScheduler(runtime=EventTime(5, EventTime.Unit.US), placement=[]),
+        workload_loader=MockWorkloadLoader(Workload.empty()),
+    )
+    simulator._event_driven_execution = True
+
+    # Create, release and place two Tasks with different runtimes.
+    tasks = []
+    for name, runtime in (("Task_Short", 3), ("Task_Long", 5)):
+        task = create_default_task(name=name, runtime=runtime)
+        task.release(EventTime(0, EventTime.Unit.US))
+        task.schedule(
+            EventTime(0, EventTime.Unit.US),
+            Placement.create_task_placement(
+                task=task,
+                worker_pool_id=worker_pool.id,
+                placement_time=EventTime(0, EventTime.Unit.US),
+                execution_strategy=task.available_execution_strategies[0],
+            ),
+        )
+        worker_pool.place_task(task)
+        task.start(EventTime(0, EventTime.Unit.US))
+        simulator._Simulator__track_task_completion(
+            task, EventTime(0, EventTime.Unit.US)
+        )
+        tasks.append(task)
+
+    assert simulator._Simulator__get_minimum_task_remaining_time() == EventTime(
+        3, EventTime.Unit.US
+    ), "Incorrect minimum remaining time."
+    simulator._Simulator__step(step_size=EventTime(2, EventTime.Unit.US))
+    assert len(simulator._event_queue) == 3, "Incorrect number of events."
+    simulator._Simulator__step(step_size=EventTime(1, EventTime.Unit.US))
+    assert len(simulator._event_queue) == 4, "Incorrect number of events."
+    assert tasks[0].remaining_time == EventTime.zero(), "Incorrect remaining time."
+
+    # The remaining time of the long task is computed on demand without stepping it.
+    assert tasks[1].remaining_time == EventTime(
+        2, EventTime.Unit.US
+    ), "Incorrect remaining time."
+    assert tasks[1]._remaining_time == EventTime(
+        5, EventTime.Unit.US
+    ), "The long task was stepped."
+    assert simulator._Simulator__get_minimum_task_remaining_time() == EventTime(
+        2, EventTime.Unit.US
+    ), "Incorrect minimum remaining time."
+
+
 def test_simulator_handle_event():
     """Test the Simulator's handle_event method with different events."""
     worker_pool = __create_default_worker_pool()
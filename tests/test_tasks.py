@@ -1,3 +1,5 @@
+import logging
+
 import pytest
 
 from tests.utils import create_default_task
@@ -19,6 +21,17 @@ def test_successful_conditional_task_creation():
     assert default_task.conditional, "Incorrect conditionality for Task."
 
 
+def test_tasks_share_logger():
+    """Test that the Tasks created without a logger do not set up one of their own."""
+    num_loggers = len(logging.Logger.manager.loggerDict)
+    task_1 = create_default_task(name="Perception_Task_1", timestamp=1)
+    task_2 = create_default_task(name="Perception_Task_2", timestamp=2)
+    assert task_1._logger is task_2._logger, "The Tasks do not share a logger."
+    assert (
+        len(logging.Logger.manager.loggerDict) <= num_loggers + 1
+    ), "Loggers were set up for the individual Tasks."
+
+
 def test_successful_task_release():
     """Test that release() transitions the task to a RELEASED state."""
     default_task = create_default_task()
@@ -851,6 +864,78 @@ def test_task_graph_complete():
     assert task_graph.is_complete(), "Task Graph should be complete."
 
 
+def test_task_graph_structure_cache_invalidation():
+    """Test that the cached structural queries and the completion, cancellation and
+    termination of the TaskGraph are updated upon changes to the TaskGraph and the
+    Tasks."""
+    perception_task = create_default_task(job=Job(name="Perception"), timestamp=0)
+    prediction_task = create_default_task(job=Job(name="Prediction"), timestamp=0)
+    planning_task = create_default_task(job=Job(name="Planning"), timestamp=0)
+    control_task = create_default_task(job=Job(name="Control"), timestamp=0)
+    task_graph = TaskGraph(
+        name="TestTaskGraph",
+        tasks={perception_task: [prediction_task], prediction_task: []},
+    )
+    assert task_graph.get_sources() == [perception_task], "Incorrect sources."
+    assert task_graph.get_sink_tasks() == [prediction_task], "Incorrect sinks."
+    assert task_graph.get_node_depth(prediction_task) == 2, "Incorrect depth."
+    assert not task_graph.is_complete(), "Task Graph should not be complete."
+
+    # Extend the TaskGraph, and ensure that the queries reflect the new structure.
+    task_graph.add_task(planning_task)
+    task_graph.add_child(prediction_task, planning_task)
+    task_graph.add_task(control_task)
+    assert task_graph.get_sources() == [
+        perception_task,
+        control_task,
+    ], "Incorrect sources."
+    assert task_graph.get_sink_tasks() == [
+        planning_task,
+        control_task,
+    ], "Incorrect sinks."
+    assert task_graph.get_node_depth(planning_task) == 3, "Incorrect depth."
+    assert task_graph.topological_sort().index(
+        prediction_task
+    ) < task_graph.topological_sort().index(planning_task), "Incorrect ordering."
+
+    # Transition the sink Tasks, and ensure that the TaskGraph tracks their states.
+    assert not task_graph.is_cancelled(), "Task Graph should not be cancelled."
+    assert not task_graph.is_terminated(), "Task Graph should not be terminated."
+    control_task.cancel(EventTime.zero())
+    assert task_graph.is_cancelled(), "Task Graph should be cancelled."
+    assert not task_graph.is_terminated(), "Task Graph should not be terminated."
+    assert not task_graph.is_complete(), "Task Graph should not be complete."
+    for task in (perception_task, prediction_task, planning_task):
+        task.release(EventTime.zero())
+        task.schedule(
+            EventTime.zero(),
+            Placement.create_task_placement(
+                task=task,
+                worker_pool_id=None,
+                placement_time=EventTime.zero(),
+                execution_strategy=task.available_execution_strategies[0],
+            ),
+        )
+        task.start(EventTime.zero())
+        task.update_remaining_time(EventTime.zero())
+        task.finish(EventTime(1, EventTime.Unit.US))
+    assert not task_graph.is_complete(), "Task Graph should not be complete."
+    assert task_graph.is_terminated(), "Task Graph should be terminated."
+
+    # Remove the cancelled sink Task from the TaskGraph.
+    task_graph.remove(control_task)
+    assert not task_graph.is_cancelled(), "Task Graph should not be cancelled."
+    assert task_graph.is_complete(), "Task Graph should be complete."
+    assert task_graph.get_sources() == [perception_task], "Incorrect sources."
+    assert task_graph.is_terminated(), "Task Graph should be terminated."
+
+    # Extend the TaskGraph with a new Task, which has not been terminated yet.
+    task_graph.add_child(
+        planning_task, create_default_task(job=Job(name="Control"), timestamp=1)
+    )
+    assert not task_graph.is_terminated(), "Task Graph should not be terminated."
+
+
 def test_conditional_task_graph_complete():
     """Test that the is_complete method works correctly with conditionals."""
     # Create the individual tasks.
@@ -1023,6 +1108,45 @@ def test_task_find():
     }, "Incorrect tasks retrieved by the TaskGraph."
 
 
+def test_task_graph_get_task():
+    """Test that the get_task method retrieves the Tasks by their (unique) names as
+    the Tasks are added to and removed from the TaskGraph."""
+    perception_task = create_default_task(job=Job(name="Perception"))
+    prediction_task = create_default_task(job=Job(name="Prediction"))
+    planning_task = create_default_task(job=Job(name="Planning"))
+    task_graph = TaskGraph(
+        name="TestTaskGraph", tasks={perception_task: [prediction_task]}
+    )
+    assert (
+        task_graph.get_task("Perception_Task") == perception_task
+    ), "Incorrect Task retrieved by the TaskGraph."
+    assert (
+        task_graph.get_task("Prediction_Task@TestTaskGraph", unique=True)
+        == prediction_task
+    ), "Incorrect Task retrieved by the TaskGraph."
+    assert (
+        task_graph.get_task("Prediction_Task@TestTaskGraph") is None
+    ), "The unique name should not be matched unless requested."
+    assert task_graph.get_task("Planning_Task") is None, "Task should not be found."
+
+    # Add a Task as a child, and remove a Task from the TaskGraph.
+    task_graph.add_child(prediction_task, planning_task)
+    task_graph.remove(perception_task)
+    assert (
+        task_graph.get_task("Planning_Task") == planning_task
+    ), "Incorrect Task retrieved by the TaskGraph."
+    assert task_graph.get_task("Perception_Task") is None, "Task should be removed."
+    assert len(task_graph.find("Perception_Task")) == 0, "Task should be removed."
+
+    # Add another Task with the same name.
+    task_graph.add_task(
+        create_default_task(job=Job(name="Planning"), timestamp=1), [planning_task]
+    )
+    assert len(task_graph.find("Planning_Task")) == 2, "Incorrect number of Tasks."
+    with pytest.raises(ValueError):
+        task_graph.get_task("Planning_Task")
+
+
 def test_task_time_dilation():
     # Create the individual tasks.
     localization_task_0 = create_default_task(
@@ -144,3 +144,27 @@ def test_time_comparisons():
     assert test_time_us < test_time_ms, "Incorrect < comparison."
     assert test_time_ms > test_time_us, "Incorrect > comparison."
     assert test_time_ms != test_time_us, "Incorrect != comparison."
+    assert test_time_us <= test_time_ms, "Incorrect <= comparison."
+    assert test_time_ms >= EventTime(
+        2000, EventTime.Unit.US
+    ), "Incorrect >= comparison."
+
+
+def test_time_hash():
+    """Test that equal EventTimes across units have the same hash."""
+    test_time_ms = EventTime(2, EventTime.Unit.MS)
+    test_time_us = EventTime(2000, EventTime.Unit.US)
+    assert hash(test_time_ms) == hash(test_time_us), "Incorrect hash."
+    assert len({test_time_ms, test_time_us}) == 1, "Incorrect set membership."
+
+
+def test_time_zero_and_invalid():
+    """Test that the zero and invalid EventTimes are shared and immutable."""
+    assert EventTime.zero() is EventTime.zero(), "A new zero EventTime was created."
+    assert EventTime.invalid() is EventTime.invalid(), "A new EventTime was created."
+    assert EventTime.invalid().is_invalid(), "Incorrect invalid EventTime."
+
+    test_time = EventTime.zero()
+    test_time += EventTime(5, EventTime.Unit.US)
+    assert test_time == EventTime(5, EventTime.Unit.US), "Incorrect addition."
+    assert EventTime.zero().time == 0, "The zero EventTime was modified."
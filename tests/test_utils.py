@@ -0,0 +1,44 @@
+import pytest
+
+from utils import BufferedCSVWriter, setup_csv_logging
+
+
+def test_buffered_csv_writer_buffers_rows(tmp_path):
+    """Test that the rows are only written once the buffer fills up."""
+    csv_file = tmp_path / "test.csv"
+    writer = BufferedCSVWriter(log_file=str(csv_file), buffer_size=3)
+    writer.debug("0,SIMULATOR_START")
+    writer.info("%s,UPDATE_WORKLOAD,%s,%s", 0, 1, 2)
+    assert csv_file.read_text() == "", "The rows were written before the flush."
+
+    writer.debug("5,TASK_RELEASE,task,5")
+    assert csv_file.read_text() == (
+        "0,SIMULATOR_START\n0,UPDATE_WORKLOAD,1,2\n5,TASK_RELEASE,task,5\n"
+    ), "Incorrect rows written once the buffer filled up."
+
+    writer.debug("10,SIMULATOR_END")
+    writer.close()
+    assert csv_file.read_text().endswith(
+        "5,TASK_RELEASE,task,5\n10,SIMULATOR_END\n"
+    ), "The buffered rows were not written when the writer was closed."
+
+
+def test_buffered_csv_writer_invalid_buffer_size(tmp_path):
+    """Test that the writer cannot be constructed with an empty buffer."""
+    with pytest.raises(ValueError):
+        BufferedCSVWriter(log_file=str(tmp_path / "test.csv"), buffer_size=0)
+
+
+def test_setup_csv_logging_buffered(tmp_path):
+    """Test that a BufferedCSVWriter is set up if a buffer size is given."""
+    writer = setup_csv_logging(
+        name="test_setup_csv_logging_buffered",
+        log_dir=str(tmp_path),
+        log_file="test.csv",
+        buffer_size=10,
+    )
+    assert isinstance(writer, BufferedCSVWriter), "Incorrect CSV logger type."
+    writer.debug("0,SIMULATOR_START")
+    writer.flush()
+    assert (tmp_path / "test.csv").read_text() == "0,SIMULATOR_START\n"
+    writer.close()
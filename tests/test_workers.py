@@ -1,10 +1,12 @@
 from copy import copy, deepcopy
 
+import numpy as np
 import pytest
 
 from tests.utils import create_default_task
 from utils import EventTime
-from workers import Worker, WorkerPool
+from workers import FitPolicy, FreeCapacityIndex, Worker, WorkerPool, WorkerPools
+from workers.workers import VECTORIZED_FIT_MIN_WORKERS
 from workload import (
     BatchStrategy,
     ExecutionStrategies,
@@ -400,6 +402,192 @@ def test_place_task_on_worker_pool():
     ), "Incorrect placement."
 
 
+def test_worker_pool_capacity_matrix():
+    """Test that the capacity matrix of a WorkerPool is kept in sync with the
+    placement and the removal of tasks."""
+    worker_one = Worker(
+        name="Worker_1",
+        resources=Resources({Resource(name="CPU"): 2, Resource(name="GPU"): 1}),
+    )
+    worker_two = Worker(name="Worker_2", resources=Resources({Resource(name="CPU"): 1}))
+    worker_pool = WorkerPool(name="WorkerPool_Test", workers=[worker_one, worker_two])
+    assert worker_pool.resource_types == ["CPU", "GPU"], "Incorrect resource types."
+    assert np.array_equal(
+        worker_pool.get_capacity_matrix(), [[2, 1], [1, 0]]
+    ), "Incorrect initial capacity matrix."
+
+    task = create_default_task(
+        resource_requirements=Resources(
+            resource_vector={
+                Resource(name="CPU", _id="any"): 1,
+                Resource(name="GPU", _id="any"): 1,
+            }
+        )
+    )
+    execution_strategy = task.available_execution_strategies[0]
+    assert worker_pool.get_fitting_workers(execution_strategy) == [
+        worker_one
+    ], "Incorrect Workers fit the strategy."
+    worker_pool.place_task(task, execution_strategy=execution_strategy)
+    assert np.array_equal(
+        worker_pool.get_capacity_matrix(), [[1, 0], [1, 0]]
+    ), "Incorrect capacity matrix after the placement of the task."
+    assert (
+        worker_pool.get_fitting_workers(execution_strategy) == []
+    ), "No Worker should fit the strategy."
+
+    worker_pool.remove_task(EventTime(1, EventTime.Unit.US), task)
+    assert np.array_equal(
+        worker_pool.get_capacity_matrix(), [[2, 1], [1, 0]]
+    ), "Incorrect capacity matrix after the removal of the task."
+
+    worker_pools = WorkerPools(
+        [
+            WorkerPool(
+                name="WorkerPool_Test_2",
+                workers=[
+                    Worker(
+                        name="Worker_3", resources=Resources({Resource(name="TPU"): 4})
+                    )
+                ],
+            ),
+            worker_pool,
+        ]
+    )
+    assert worker_pools.resource_types == [
+        "TPU",
+        "CPU",
+        "GPU",
+    ], "Incorrect resource types across the WorkerPools."
+    assert np.array_equal(
+        worker_pools.get_capacity_matrix(), [[4, 0, 0], [0, 2, 1], [0, 1, 0]]
+    ), "Incorrect capacity matrix across the WorkerPools."
+
+
+def test_worker_pool_vectorized_placement():
+    """Test that the tasks are placed on the first Worker that can accomodate them
+    in a WorkerPool whose fit checks are vectorized."""
+    workers = [
+        Worker(name=f"Worker_{index}", resources=Resources({Resource(name="CPU"): 1}))
+        for index in range(VECTORIZED_FIT_MIN_WORKERS)
+    ]
+    workers[-1].resources.add_resource(Resource(name="GPU"), 1)
+    worker_pool = WorkerPool(name="WorkerPool_Test", workers=workers)
+
+    gpu_task = create_default_task(
+        resource_requirements=Resources(
+            resource_vector={Resource(name="GPU", _id="any"): 1}
+        )
+    )
+    assert worker_pool.can_accomodate_strategy(
+        gpu_task.available_execution_strategies[0]
+    ), "The WorkerPool should accomodate the GPU task."
+    assert worker_pool.place_task(gpu_task), "The GPU task should have been placed."
+    assert workers[-1].get_placed_tasks() == [
+        gpu_task
+    ], "The GPU task was placed on the incorrect Worker."
+    assert not worker_pool.can_accomodate_strategy(
+        gpu_task.available_execution_strategies[0]
+    ), "The WorkerPool should not accomodate another GPU task."
+
+    for index in range(VECTORIZED_FIT_MIN_WORKERS):
+        cpu_task = create_default_task()
+        assert worker_pool.place_task(
+            cpu_task, execution_strategy=cpu_task.available_execution_strategies[0]
+        ), "The CPU task should have been placed."
+        assert (
+            workers[index].get_placed_tasks()[-1] == cpu_task
+        ), "The CPU task was placed on the incorrect Worker."
+    assert not worker_pool.place_task(
+        create_default_task()
+    ), "The WorkerPool should be out of CPUs."
+
+
+@pytest.mark.parametrize("num_workers", [4, VECTORIZED_FIT_MIN_WORKERS * 2])
+def test_worker_pool_fit_policies(num_workers):
+    """Test that the Worker chosen by each FitPolicy is correct, both with and
+    without the free-capacity index of the WorkerPool."""
+    workers = [
+        Worker(
+            name=f"Worker_{index}",
+            resources=Resources({Resource(name="CPU"): index % 4 + 1}),
+        )
+        for index in range(num_workers)
+    ]
+    worker_pool = WorkerPool(name="WorkerPool_Test", workers=workers)
+    task = create_default_task(
+        resource_requirements=Resources(
+            resource_vector={Resource(name="CPU", _id="any"): 2}
+        )
+    )
+    strategy = task.available_execution_strategies[0]
+    assert (
+        worker_pool.get_fitting_worker(strategy, FitPolicy.FIRST_FIT) == workers[1]
+    ), "Incorrect Worker chosen by the first fit."
+    assert (
+        worker_pool.get_fitting_worker(strategy, FitPolicy.BEST_FIT) == workers[1]
+    ), "Incorrect Worker chosen by the best fit."
+    assert (
+        worker_pool.get_fitting_worker(strategy, FitPolicy.WORST_FIT) == workers[3]
+    ), "Incorrect Worker chosen by the worst fit."
+
+    # Place the task using the worst fit, and ensure that the choices are updated.
+    assert worker_pool.place_task(
+        task, execution_strategy=strategy, fit_policy=FitPolicy.WORST_FIT
+    ), "The task should have been placed."
+    assert workers[3].get_placed_tasks() == [task], "Incorrect Worker for the task."
+    assert (
+        worker_pool.get_fitting_worker(strategy, FitPolicy.BEST_FIT) == workers[1]
+    ), "Incorrect Worker chosen by the best fit after the placement."
+    expected_worst_fit = workers[7] if num_workers > 4 else workers[2]
+    assert (
+        worker_pool.get_fitting_worker(strategy, FitPolicy.WORST_FIT)
+        == expected_worst_fit
+    ), "Incorrect Worker chosen by the worst fit after the placement."
+
+    large_task = create_default_task(
+        resource_requirements=Resources(
+            resource_vector={Resource(name="CPU", _id="any"): 5}
+        )
+    )
+    for fit_policy in FitPolicy:
+        assert (
+            worker_pool.get_fitting_worker(
+                large_task.available_execution_strategies[0], fit_policy
+            )
+            is None
+        ), f"No Worker should accomodate the large task with {fit_policy}."
+
+
+def test_free_capacity_index():
+    """Test that the FreeCapacityIndex finds the same rows as a scan of the free
+    quantities, as the quantities are updated."""
+    rng = np.random.default_rng(42)
+    capacity_matrix = rng.integers(0, 5, size=(37, 2)).astype(float)
+    index = FreeCapacityIndex(capacity_matrix)
+    for _ in range(200):
+        row = int(rng.integers(0, len(capacity_matrix)))
+        capacity_matrix[row] = rng.integers(0, 5, size=2)
+        index.update(row, capacity_matrix[row])
+
+        request = [(0, float(rng.integers(0, 5))), (1, float(rng.integers(0, 3)))]
+        fitting_rows = [
+            row
+            for row in range(len(capacity_matrix))
+            if all(capacity_matrix[row, column] >= q for column, q in request)
+        ]
+        first_fit = fitting_rows[0] if fitting_rows else None
+        best_fit = min(fitting_rows, key=lambda r: capacity_matrix[r, 0], default=None)
+        worst_fit = max(
+            fitting_rows,
+            key=lambda r: (capacity_matrix[r, 0], -r),
+            default=None,
+        )
+        assert index.find(request, FitPolicy.FIRST_FIT) == first_fit, "Incorrect row."
+        assert index.find(request, FitPolicy.BEST_FIT) == best_fit, "Incorrect row."
+        assert index.find(request, FitPolicy.WORST_FIT) == worst_fit, "Incorrect row."
+
+
 def test_worker_pool_step():
     """Tests that WorkerPool's step() correctly returns completed tasks."""
     # Initialize the Workers and the WorkerPool.
@@ -581,6 +769,166 @@ def test_deepcopy_worker_pool():
     ), "Incorrect number of available resources in Worker."
 
 
+def test_worker_pools_transaction():
+    """Test that the tentative placements made in a transaction over the WorkerPools
+    are undone upon a rollback, and kept upon a commit."""
+    worker_one = Worker(
+        name="Worker_1",
+        resources=Resources({Resource(name="CPU"): 1, Resource(name="GPU"): 1}),
+    )
+    worker_two = Worker(
+        name="Worker_2",
+        resources=Resources({Resource(name="CPU"): 1, Resource(name="GPU"): 1}),
+    )
+    worker_pool = WorkerPool(name="WorkerPool_Test", workers=[worker_one, worker_two])
+    worker_pools = WorkerPools([worker_pool])
+    task_one, task_two = create_default_task(), create_default_task()
+    worker_pool.place_task(task_one, task_one.available_execution_strategies[0])
+
+    # Place a Task in a transaction, and roll it back.
+    with worker_pools.begin_transaction() as transaction:
+        transaction.get_worker_pool(worker_pool.id).place_task(
+            task_two, task_two.available_execution_strategies[0]
+        )
+        assert transaction.get_placed_tasks() == [
+            task_one,
+            task_two,
+        ], "Incorrect placed tasks in the transaction."
+        assert (
+            worker_two.resources.get_available_quantity(Resource(name="CPU", _id="any"))
+            == 0
+        ), "The CPU of Worker_2 should be allocated in the transaction."
+    assert not transaction.is_active, "The transaction should have ended."
+    assert worker_pools.get_placed_tasks() == [
+        task_one
+    ], "Incorrect placed tasks after the rollback."
+    assert worker_two.get_placed_tasks() == [], "Worker_2 should not have any tasks."
+    assert (
+        worker_two.resources.get_available_quantity(Resource(name="CPU", _id="any"))
+        == 1
+    ), "The CPU of Worker_2 should have been freed up."
+
+    # Restart the WorkerPools in a transaction, and roll it back.
+    transaction = worker_pools.begin_transaction(reset=True)
+    assert worker_pools.get_placed_tasks() == [], "The placed tasks were not removed."
+    assert (
+        worker_one.resources.get_available_quantity(Resource(name="CPU", _id="any"))
+        == 1
+    ), "The CPU of Worker_1 should be available in the transaction."
+    with pytest.raises(RuntimeError):
+        worker_pools.begin_transaction()
+    transaction.rollback()
+    assert worker_one.get_placed_tasks() == [
+        task_one
+    ], "Incorrect tasks on Worker_1 after the rollback."
+    assert (
+        worker_one.resources.get_available_quantity(Resource(name="CPU", _id="any"))
+        == 0
+    ), "The CPU of Worker_1 should be allocated to the Task after the rollback."
+
+    # Place a Task in a transaction, and commit it.
+    transaction = worker_pools.begin_transaction()
+    worker_pool.place_task(task_two, task_two.available_execution_strategies[0])
+    transaction.commit()
+    with pytest.raises(RuntimeError):
+        transaction.rollback()
+    assert worker_pools.get_placed_tasks() == [
+        task_one,
+        task_two,
+    ], "Incorrect placed tasks after the commit."
+    assert (
+        worker_pool.can_accomodate_strategy(task_one.available_execution_strategies[0])
+        is False
+    ), "The WorkerPool should be out of CPUs after the commit."
+
+
+def test_worker_pool_steps_active_workers(monkeypatch):
+    """Test that the WorkerPool only steps the Workers that have placed tasks or
+    pending profiles."""
+    workers = [
+        Worker(
+            name=f"Worker_{index}",
+            resources=Resources({Resource(name="RAM"): 100}),
+        )
+        for index in range(3)
+    ]
+    worker_pool = WorkerPool(name="WorkerPool_Test", workers=workers)
+    stepped_workers = []
+    original_step = Worker.step
+
+    def step(worker, current_time, step_size):
+        stepped_workers.append(worker.name)
+        return original_step(worker, current_time, step_size)
+
+    monkeypatch.setattr(Worker, "step", step)
+
+    # Place a task on the last Worker, and load a profile onto the first Worker.
+    task = create_default_task(
+        resource_requirements=Resources(
+            resource_vector={Resource(name="RAM", _id="any"): 10}
+        )
+    )
+    worker_pool.place_task(
+        task, task.available_execution_strategies[0], worker_id=workers[2].id
+    )
+    work_profile = WorkProfile(name="TestWorkProfile")
+    worker_pool.load_profile(
+        work_profile,
+        ExecutionStrategy(
+            resources=Resources(resource_vector={Resource(name="RAM", _id="any"): 50}),
+            batch_size=1,
+            runtime=EventTime(10, EventTime.Unit.US),
+        ),
+        worker_id=workers[0].id,
+    )
+    assert worker_pool.has_pending_profiles(), "The profile should be pending."
+    assert workers[1].is_idle(), "Worker_1 should be idle."
+
+    worker_pool.step(EventTime.zero(), EventTime(10, EventTime.Unit.US))
+    assert stepped_workers == [
+        "Worker_0",
+        "Worker_2",
+    ], "Incorrect Workers stepped while the profile is loading."
+    assert not worker_pool.has_pending_profiles(), "The profile should be loaded."
+
+    # Once the profile is loaded and the task is removed, no Worker is stepped.
+    stepped_workers.clear()
+    worker_pool.step(EventTime(10, EventTime.Unit.US), EventTime(1, EventTime.Unit.US))
+    assert stepped_workers == ["Worker_2"], "Only Worker_2 should have been stepped."
+    worker_pool.remove_task(EventTime(11, EventTime.Unit.US), task)
+    stepped_workers.clear()
+    worker_pool.step(EventTime(11, EventTime.Unit.US), EventTime(1, EventTime.Unit.US))
+    assert stepped_workers == [], "No Worker should have been stepped."
+
+
+def test_worker_pool_deactivates_workers_after_loading_profiles():
+    """Test that a Worker that finishes loading its last profile is no longer
+    considered active by its WorkerPool, even when it is stepped directly."""
+    worker = Worker(
+        name="Worker_1",
+        resources=Resources({Resource(name="RAM"): 100}),
+    )
+    worker_pool = WorkerPool(name="WorkerPool_Test", workers=[worker])
+    worker_pool.load_profile(
+        WorkProfile(name="TestWorkProfile"),
+        ExecutionStrategy(
+            resources=Resources(resource_vector={Resource(name="RAM", _id="any"): 50}),
+            batch_size=1,
+            runtime=EventTime(10, EventTime.Unit.US),
+        ),
+        worker_id=worker.id,
+    )
+    assert worker in worker_pool._active_workers, "The Worker should be active."
+
+    worker.step_profiles(EventTime.zero(), EventTime(5, EventTime.Unit.US))
+    assert worker in worker_pool._active_workers, "The Worker should be active."
+    worker.step_profiles(
+        EventTime(5, EventTime.Unit.US), EventTime(5, EventTime.Unit.US)
+    )
+    assert worker.is_idle(), "The Worker should be idle."
+    assert worker not in worker_pool._active_workers, "The Worker should be inactive."
+
+
 def test_worker_profile_loading():
     """Test that the Worker can correctly load profiles and make it available at the
     correct time."""
@@ -0,0 +1,229 @@
+from tests.utils import create_default_task
+from utils import EventTime
+from workload import Job, Placement, TaskGraph, TaskState, Workload
+
+
+def __run_task(task, start_time: EventTime, finish_time: EventTime):
+    """Schedules, starts and finishes the given task."""
+    task.schedule(
+        start_time,
+        Placement.create_task_placement(
+            task=task,
+            worker_pool_id=None,
+            placement_time=start_time,
+            execution_strategy=task.available_execution_strategies[0],
+        ),
+    )
+    task.start(start_time)
+    task.update_remaining_time(EventTime.zero())
+    task.finish(finish_time)
+
+
+def test_workload_retires_completed_task_graphs():
+    """Test that the Workload only queries the TaskGraphs that are active."""
+    perception_task = create_default_task(
+        job=Job(name="Perception"), task_graph_name="TaskGraph_0"
+    )
+    prediction_task = create_default_task(
+        job=Job(name="Prediction"), task_graph_name="TaskGraph_0"
+    )
+    task_graph_0 = TaskGraph(
+        name="TaskGraph_0",
+        tasks={perception_task: [prediction_task], prediction_task: []},
+    )
+    other_task = create_default_task(
+        job=Job(name="Planning"), task_graph_name="TaskGraph_1"
+    )
+    task_graph_1 = TaskGraph(name="TaskGraph_1", tasks={other_task: []})
+    workload = Workload.from_task_graphs(
+        {task_graph_0.name: task_graph_0, task_graph_1.name: task_graph_1}
+    )
+    assert len(workload.active_task_graphs) == 2, "Incorrect active TaskGraphs."
+
+    # Complete the first TaskGraph.
+    perception_task.release(EventTime.zero())
+    __run_task(perception_task, EventTime.zero(), EventTime(1, EventTime.Unit.US))
+    released_tasks, _ = workload.notify_task_completion(
+        perception_task, EventTime(1, EventTime.Unit.US)
+    )
+    assert released_tasks == [prediction_task], "Incorrect tasks released."
+    assert len(workload.active_task_graphs) == 2, "Incorrect active TaskGraphs."
+    __run_task(
+        prediction_task,
+        EventTime(1, EventTime.Unit.US),
+        EventTime(2, EventTime.Unit.US),
+    )
+    workload.notify_task_completion(prediction_task, EventTime(2, EventTime.Unit.US))
+    assert task_graph_0.is_terminated(), "The TaskGraph should be terminated."
+    assert list(workload.active_task_graphs.keys()) == [
+        "TaskGraph_1"
+    ], "Incorrect active TaskGraphs."
+
+    # The queries only consider the active TaskGraphs, unless requested otherwise.
+    assert len(workload.task_graphs) == 2, "Incorrect number of TaskGraphs."
+    assert (
+        workload.filter(lambda task: task.state == TaskState.COMPLETED) == []
+    ), "Incorrect tasks filtered."
+    assert (
+        len(
+            workload.filter(
+                lambda task: task.state == TaskState.COMPLETED,
+                include_terminated=True,
+            )
+        )
+        == 2
+    ), "Incorrect tasks filtered."
+    assert workload.get_releasable_tasks() == [other_task], "Incorrect tasks."
+
+
+def test_workload_retires_cancelled_task_graphs():
+    """Test that the Workload keeps track of the cancelled TaskGraphs."""
+    perception_task = create_default_task(
+        job=Job(name="Perception"), task_graph_name="TaskGraph_0"
+    )
+    prediction_task = create_default_task(
+        job=Job(name="Prediction"), task_graph_name="TaskGraph_0"
+    )
+    task_graph = TaskGraph(
+        name="TaskGraph_0",
+        tasks={perception_task: [prediction_task], prediction_task: []},
+    )
+    workload = Workload.from_task_graphs({task_graph.name: task_graph})
+    assert workload.get_cancelled_task_graphs() == [], "Incorrect cancelled graphs."
+
+    cancelled_tasks = task_graph.cancel(perception_task, EventTime.zero())
+    assert len(cancelled_tasks) == 2, "Incorrect number of cancelled tasks."
+    for cancelled_task in cancelled_tasks:
+        workload.notify_task_cancellation(cancelled_task, EventTime.zero())
+    assert len(workload.active_task_graphs) == 0, "Incorrect active TaskGraphs."
+    assert workload.get_cancelled_task_graphs() == [
+        task_graph
+    ], "Incorrect cancelled TaskGraphs."
+
+
+def test_workload_drops_retired_task_graphs():
+    """Test that the Workload summarizes and drops the terminated TaskGraphs."""
+    perception_task = create_default_task(
+        job=Job(name="Perception"), task_graph_name="TaskGraph_0"
+    )
+    prediction_task = create_default_task(
+        job=Job(name="Prediction"), task_graph_name="TaskGraph_0"
+    )
+    task_graph_0 = TaskGraph(
+        name="TaskGraph_0",
+        tasks={perception_task: [prediction_task], prediction_task: []},
+    )
+    other_task = create_default_task(
+        job=Job(name="Planning"), task_graph_name="TaskGraph_1"
+    )
+    task_graph_1 = TaskGraph(name="TaskGraph_1", tasks={other_task: []})
+    workload = Workload.from_task_graphs(
+        {task_graph_0.name: task_graph_0, task_graph_1.name: task_graph_1}
+    )
+    workload._retire_task_graphs = True
+
+    # Complete the first TaskGraph.
+    perception_task.release(EventTime.zero())
+    __run_task(perception_task, EventTime.zero(), EventTime(1, EventTime.Unit.US))
+    workload.notify_task_completion(perception_task, EventTime(1, EventTime.Unit.US))
+    assert workload.pop_retired_task_graphs() == [], "Incorrect retired TaskGraphs."
+    __run_task(
+        prediction_task,
+        EventTime(1, EventTime.Unit.US),
+        EventTime(2, EventTime.Unit.US),
+    )
+    workload.notify_task_completion(prediction_task, EventTime(2, EventTime.Unit.US))
+    assert workload.get_task_graph("TaskGraph_0") is None, "TaskGraph not dropped."
+    assert list(workload.task_graphs.keys()) == ["TaskGraph_1"], "Incorrect graphs."
+    assert workload.num_task_graphs == 2, "Incorrect number of TaskGraphs."
+
+    # The summary retains the final statistics of the TaskGraph.
+    retired_task_graphs = workload.pop_retired_task_graphs()
+    assert len(retired_task_graphs) == 1, "Incorrect retired TaskGraphs."
+    summary = retired_task_graphs[0]
+    assert summary.name == "TaskGraph_0", "Incorrect name of the TaskGraph."
+    assert summary.num_tasks == 2, "Incorrect number of tasks."
+    assert summary.completion_time == EventTime(
+        2, EventTime.Unit.US
+    ), "Incorrect completion time."
+    assert not summary.cancelled, "The TaskGraph should not be cancelled."
+    assert workload.retired_task_graphs == {
+        "TaskGraph_0": summary
+    }, "Incorrect retired TaskGraphs."
+    assert workload.pop_retired_task_graphs() == [], "Incorrect retired TaskGraphs."
+
+    # Cancel the second TaskGraph, and ensure that it is counted once dropped.
+    cancelled_tasks = task_graph_1.cancel(other_task, EventTime.zero())
+    for cancelled_task in cancelled_tasks:
+        workload.notify_task_cancellation(cancelled_task, EventTime.zero())
+    workload.notify_task_cancellation(other_task, EventTime.zero())
+    assert len(workload.task_graphs) == 0, "Incorrect number of TaskGraphs."
+    assert workload.get_cancelled_task_graphs() == [], "Incorrect cancelled graphs."
+    assert workload.get_num_cancelled_task_graphs() == 1, "Incorrect cancellations."
+    assert workload.retired_task_graphs[
+        "TaskGraph_1"
+    ].cancelled, "The TaskGraph should be cancelled."
+
+
+def test_workload_incremental_schedulable_tasks():
+    """Test that the incrementally maintained schedulable tasks match the full
+    recomputation of the schedulable tasks."""
+    perception_task = create_default_task(
+        job=Job(name="Perception"), task_graph_name="TaskGraph_0", runtime=10
+    )
+    prediction_task = create_default_task(
+        job=Job(name="Prediction"), task_graph_name="TaskGraph_0", runtime=10
+    )
+    planning_task = create_default_task(
+        job=Job(name="Planning"), task_graph_name="TaskGraph_0", runtime=10
+    )
+    task_graph = TaskGraph(
+        name="TaskGraph_0",
+        tasks={
+            perception_task: [prediction_task],
+            prediction_task: [planning_task],
+            planning_task: [],
+        },
+    )
+    workload = Workload.from_task_graphs({task_graph.name: task_graph})
+    workload._incremental_schedulable_tasks = True
+    workload._check_schedulable_tasks = True
+
+    def get_schedulable_tasks(time, lookahead):
+        return workload.get_schedulable_tasks(
+            EventTime(time, EventTime.Unit.US),
+            EventTime(lookahead, EventTime.Unit.US),
+        )
+
+    perception_task.release(EventTime.zero())
+    workload.notify_task_update(perception_task)
+    assert get_schedulable_tasks(0, 0) == [perception_task], "Incorrect tasks."
+    assert get_schedulable_tasks(0, 10) == [
+        perception_task,
+        prediction_task,
+    ], "Incorrect tasks."
+
+    # Start the task, and ensure that its progress is reflected without updates.
+    perception_task.schedule(
+        EventTime.zero(),
+        Placement.create_task_placement(
+            task=perception_task,
+            worker_pool_id=None,
+            placement_time=EventTime.zero(),
+            execution_strategy=perception_task.available_execution_strategies[0],
+        ),
+    )
+    perception_task.start(EventTime.zero())
+    workload.notify_task_update(perception_task)
+    assert get_schedulable_tasks(0, 5) == [], "Incorrect tasks."
+    perception_task.step(EventTime.zero(), EventTime(5, EventTime.Unit.US))
+    assert get_schedulable_tasks(5, 5) == [prediction_task], "Incorrect tasks."
+    assert get_schedulable_tasks(5, 15) == [
+        prediction_task,
+        planning_task,
+    ], "Incorrect tasks."
+
+    # Cancel the remaining tasks.
+    task_graph.cancel(prediction_task, EventTime(5, EventTime.Unit.US))
+    workload.notify_task_update(prediction_task)
+    assert get_schedulable_tasks(5, 15) == [], "Incorrect tasks."
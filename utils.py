@@ -1,3 +1,4 @@
+import atexit
 import bisect
 import logging
 import os
@@ -64,8 +65,14 @@ class EventTime:
         def to(self, other):
             return self.value / other.value
 
-    __slots__ = ("_time", "_unit")
+    # In addition to the time and the unit that the `EventTime` was constructed with,
+    # the time is normalized to an integer number of microseconds (`_us`) upon
+    # construction, which is used by the comparisons and the hash, and by the
+    # arithmetic across `EventTime`s in microseconds.
+    __slots__ = ("_time", "_unit", "_us")
     _rng = None
+    _zero = None
+    _invalid = None
 
     def __init__(self, time: int, unit: Unit) -> None:
         if type(unit) != EventTime.Unit:
@@ -75,13 +82,30 @@ class EventTime:
 
         self._time = time
         self._unit = unit
-        if type(self)._rng is None:
+        self._us = time if unit is _US else int(time * unit.value)
+        if EventTime._rng is None:
             if hasattr(flags.FLAGS, "random_seed"):
-                type(self)._rng = random.Random(flags.FLAGS.random_seed)
+                EventTime._rng = random.Random(flags.FLAGS.random_seed)
             else:
-                type(self)._rng = random.Random(42)
+                EventTime._rng = random.Random(42)
+
+    @staticmethod
+    def _from_us(time: int) -> "EventTime":
+        """Constructs an `EventTime` from an integer number of microseconds without
+        validating the arguments."""
+        event_time = object.__new__(EventTime)
+        event_time._time = time
+        event_time._unit = _US
+        event_time._us = time
+        return event_time
 
     def to(self, unit: Unit) -> "EventTime":
+        if unit is _US:
+            # Every unit can be converted to microseconds, and EventTimes are
+            # immutable, so an EventTime in microseconds can be returned as-is.
+            if self._unit is _US:
+                return self
+            return EventTime._from_us(self._us)
         if unit > self.unit:
             raise ValueError(
                 "Only conversions from higher granularity to lower granularity "
@@ -126,6 +150,8 @@ class EventTime:
         return f"EventTime(time={self.time}, unit={repr(self.unit)})"
 
     def __add__(self, other) -> "EventTime":
+        if self._unit is _US and other._unit is _US:
+            return EventTime._from_us(self._us + other._us)
         if self.unit == other.unit:
             return EventTime(self.time + other.time, self.unit)
         elif self.unit < other.unit:
@@ -134,13 +160,24 @@ class EventTime:
             return EventTime(self.to(other.unit).time + other.time, other.unit)
 
     def __sub__(self, other) -> "EventTime":
+        if self._unit is _US and other._unit is _US:
+            return EventTime._from_us(self._us - other._us)
         return self + EventTime(time=-other.time, unit=other.unit)
 
     def __eq__(self, other) -> bool:
-        return (self - other).time == 0
+        return self._us == other._us
 
     def __lt__(self, other) -> bool:
-        return (self - other).time < 0
+        return self._us < other._us
+
+    def __le__(self, other) -> bool:
+        return self._us <= other._us
+
+    def __gt__(self, other) -> bool:
+        return self._us > other._us
+
+    def __ge__(self, other) -> bool:
+        return self._us >= other._us
 
     def __mul__(self, other: int) -> "EventTime":
         if type(other) != int:
@@ -151,7 +188,7 @@ class EventTime:
         return EventTime(time=self.time * other, unit=self.unit)
 
     def __hash__(self) -> int:
-        return self.to(EventTime.Unit.US).time
+        return self._us
 
     def __copy__(self) -> "EventTime":
         return EventTime(time=self.time, unit=self.unit)
@@ -169,11 +206,21 @@ class EventTime:
 
     @staticmethod
     def zero() -> "EventTime":
-        return EventTime(0, EventTime.Unit.US)
+        # EventTimes are immutable, so a single instance is shared by all callers.
+        if EventTime._zero is None:
+            EventTime._zero = EventTime(0, EventTime.Unit.US)
+        return EventTime._zero
 
     @staticmethod
     def invalid() -> "EventTime":
-        return EventTime(-1, EventTime.Unit.US)
+        if EventTime._invalid is None:
+            EventTime._invalid = EventTime(-1, EventTime.Unit.US)
+        return EventTime._invalid
+
+
+# The microsecond unit is referenced directly by the fast paths of `EventTime`, since
+# looking up the members of an Enum is comparatively slow.
+_US = EventTime.Unit.US
 
 
 def setup_logging(
@@ -193,7 +240,8 @@ def setup_logging(
         log_dir (`Optional[str]`): The directory where the log results are to be
             stored. If `None`, the current working directory is chosen.
         log_file (`str`): The name of the log file to log results to.
-        log_level (`str`): The level of logging to do. (DEBUG/INFO/WARN)
+        log_level (`str`): The level of logging to do. (DEBUG/INFO/WARN/NONE)
+            If NONE, all the messages are dropped, and no log file is created.
 
     Returns:
         A `logging.Logger` instance that can be used to log the required
@@ -205,6 +253,12 @@ def setup_logging(
 
     # Set the logger properties.
     logger.propagate = False
+    if log_level == "none":
+        # Disable the logger entirely, so that the checks against the level of the
+        # logger are the only cost paid by the callers.
+        logger.setLevel(logging.CRITICAL + 1)
+        logger.addHandler(logging.NullHandler())
+        return logger
     logger.setLevel(getattr(logging, log_level.upper()))
 
     # Set the file to log to.
@@ -231,11 +285,66 @@ def setup_logging(
     return logger
 
 
+class BufferedCSVWriter:
+    """A sink for the CSV rows of the simulator that buffers the rows in memory
+    and writes them to the file in chunks.
+
+    The writer exposes the `debug` and `info` methods of a `logging.Logger` (with
+    the same lazy %-style formatting of the arguments), so that it can be used in
+    place of the logger returned by `setup_csv_logging`, and produces the exact
+    same rows without paying for the logging machinery and a write per row.
+
+    Args:
+        log_file (`Optional[str]`): The path of the file to append the rows to. If
+            `None`, the rows are written to the standard output.
+        buffer_size (`int`): The number of rows to buffer before they are written.
+    """
+
+    def __init__(self, log_file: Optional[str] = None, buffer_size: int = 8192):
+        if buffer_size < 1:
+            raise ValueError(f"The buffer size must be positive, not {buffer_size}.")
+        self._buffer_size = buffer_size
+        self._rows = []
+        if log_file is None:
+            self._file = sys.stdout
+            self._owns_file = False
+        else:
+            self._file = open(log_file, "a")
+            self._owns_file = True
+        # Ensure that the buffered rows are not lost if the process exits due to a
+        # crash before the writer is explicitly closed.
+        atexit.register(self.close)
+
+    def debug(self, msg: str, *args) -> None:
+        self._rows.append(msg % args if args else msg)
+        if len(self._rows) >= self._buffer_size:
+            self.flush()
+
+    info = debug
+
+    def flush(self) -> None:
+        """Writes all the buffered rows to the underlying file."""
+        if self._rows and not self._file.closed:
+            self._rows.append("")
+            self._file.write("\n".join(self._rows))
+            self._rows.clear()
+        if not self._file.closed:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flushes the buffered rows, and closes the underlying file."""
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+        atexit.unregister(self.close)
+
+
 def setup_csv_logging(
     name: str,
     log_dir: Optional[str] = None,
     log_file: Optional[str] = None,
-) -> logging.Logger:
+    buffer_size: int = 0,
+) -> Union[logging.Logger, BufferedCSVWriter]:
     """Sets up the CSV logging for the module.
 
     The CSV provides the data required to plot the performance characteristics
@@ -246,11 +355,22 @@ def setup_csv_logging(
         log_dir (`Optional[str]`): The directory where the log results are to be
             stored. If `None`, the current working directory is chosen.
         log_file (`Optional[str]`): The name of the log file to store the results in.
+        buffer_size (`int`): If positive, a `BufferedCSVWriter` that buffers the
+            given number of rows is returned instead of a `logging.Logger`.
 
     Returns:
-        A `logging.Logger` instance that logs the required information to the
-        given CSV file.
+        A `logging.Logger` (or a `BufferedCSVWriter`) instance that logs the
+        required information to the given CSV file.
     """
+    if buffer_size > 0:
+        return BufferedCSVWriter(
+            log_file=(
+                os.path.join(log_dir if log_dir is not None else os.getcwd(), log_file)
+                if log_file is not None
+                else None
+            ),
+            buffer_size=buffer_size,
+        )
     return setup_logging(
         name=name + "_CSV",
         fmt="%(message)s",
@@ -1,2 +1,3 @@
 # Expose the abstractions from the Workers module.
-from .workers import Worker, WorkerPool, WorkerPools
+from .capacity_index import FitPolicy, FreeCapacityIndex
+from .workers import Worker, WorkerPool, WorkerPools, WorkerPoolsTransaction
@@ -0,0 +1,160 @@
+from bisect import bisect_left, insort
+from enum import Enum
+from typing import Callable, List, Optional, Sequence, Tuple
+
+
+class FitPolicy(Enum):
+    """Represents the policies used to choose a `Worker` from the `Worker`s of a
+    `WorkerPool` that can accomodate a strategy."""
+
+    FIRST_FIT = 1  # Choose the first Worker (in the order of the WorkerPool).
+    BEST_FIT = 2  # Choose the Worker with the least free quantity of the resource.
+    WORST_FIT = 3  # Choose the Worker with the most free quantity of the resource.
+
+
+class FreeCapacityIndex(object):
+    """A `FreeCapacityIndex` indexes the free quantity of each resource type on each
+    `Worker` of a `WorkerPool`, and finds the `Worker` that can accomodate a request
+    according to a `FitPolicy` in logarithmic time.
+
+    The `Worker`s and the resource types are referred to by their rows and columns
+    in the capacity matrix of the `WorkerPool`. For each resource type, the index
+    maintains a sorted list of the (free quantity, row) pairs (to find the best and
+    the worst fits) and a segment tree of the maximum free quantity over the rows (to
+    find the first fit).
+
+    When a request spans multiple resource types, the candidates are found using the
+    first of its resource types, and the rest of the resource types are checked for
+    each of the candidates.
+
+    Args:
+        capacity_matrix (`Sequence[Sequence[float]]`): The free quantity of each
+            resource type (columns) on each `Worker` (rows).
+    """
+
+    def __init__(self, capacity_matrix: Sequence[Sequence[float]]) -> None:
+        self._num_rows = len(capacity_matrix)
+        self._num_columns = len(capacity_matrix[0]) if self._num_rows > 0 else 0
+        self._free: List[List[float]] = [
+            list(map(float, row)) for row in capacity_matrix
+        ]
+        self._sorted_entries: List[List[Tuple[float, int]]] = [
+            sorted((self._free[row][column], row) for row in range(self._num_rows))
+            for column in range(self._num_columns)
+        ]
+        self._tree_size = 1
+        while self._tree_size < self._num_rows:
+            self._tree_size *= 2
+        self._trees: List[List[float]] = []
+        for column in range(self._num_columns):
+            tree = [float("-inf")] * (2 * self._tree_size)
+            for row in range(self._num_rows):
+                tree[self._tree_size + row] = self._free[row][column]
+            for node in range(self._tree_size - 1, 0, -1):
+                tree[node] = max(tree[2 * node], tree[2 * node + 1])
+            self._trees.append(tree)
+
+    def update(self, row: int, quantities: Sequence[float]) -> None:
+        """Updates the free quantities of the resource types on the given row.
+
+        Args:
+            row (`int`): The row of the `Worker` whose free quantities changed.
+            quantities (`Sequence[float]`): The free quantity of each resource type.
+        """
+        free = self._free[row]
+        for column, quantity in enumerate(quantities):
+            quantity = float(quantity)
+            if free[column] == quantity:
+                continue
+            entries = self._sorted_entries[column]
+            del entries[bisect_left(entries, (free[column], row))]
+            insort(entries, (quantity, row))
+            free[column] = quantity
+
+            tree = self._trees[column]
+            node = self._tree_size + row
+            tree[node] = quantity
+            node //= 2
+            while node > 0:
+                tree[node] = max(tree[2 * node], tree[2 * node + 1])
+                node //= 2
+
+    def find(
+        self,
+        request: Sequence[Tuple[int, float]],
+        fit_policy: FitPolicy = FitPolicy.FIRST_FIT,
+    ) -> Optional[int]:
+        """Finds the row of the `Worker` that can accomodate the given request
+        according to the given `FitPolicy`.
+
+        Args:
+            request (`Sequence[Tuple[int, float]]`): The (column, quantity) pairs of
+                the resource types requested.
+            fit_policy (`FitPolicy`): The policy to choose among the `Worker`s that
+                can accomodate the request.
+
+        Returns:
+            The row of the chosen `Worker`, or `None` if no `Worker` can accomodate
+            the request. Ties are broken in favor of the lowest row.
+        """
+        if self._num_rows == 0:
+            return None
+        if len(request) == 0:
+            return 0
+        column, quantity = request[0]
+        others = request[1:]
+
+        def fits(row: int) -> bool:
+            free = self._free[row]
+            return all(free[_column] >= _quantity for _column, _quantity in others)
+
+        if fit_policy == FitPolicy.FIRST_FIT:
+            row = self.__find_first(column, quantity, 0)
+            while row is not None and not fits(row):
+                row = self.__find_first(column, quantity, row + 1)
+            return row
+        elif fit_policy == FitPolicy.BEST_FIT:
+            entries = self._sorted_entries[column]
+            for index in range(bisect_left(entries, (quantity, -1)), len(entries)):
+                if fits(entries[index][1]):
+                    return entries[index][1]
+            return None
+        elif fit_policy == FitPolicy.WORST_FIT:
+            return self.__find_worst(column, quantity, fits)
+        else:
+            raise NotImplementedError(f"The fit policy {fit_policy} is not supported.")
+
+    def __find_first(self, column: int, quantity: float, start: int) -> Optional[int]:
+        """Finds the lowest row from `start` onwards with at least `quantity` free
+        on the given column, by descending the segment tree of the column."""
+        tree = self._trees[column]
+
+        def descend(node: int, low: int, high: int) -> Optional[int]:
+            if high <= start or tree[node] < quantity:
+                return None
+            if high - low == 1:
+                return low
+            middle = (low + high) // 2
+            row = descend(2 * node, low, middle)
+            if row is None:
+                row = descend(2 * node + 1, middle, high)
+            return row
+
+        return descend(1, 0, self._tree_size)
+
+    def __find_worst(
+        self, column: int, quantity: float, fits: Callable[[int], bool]
+    ) -> Optional[int]:
+        """Finds the row with the most free quantity on the given column (and the
+        lowest row among the ties) that fits the request."""
+        entries = self._sorted_entries[column]
+        low = bisect_left(entries, (quantity, -1))
+        high = len(entries)
+        while high > low:
+            # Check the rows with the same free quantity in increasing order.
+            start = max(low, bisect_left(entries, (entries[high - 1][0], -1)))
+            for index in range(start, high):
+                if fits(entries[index][1]):
+                    return entries[index][1]
+            high = start
+        return None
@@ -2,7 +2,19 @@ import logging
 import random
 import uuid
 from copy import copy, deepcopy
-from typing import List, Mapping, Optional, Sequence, Set, Tuple, Type, Union
+from typing import (
+    Callable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+import numpy as np
 
 from utils import EventTime, setup_logging
 from workload import (
@@ -18,6 +30,14 @@ from workload import (
     WorkProfile,
 )
 
+from .capacity_index import FitPolicy, FreeCapacityIndex
+
+# The minimum number of `Worker`s in a `WorkerPool` for which the checks for the
+# Workers that can accomodate a strategy are answered from the capacity matrix (and
+# the free-capacity index) of the WorkerPool. Smaller WorkerPools check each of their
+# Workers instead, which is cheaper than the fixed overhead of the lookups.
+VECTORIZED_FIT_MIN_WORKERS = 8
+
 
 class Worker(object):
     """A `Worker` is a virtual abstraction over a single machine.
@@ -50,6 +70,58 @@ class Worker(object):
         self._batch_tasks_for_strategy: Mapping[BatchStrategy, Task] = {}
         self._available_profiles: Mapping[WorkProfile, ExecutionStrategy] = {}
         self._pending_profiles: Mapping[WorkProfile, ExecutionStrategy] = {}
+        # The callback invoked when the available resources (and the placed tasks or
+        # profiles) of this Worker change. This is used by the `WorkerPool` to keep
+        # its capacity matrix and its set of active Workers up to date.
+        self._on_resources_change: Optional[Callable[["Worker"], None]] = None
+        # The callback invoked before the state of this Worker is changed. This is
+        # used by the `WorkerPool` to save the state of the Worker into the
+        # `WorkerPoolsTransaction` that the change is made in, if any.
+        self._on_before_change: Optional[Callable[["Worker"], None]] = None
+
+    def _notify_resources_change(self) -> None:
+        if self._on_resources_change is not None:
+            self._on_resources_change(self)
+
+    def _notify_before_change(self) -> None:
+        if self._on_before_change is not None:
+            self._on_before_change(self)
+
+    def _save_state(self) -> tuple:
+        """Saves the resource allocations, placed tasks and profiles of this Worker,
+        so that they can be restored by `_restore_state` after tentative changes."""
+        return (
+            self._resources._save_allocations(),
+            dict(self._placed_tasks),
+            {strategy: set(tasks) for strategy, tasks in self._placed_batches.items()},
+            dict(self._batch_tasks_for_strategy),
+            dict(self._available_profiles),
+            dict(self._pending_profiles),
+        )
+
+    def _restore_state(self, state: tuple) -> None:
+        """Restores the state of this Worker saved by `_save_state`."""
+        (
+            allocations,
+            self._placed_tasks,
+            self._placed_batches,
+            self._batch_tasks_for_strategy,
+            self._available_profiles,
+            self._pending_profiles,
+        ) = state
+        self._resources._restore_allocations(allocations)
+        self._notify_resources_change()
+
+    def _reset_state(self) -> None:
+        """Removes all the placed tasks and profiles from this Worker, and frees
+        up all of its resources."""
+        self._resources._clear_allocations()
+        self._placed_tasks = {}
+        self._placed_batches = {}
+        self._batch_tasks_for_strategy = {}
+        self._available_profiles = {}
+        self._pending_profiles = {}
+        self._notify_resources_change()
 
     def load_profile(
         self, profile: WorkProfile, loading_strategy: ExecutionStrategy
@@ -72,11 +144,15 @@ class Worker(object):
             A `ValueError` if not enough resources are available to accomodate the
             loading strategy.
         """
+        self._notify_before_change()
         self._resources.allocate_multiple(loading_strategy.resources, profile)
         self._pending_profiles[profile] = copy(loading_strategy)
+        self._notify_resources_change()
         self._logger.debug(
-            f"Added the profile {profile} with the loading strategy "
-            f"{loading_strategy} to the set of pending profiles."
+            "Added the profile %s with the loading strategy %s to the set of "
+            "pending profiles.",
+            profile,
+            loading_strategy,
         )
 
     def place_task(
@@ -94,6 +170,7 @@ class Worker(object):
             execution_strategy (`Union[ExecutionStrategy, BatchStrategy]`): The
                 strategy to be used for executing the task.
         """
+        self._notify_before_change()
         if isinstance(execution_strategy, BatchStrategy):
             # If the execution strategy is a batch strategy, then we need to allocate
             # the resources only if the batch is not already placed on this worker.
@@ -117,12 +194,15 @@ class Worker(object):
                 self._placed_batches[execution_strategy] = set()
                 self._placed_batches[execution_strategy].add(task)
                 self._placed_tasks[task] = execution_strategy
+                self._notify_resources_change()
 
                 # Log the virtual task for the batch.
                 self._batch_tasks_for_strategy[execution_strategy] = batch_task
                 self._logger.debug(
-                    f"Placed {task} on {self} as part of a new "
-                    f"batch with the ID: {execution_strategy.id}."
+                    "Placed %s on %s as part of a new batch with the ID: %s.",
+                    task,
+                    self,
+                    execution_strategy.id,
                 )
             else:
                 if (
@@ -136,16 +216,23 @@ class Worker(object):
                     )
                 self._placed_batches[execution_strategy].add(task)
                 self._placed_tasks[task] = execution_strategy
+                self._notify_resources_change()
                 self._logger.debug(
-                    f"Placed {task} on {self} as part of an already "
-                    f"placed batch with the ID: {execution_strategy.id}."
+                    "Placed %s on %s as part of an already placed batch with the "
+                    "ID: %s.",
+                    task,
+                    self,
+                    execution_strategy.id,
                 )
         else:
             self._resources.allocate_multiple(execution_strategy.resources, task)
             self._placed_tasks[task] = execution_strategy
+            self._notify_resources_change()
             self._logger.debug(
-                f"Placed {task} on {self} with the "
-                f"execution strategy {execution_strategy}."
+                "Placed %s on %s with the execution strategy %s.",
+                task,
+                self,
+                execution_strategy,
             )
 
     def evict_profile(self, profile: WorkProfile) -> None:
@@ -169,11 +256,13 @@ class Worker(object):
 
         # Deallocates the resources corresponding to the loading strategy and remove
         # the profile from the set of available profiles.
+        self._notify_before_change()
         self._resources.deallocate(profile)
         if profile in self._available_profiles:
             del self._available_profiles[profile]
         else:
             del self._pending_profiles[profile]
+        self._notify_resources_change()
 
     def remove_task(self, current_time: EventTime, task: Task):
         """Removes the task from this `Worker`.
@@ -192,6 +281,7 @@ class Worker(object):
         if task not in self._placed_tasks:
             raise ValueError(f"The task {task} was not placed on Worker {self}.")
 
+        self._notify_before_change()
         execution_strategy = self._placed_tasks[task]
         if isinstance(execution_strategy, BatchStrategy):
             # If the Task was executed as part of a `Batch`, then we need to check if
@@ -229,10 +319,12 @@ class Worker(object):
                 )
             self._placed_batches[execution_strategy] = remaining_tasks_in_batch
             del self._placed_tasks[task]
+            self._notify_resources_change()
         else:
             # Deallocate the resources and remove the placed task.
             self._resources.deallocate(task)
             del self._placed_tasks[task]
+            self._notify_resources_change()
             self._logger.debug(
                 "[%d] The Task %s was removed from the Worker %s.",
                 current_time.to(EventTime.Unit.US).time,
@@ -331,8 +423,43 @@ class Worker(object):
         Returns:
             A set of tasks that have been completed.
         """
+        # Step the pending WorkProfiles before stepping the placed tasks.
+        self.step_profiles(current_time, step_size)
+
+        # Invoke the step() method on all the tasks.
         completed_tasks = []
+        for task in self._placed_tasks:
+            if task.state != TaskState.RUNNING:
+                self._logger.debug(
+                    "[%d] Skipping stepping for Task %s because it is in state %s.",
+                    current_time.to(EventTime.Unit.US).time,
+                    task.unique_name,
+                    task.state,
+                )
+                continue
+            if task.step(current_time, step_size):
+                self._logger.debug(
+                    "[%d] %s finished execution on %s.",
+                    current_time.to(EventTime.Unit.US).time,
+                    task.unique_name,
+                    self,
+                )
+                completed_tasks.append(task)
+        return completed_tasks
 
+    def step_profiles(
+        self,
+        current_time: EventTime,
+        step_size: EventTime = EventTime(1, EventTime.Unit.US),
+    ) -> None:
+        """Steps the loading of the pending `WorkProfile`s of this `Worker` by the
+        given `step_size`, and makes the ones that finished loading available.
+
+        Args:
+            current_time (`EventTime`): The current time of the simulator (in us).
+            step_size (`EventTime`): The amount of time for which to step the
+                loading of the profiles (in us).
+        """
         # Step the pending WorkProfiles and add the completed ones to the set of
         # available profiles.
         invalid_profiles = []
@@ -360,22 +487,9 @@ class Worker(object):
         # Remove the completed WorkProfiles from the set of pending profiles.
         for profile in invalid_profiles:
             del self._pending_profiles[profile]
-
-        # Invoke the step() method on all the tasks.
-        for task in self._placed_tasks:
-            if task.state != TaskState.RUNNING:
-                self._logger.debug(
-                    f"[{current_time.to(EventTime.Unit.US).time}] Skipping stepping "
-                    f"for Task {task.unique_name} because it is in state {task.state}."
-                )
-                continue
-            if task.step(current_time, step_size):
-                self._logger.debug(
-                    f"[{current_time.to(EventTime.Unit.US).time}] {task.unique_name} "
-                    f"finished execution on {self}."
-                )
-                completed_tasks.append(task)
-        return completed_tasks
+        if invalid_profiles:
+            # The Worker may have become idle after loading its last profile.
+            self._notify_resources_change()
 
     def is_available(self, profile: WorkProfile) -> EventTime:
         """Check if the given `WorkProfile` is available on this `Worker`.
@@ -426,6 +540,15 @@ class Worker(object):
         """
         return self._resources.empty()
 
+    def is_idle(self) -> bool:
+        """Check if the Worker is idle, and does not need to be stepped.
+
+        Returns:
+            `True` if the Worker has no placed tasks and no pending profiles, `False`
+            otherwise.
+        """
+        return not self._placed_tasks and not self._pending_profiles
+
     def __copy__(self):
         """A copy of the Worker uses the same ID, and copies the resource
         allocations of self.
@@ -540,6 +663,163 @@ class WorkerPool(object):
         # A mapping from the Task to the ID of the Worker.
         self._placed_tasks: Mapping[Task, str] = {}
 
+        # The capacity matrix holds the available quantity of each resource type
+        # (columns, in the order of `self._resource_types`) on each Worker (rows, in
+        # the order of `self._workers`). The matrix is built lazily, and the rows of
+        # the Workers whose resources changed since are refreshed upon its next use.
+        self._capacity_matrix: Optional[np.ndarray] = None
+        self._capacity_index: Optional[FreeCapacityIndex] = None
+        self._resource_types: Mapping[str, int] = {}
+        self._worker_ids: Sequence[str] = []
+        self._worker_rows: Mapping[Worker, int] = {}
+        self._stale_workers: Set[Worker] = set()
+        # The transaction that the changes to this WorkerPool are tentatively made
+        # in, if any (see `WorkerPools.begin_transaction`).
+        self._transaction: Optional["WorkerPoolsTransaction"] = None
+        # The Workers that have placed tasks or pending profiles (and are thus
+        # stepped by `step`), along with the position of each Worker in the pool.
+        # The active Workers are sorted by their position upon their next use after
+        # the set changes.
+        self._active_workers: Set[Worker] = set()
+        self._sorted_active_workers: Optional[Sequence[Worker]] = None
+        self._worker_indices: Mapping[Worker, int] = {}
+        for worker in self._workers.values():
+            self.__register_worker(worker)
+
+    def __register_worker(self, worker: Worker) -> None:
+        worker._on_resources_change = self.__on_resources_change
+        worker._on_before_change = self.__save_worker
+        self._worker_indices[worker] = len(self._worker_indices)
+        self.__update_activity(worker)
+
+    def __on_resources_change(self, worker: Worker) -> None:
+        if self._capacity_matrix is not None:
+            self._stale_workers.add(worker)
+        self.__update_activity(worker)
+
+    def __update_activity(self, worker: Worker) -> None:
+        if worker.is_idle():
+            if worker in self._active_workers:
+                self._active_workers.remove(worker)
+                self._sorted_active_workers = None
+        elif worker not in self._active_workers:
+            self._active_workers.add(worker)
+            self._sorted_active_workers = None
+
+    def __get_active_workers(self) -> Sequence[Worker]:
+        """Retrieves the active Workers, in the order of `self._workers`."""
+        if self._sorted_active_workers is None:
+            self._sorted_active_workers = sorted(
+                self._active_workers, key=self._worker_indices.__getitem__
+            )
+        return self._sorted_active_workers
+
+    def __save_worker(self, worker: Worker) -> None:
+        if self._transaction is not None:
+            self._transaction._save_worker(worker)
+
+    def __save_placed_tasks(self) -> None:
+        if self._transaction is not None:
+            self._transaction._save_worker_pool(self)
+
+    def __get_capacity_matrix(self) -> np.ndarray:
+        """Builds (or refreshes the stale rows of) the capacity matrix and the
+        free-capacity index, and returns the capacity matrix."""
+        if self._capacity_matrix is None:
+            self._resource_types = {}
+            for worker in self._workers.values():
+                for resource in worker.resources.get_unique_resource_types():
+                    self._resource_types.setdefault(
+                        resource.name, len(self._resource_types)
+                    )
+            self._worker_ids = list(self._workers)
+            self._worker_rows = {
+                worker: row for row, worker in enumerate(self._workers.values())
+            }
+            self._capacity_matrix = np.zeros(
+                (len(self._workers), len(self._resource_types))
+            )
+            self._capacity_index = None
+            self._stale_workers = set(self._workers.values())
+
+        if self._stale_workers:
+            resource_types = [
+                Resource(name=name, _id="any") for name in self._resource_types
+            ]
+            for worker in self._stale_workers:
+                row = self._worker_rows[worker]
+                quantities = [
+                    worker.resources.get_available_quantity(resource_type)
+                    for resource_type in resource_types
+                ]
+                self._capacity_matrix[row] = quantities
+                if self._capacity_index is not None:
+                    self._capacity_index.update(row, quantities)
+            self._stale_workers.clear()
+        if self._capacity_index is None:
+            self._capacity_index = FreeCapacityIndex(self._capacity_matrix)
+        return self._capacity_matrix
+
+    def __get_capacity_request(
+        self, execution_strategy: ExecutionStrategy
+    ) -> Optional[Sequence[Tuple[int, float]]]:
+        """Translates the resources requested by the given strategy into the
+        (column, quantity) pairs of the capacity matrix.
+
+        Returns:
+            The (column, quantity) pairs, or `None` if the strategy cannot be checked
+            against the free-capacity index (i.e., the `WorkerPool` is too small, the
+            strategy is a `BatchStrategy`, or it requests a resource with a specific
+            ID or a resource that is not available on this `WorkerPool`).
+        """
+        if len(self._workers) < VECTORIZED_FIT_MIN_WORKERS or isinstance(
+            execution_strategy, BatchStrategy
+        ):
+            return None
+        self.__get_capacity_matrix()
+        request = []
+        for resource, quantity in execution_strategy.resources.resources:
+            if resource.id != "any":
+                return None
+            column = self._resource_types.get(resource.name)
+            if column is not None:
+                request.append((column, quantity))
+            elif quantity > 0:
+                return None
+        return request
+
+    def __get_fit_mask(
+        self, execution_strategy: ExecutionStrategy
+    ) -> Optional[np.ndarray]:
+        """Computes the mask of the Workers (in the order of `self._workers`) that
+        can accomodate the given strategy from the capacity matrix.
+
+        Returns:
+            A boolean `np.ndarray` with an entry for each Worker, or `None` if the
+            strategy cannot be checked against the capacity matrix (i.e., it is a
+            `BatchStrategy`, or requests a resource with a specific ID).
+        """
+        if isinstance(execution_strategy, BatchStrategy):
+            return None
+        capacity_matrix = self.__get_capacity_matrix()
+        fit_mask = np.ones(len(capacity_matrix), dtype=bool)
+        for resource, quantity in execution_strategy.resources.resources:
+            if resource.id != "any":
+                return None
+            column = self._resource_types.get(resource.name)
+            if column is not None:
+                fit_mask &= capacity_matrix[:, column] >= quantity
+            elif quantity > 0:
+                fit_mask[:] = False
+        return fit_mask
+
+    def __get_vectorized_fit_mask(
+        self, execution_strategy: ExecutionStrategy
+    ) -> Optional[np.ndarray]:
+        if len(self._workers) < VECTORIZED_FIT_MIN_WORKERS:
+            return None
+        return self.__get_fit_mask(execution_strategy)
+
     def add_workers(self, workers: Sequence[Worker]):
         """Adds the given set of `Worker`s to this `WorkerPool`.
 
@@ -549,18 +829,22 @@ class WorkerPool(object):
         for worker in workers:
             if worker.id in self._workers:
                 self._logger.info(
-                    f"Skipping addition of {worker} since it already "
-                    f"exists in {self}"
+                    "Skipping addition of %s since it already exists in %s",
+                    worker,
+                    self,
                 )
             else:
-                self._logger.debug(f"Adding {worker} to {self}")
+                self._logger.debug("Adding %s to %s", worker, self)
                 self._workers[worker.id] = worker
+                self.__register_worker(worker)
+                self._capacity_matrix = None
 
     def place_task(
         self,
         task: Task,
         execution_strategy: Optional[ExecutionStrategy] = None,
         worker_id: Optional[str] = None,
+        fit_policy: FitPolicy = FitPolicy.FIRST_FIT,
     ) -> bool:
         """Places the task on this `WorkerPool`.
 
@@ -576,8 +860,11 @@ class WorkerPool(object):
             worker_id (`Optional[str]`): The ID of the Worker where the Task
                 is to be placed on this WorkerPool. If `None` and a secondary
                 scheduler is provided, the results from that scheduler are
-                used. Otherwise, the task is placed on the first worker that
-                can accomodate it.
+                used. Otherwise, the task is placed on the worker chosen by the
+                `fit_policy` among the workers that can accomodate it.
+            fit_policy (`FitPolicy`): The policy used to choose the worker that the
+                task is placed on, if an `execution_strategy` is provided without a
+                `worker_id` (defaults to the first worker that can accomodate it).
 
         Returns:
             False if the task could not be placed due to insufficient resources.
@@ -628,24 +915,39 @@ class WorkerPool(object):
             placement = placements.get_placement(task).worker_id
             strategy = placements.get_placement(task).execution_strategy
         elif execution_strategy is not None:
-            # If there was no scheduler, find the first worker that can
-            # accomodate the task given its resource requirements.
-            for _id, _worker in self._workers.items():
-                if _worker.can_accomodate_strategy(execution_strategy):
-                    placement = _id
-                    break
+            # If there was no scheduler, find the worker that can accomodate the
+            # task given its resource requirements according to the fit policy.
+            worker = self.get_fitting_worker(execution_strategy, fit_policy)
+            if worker is not None:
+                placement = worker.id
             strategy = execution_strategy
         else:
             # If there was no provided strategy, search if any strategy is executable
             # on any of the Workers.
-            for _id, _worker in self._workers.items():
-                for possible_strategy in task.available_execution_strategies:
-                    if _worker.can_accomodate_strategy(possible_strategy):
-                        placement = _id
-                        strategy = possible_strategy
+            possible_strategies = list(task.available_execution_strategies)
+            fit_masks = [
+                self.__get_vectorized_fit_mask(possible_strategy)
+                for possible_strategy in possible_strategies
+            ]
+            if len(fit_masks) > 0 and all(mask is not None for mask in fit_masks):
+                # Find the first worker that can accomodate any of the strategies, and
+                # the first of the strategies that it can accomodate.
+                fit_masks = np.vstack(fit_masks)
+                fitting_rows = np.flatnonzero(fit_masks.any(axis=0))
+                if len(fitting_rows) > 0:
+                    placement = self._worker_ids[fitting_rows[0]]
+                    strategy = possible_strategies[
+                        np.argmax(fit_masks[:, fitting_rows[0]])
+                    ]
+            else:
+                for _id, _worker in self._workers.items():
+                    for possible_strategy in possible_strategies:
+                        if _worker.can_accomodate_strategy(possible_strategy):
+                            placement = _id
+                            strategy = possible_strategy
+                            break
+                    if placement is not None:
                         break
-                if placement is not None:
-                    break
 
         if placement is None:
             self._logger.warning(
@@ -653,6 +955,7 @@ class WorkerPool(object):
             )
             return False
         else:
+            self.__save_placed_tasks()
             self._workers[placement].place_task(task, strategy)
             self._placed_tasks[task] = placement
             return True
@@ -671,6 +974,7 @@ class WorkerPool(object):
             raise ValueError(f"The task {task} was not placed on {self.id} WorkerPool.")
 
         # Deallocate the resources and remove the placed task.
+        self.__save_placed_tasks()
         self._workers[self._placed_tasks[task]].remove_task(
             current_time=current_time, task=task
         )
@@ -700,14 +1004,42 @@ class WorkerPool(object):
             The set of tasks that have finished execution.
         """
         completed_tasks = []
-        for _, worker in self._workers.items():
+        for worker in self.__get_active_workers():
             self._logger.debug(
-                f"Stepping through the execution of {worker} for {step_size} "
-                f"steps from time {current_time}"
+                "Stepping through the execution of %s for %s steps from time %s",
+                worker,
+                step_size,
+                current_time,
             )
             completed_tasks.extend(worker.step(current_time, step_size))
+            self.__update_activity(worker)
         return completed_tasks
 
+    def step_profiles(
+        self,
+        current_time: EventTime,
+        step_size: EventTime = EventTime(1, EventTime.Unit.US),
+    ) -> None:
+        """Steps the loading of the pending `WorkProfile`s across all the `Worker`s of
+        this `WorkerPool` by the given `step_size`, without stepping the placed tasks.
+
+        Args:
+            current_time (`EventTime`): The current time of the simulator (in us).
+            step_size (`EventTime`): The amount of time for which to step the
+                loading of the profiles (in us).
+        """
+        for worker in self.__get_active_workers():
+            worker.step_profiles(current_time, step_size)
+            self.__update_activity(worker)
+
+    def has_pending_profiles(self) -> bool:
+        """Check if any of the `Worker`s of this `WorkerPool` are loading profiles.
+
+        Returns:
+            `True` if any `Worker` has a pending `WorkProfile`, `False` otherwise.
+        """
+        return any(worker.get_pending_profiles() for worker in self._active_workers)
+
     def can_accomodate_strategy(self, execution_strategy: ExecutionStrategy) -> bool:
         """Checks if any of the `Worker`s of this `WorkerPool` can accomodate
         the given `ExecutionStrategy` based on its resource availability.
@@ -719,11 +1051,100 @@ class WorkerPool(object):
         Returns:
             `True` if the task can be placed, `False` otherwise.
         """
+        request = self.__get_capacity_request(execution_strategy)
+        if request is not None:
+            return self._capacity_index.find(request) is not None
         return any(
             worker.can_accomodate_strategy(execution_strategy)
             for worker in self._workers.values()
         )
 
+    def get_fitting_worker(
+        self,
+        execution_strategy: ExecutionStrategy,
+        fit_policy: FitPolicy = FitPolicy.FIRST_FIT,
+    ) -> Optional[Worker]:
+        """Retrieves the `Worker` of this `WorkerPool` chosen by the given
+        `FitPolicy` among the `Worker`s that can accomodate the `ExecutionStrategy`.
+
+        The best and the worst fits are decided by the free quantity of the first
+        resource requested by the strategy. The `Worker` is found in logarithmic time
+        from the free-capacity index of the `WorkerPool`, unless the `WorkerPool` is
+        small or the strategy cannot be checked against the index, in which case each
+        `Worker` is checked.
+
+        Args:
+            execution_strategy (`ExecutionStrategy`): The execution strategy to be
+                accomodated.
+            fit_policy (`FitPolicy`): The policy to choose among the `Worker`s that
+                can accomodate the strategy.
+
+        Returns:
+            The chosen `Worker` (the first one in the order of `workers` among the
+            ties), or `None` if no `Worker` can accomodate the strategy.
+        """
+        request = self.__get_capacity_request(execution_strategy)
+        if request is not None:
+            row = self._capacity_index.find(request, fit_policy)
+            return None if row is None else self._workers[self._worker_ids[row]]
+
+        fitting_workers = (
+            worker
+            for worker in self._workers.values()
+            if worker.can_accomodate_strategy(execution_strategy)
+        )
+        if fit_policy == FitPolicy.FIRST_FIT:
+            return next(fitting_workers, None)
+        first_resource = next(iter(execution_strategy.resources), None)
+        if first_resource is None:
+            return next(fitting_workers, None)
+        choose = min if fit_policy == FitPolicy.BEST_FIT else max
+        return choose(
+            fitting_workers,
+            key=lambda worker: worker.resources.get_available_quantity(first_resource),
+            default=None,
+        )
+
+    def get_fitting_workers(
+        self, execution_strategy: ExecutionStrategy
+    ) -> Sequence[Worker]:
+        """Retrieves the `Worker`s of this `WorkerPool` that can accomodate the given
+        `ExecutionStrategy` based on their resource availability.
+
+        The check is answered with a single operation over the capacity matrix of
+        the `WorkerPool`, unless the strategy is a `BatchStrategy` or requests a
+        resource with a specific ID, in which case each `Worker` is checked.
+
+        Args:
+            execution_strategy (`ExecutionStrategy`): The execution strategy to be
+                accomodated.
+
+        Returns:
+            The `Worker`s that can accomodate the strategy (in the order of `workers`).
+        """
+        fit_mask = self.__get_fit_mask(execution_strategy)
+        workers = self.workers
+        if fit_mask is None:
+            return [
+                worker
+                for worker in workers
+                if worker.can_accomodate_strategy(execution_strategy)
+            ]
+        return [workers[row] for row in np.flatnonzero(fit_mask)]
+
+    def get_capacity_matrix(self) -> np.ndarray:
+        """Retrieves the available quantity of each resource type on each `Worker`
+        of this `WorkerPool`.
+
+        Returns:
+            A read-only `np.ndarray` with a row for each `Worker` (in the order of
+            `workers`) and a column for each resource type (in the order of
+            `resource_types`).
+        """
+        capacity_matrix = self.__get_capacity_matrix().view()
+        capacity_matrix.flags.writeable = False
+        return capacity_matrix
+
     def get_utilization(self) -> Sequence[str]:
         """Retrieves the utilization of the resources of a particular WorkerPool in
         CSV format.
@@ -826,6 +1247,13 @@ class WorkerPool(object):
     def workers(self):
         return list(self._workers.values())
 
+    @property
+    def resource_types(self) -> Sequence[str]:
+        """Returns the names of the resource types available across the `Worker`s of
+        this `WorkerPool`, in the order of the columns of the capacity matrix."""
+        self.__get_capacity_matrix()
+        return list(self._resource_types)
+
     @property
     def resources(self):
         # Add the resources of all the workers in this pool.
@@ -938,6 +1366,57 @@ class WorkerPools(object):
         """
         return all(worker_pool.is_full() for worker_pool in self._worker_pools.values())
 
+    @property
+    def resource_types(self) -> Sequence[str]:
+        """Returns the names of the resource types available across all the
+        `WorkerPool`s, in the order of the columns of the capacity matrix."""
+        resource_types = {}
+        for worker_pool in self._worker_pools.values():
+            for resource_type in worker_pool.resource_types:
+                resource_types.setdefault(resource_type, len(resource_types))
+        return list(resource_types)
+
+    def get_capacity_matrix(self) -> np.ndarray:
+        """Retrieves the available quantity of each resource type on each `Worker`
+        across all the `WorkerPool`s.
+
+        Returns:
+            An `np.ndarray` with a row for each `Worker` (in the order of the
+            `worker_pools` and their `workers`) and a column for each resource type
+            (in the order of `resource_types`).
+        """
+        resource_types = {
+            resource_type: column
+            for column, resource_type in enumerate(self.resource_types)
+        }
+        capacity_matrices = []
+        for worker_pool in self._worker_pools.values():
+            capacity_matrix = np.zeros((len(worker_pool), len(resource_types)))
+            columns = [
+                resource_types[resource_type]
+                for resource_type in worker_pool.resource_types
+            ]
+            capacity_matrix[:, columns] = worker_pool.get_capacity_matrix()
+            capacity_matrices.append(capacity_matrix)
+        if len(capacity_matrices) == 0:
+            return np.zeros((0, len(resource_types)))
+        return np.vstack(capacity_matrices)
+
+    def begin_transaction(self, reset: bool = False) -> "WorkerPoolsTransaction":
+        """Begins a transaction over these `WorkerPools`, in which the schedulers can
+        try placement decisions on the current state of the `WorkerPool`s without
+        copying them.
+
+        Args:
+            reset (`bool`): If `True`, all the placed tasks and profiles are
+                tentatively removed from the `Worker`s at the start of the
+                transaction (as with a `deepcopy` of the `WorkerPools`).
+
+        Returns:
+            A `WorkerPoolsTransaction` that must be either committed or rolled back.
+        """
+        return WorkerPoolsTransaction(self, reset=reset)
+
     @property
     def worker_pools(self) -> Sequence[WorkerPool]:
         """Retrieve the collection of :py:class:`WorkerPool` instances stored in this
@@ -962,3 +1441,110 @@ class WorkerPools(object):
 
     def __len__(self):
         return len(self._worker_pools)
+
+
+class WorkerPoolsTransaction(object):
+    """A `WorkerPoolsTransaction` records tentative changes made to a set of
+    `WorkerPools`, such that they can be either rolled back or committed.
+
+    The changes are made directly on the `WorkerPool`s and their `Worker`s. The
+    state of each `Worker` (and the placed tasks of each `WorkerPool`) is saved
+    before it is changed for the first time in the transaction, and is restored
+    upon a rollback. Thus, the cost of the transaction is proportional to the
+    number of `Worker`s that are changed, instead of the size of the cluster as
+    with a copy of the `WorkerPools`.
+
+    The transaction can be used as a context manager, in which case it is rolled
+    back upon exit unless it was committed.
+
+    Args:
+        worker_pools (`WorkerPools`): The `WorkerPools` to make the changes on.
+        reset (`bool`): If `True`, all the placed tasks and profiles are tentatively
+            removed from the `Worker`s at the start of the transaction.
+    """
+
+    def __init__(self, worker_pools: WorkerPools, reset: bool = False) -> None:
+        self._worker_pools = worker_pools
+        self._saved_workers: Mapping[Worker, tuple] = {}
+        self._saved_worker_pools: Mapping[WorkerPool, Mapping[Task, str]] = {}
+        for worker_pool in worker_pools.worker_pools:
+            if worker_pool._transaction is not None:
+                raise RuntimeError(
+                    f"The WorkerPool {worker_pool.id} is already part of a "
+                    f"transaction."
+                )
+        for worker_pool in worker_pools.worker_pools:
+            worker_pool._transaction = self
+        self._is_active = True
+
+        if reset:
+            for worker_pool in worker_pools.worker_pools:
+                if worker_pool._placed_tasks:
+                    self._save_worker_pool(worker_pool)
+                    worker_pool._placed_tasks = {}
+                for worker in worker_pool.workers:
+                    if (
+                        worker._placed_tasks
+                        or worker._available_profiles
+                        or worker._pending_profiles
+                        or worker.resources._current_allocations
+                    ):
+                        self._save_worker(worker)
+                        worker._reset_state()
+
+    def _save_worker(self, worker: Worker) -> None:
+        if worker not in self._saved_workers:
+            self._saved_workers[worker] = worker._save_state()
+
+    def _save_worker_pool(self, worker_pool: WorkerPool) -> None:
+        if worker_pool not in self._saved_worker_pools:
+            self._saved_worker_pools[worker_pool] = dict(worker_pool._placed_tasks)
+
+    def __end(self) -> None:
+        if not self._is_active:
+            raise RuntimeError("The transaction has already ended.")
+        for worker_pool in self._worker_pools.worker_pools:
+            worker_pool._transaction = None
+        self._saved_workers = {}
+        self._saved_worker_pools = {}
+        self._is_active = False
+
+    def rollback(self) -> None:
+        """Undoes all the changes made to the `WorkerPools` in this transaction."""
+        if self._is_active:
+            for worker, state in self._saved_workers.items():
+                worker._restore_state(state)
+            for worker_pool, placed_tasks in self._saved_worker_pools.items():
+                worker_pool._placed_tasks = placed_tasks
+        self.__end()
+
+    def commit(self) -> None:
+        """Keeps all the changes made to the `WorkerPools` in this transaction."""
+        self.__end()
+
+    def get_placed_tasks(self) -> Sequence[Task]:
+        return self._worker_pools.get_placed_tasks()
+
+    def get_worker_pool(self, worker_pool_id: str) -> Optional[WorkerPool]:
+        return self._worker_pools.get_worker_pool(worker_pool_id)
+
+    def is_full(self) -> bool:
+        return self._worker_pools.is_full()
+
+    @property
+    def worker_pools(self) -> Sequence[WorkerPool]:
+        return self._worker_pools.worker_pools
+
+    @property
+    def is_active(self) -> bool:
+        return self._is_active
+
+    def __enter__(self) -> "WorkerPoolsTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._is_active:
+            self.rollback()
+
+    def __len__(self):
+        return len(self._worker_pools)
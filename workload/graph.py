@@ -12,6 +12,7 @@ from typing import (
 )
 
 T = TypeVar("T")
+R = TypeVar("R")
 
 
 class Graph(Generic[T]):
@@ -21,6 +22,9 @@ class Graph(Generic[T]):
     def __init__(self, nodes: Optional[Mapping[T, Sequence[T]]] = {}):
         self._graph = defaultdict(list)
         self._parent_graph = defaultdict(list)
+        # The results of the structural queries (e.g., the sources and the topological
+        # sort) are cached until the structure of the graph changes.
+        self._structure_cache = {}
 
         for node, children in nodes.items():
             self.add_node(node, *children)
@@ -33,6 +37,7 @@ class Graph(Generic[T]):
             children: The children of the node, if any.
         """
         self._graph[node].extend([])
+        self._invalidate_structure()
         for child in children:
             self.add_child(node, child)
 
@@ -52,6 +57,7 @@ class Graph(Generic[T]):
         self._graph[node].append(child)
         self._graph[child].extend([])
         self._parent_graph[child].append(node)
+        self._invalidate_structure()
 
     def get_children(self, node: T) -> Sequence[T]:
         """Retrieves the children nodes of the given node.
@@ -93,11 +99,10 @@ class Graph(Generic[T]):
         Returns:
             The source nodes from the given graph.
         """
-        sources = []
-        for node in self._graph:
-            if len(self.get_parents(node)) == 0:
-                sources.append(node)
-        return sources
+        return self._get_cached_structure(
+            "sources",
+            lambda: [node for node in self._graph if len(self.get_parents(node)) == 0],
+        )
 
     def get_nodes(self) -> Sequence[T]:
         """Retrieves the nodes stored in the given graph.
@@ -136,16 +141,18 @@ class Graph(Generic[T]):
         if node not in self._graph:
             raise ValueError(f"The node {node} was not found in the graph.")
 
-        node_to_depth = defaultdict(lambda: 1)
-        for _node in self.topological_sort():
-            if len(self.get_parents(_node)) > 0:
+        def compute_depths():
+            node_to_depth = {}
+            for _node in self.topological_sort():
+                parents = self.get_parents(_node)
                 node_to_depth[_node] = (
-                    func([node_to_depth[parent] for parent in self.get_parents(_node)])
-                    + 1
+                    func([node_to_depth[parent] for parent in parents]) + 1
+                    if len(parents) > 0
+                    else 1
                 )
+            return node_to_depth
 
-            if node == _node:
-                return node_to_depth[node]
+        return self._get_cached_structure(("depths", func), compute_depths)[node]
 
     def is_source(self, node: T) -> bool:
         """Checks whether the given node is a source.
@@ -185,6 +192,7 @@ class Graph(Generic[T]):
         for child in self.get_children(node):
             self._parent_graph[child].remove(node)
         del self._graph[node]
+        self._invalidate_structure()
 
     def breadth_first(self, node: T = None) -> Generator[T, None, None]:
         """Iterates over the graph in a breadth-first manner.
@@ -249,6 +257,9 @@ class Graph(Generic[T]):
         Raises:
             `RuntimeError` if the graph has a cycle.
         """
+        return self._get_cached_structure("topological_sort", self.__topological_sort)
+
+    def __topological_sort(self) -> List[T]:
         node_marks = {node: "Unmarked" for node in self.get_nodes()}
         topological_sort = []
 
@@ -278,6 +289,15 @@ class Graph(Generic[T]):
             A `List[T]` that contains an ordered list of nodes that form the longest
             path from a source node to a sink node.
         """
+        if weights is None:
+            # The longest path with the default weights only depends on the structure
+            # of the graph, and can be cached along with it.
+            return self._get_cached_structure(
+                "longest_path", lambda: self.__get_longest_path(None)
+            )
+        return self.__get_longest_path(weights)
+
+    def __get_longest_path(self, weights) -> List[T]:
         if weights is None:
             # If a function for the weights was not specified, use the
             # notion that if the longest path was just a source, it would be 1.
@@ -342,6 +362,31 @@ class Graph(Generic[T]):
         else:
             return check_dependency(node_1, node_2)
 
+    def _get_cached_structure(self, key, compute: Callable[[], R]) -> R:
+        """Retrieves the result of the structural query identified by the given key,
+        computing it (and caching it until the structure of the graph changes) if
+        required.
+
+        The cached results are shared by all the callers, and must not be modified.
+
+        Args:
+            key: The (hashable) key identifying the structural query.
+            compute: A function that computes the result of the query.
+
+        Returns:
+            The result of the structural query.
+        """
+        try:
+            return self._structure_cache[key]
+        except KeyError:
+            result = self._structure_cache[key] = compute()
+            return result
+
+    def _invalidate_structure(self) -> None:
+        """Invalidates the cached results of the structural queries. This must be
+        invoked upon every change to the nodes or the edges of the graph."""
+        self._structure_cache.clear()
+
     def to_dot(self, filename: str) -> None:
         """Save a DOT representation of the Graph to the given `filename`.
 
@@ -2,19 +2,20 @@ import math
 import random
 import sys
 import uuid
+from array import array
 from enum import Enum
 from functools import cached_property
-from typing import List, Mapping, Optional, Sequence, Tuple
+from typing import List, Mapping, NamedTuple, Optional, Sequence, Tuple
 
 import absl
 import numpy as np
 
-from utils import EventTime, setup_logging
+from utils import EventTime
 
 from .graph import Graph
 from .profile import WorkProfile
 from .strategy import ExecutionStrategies
-from .tasks import Task, TaskGraph
+from .tasks import Task, TaskGraph, get_task_logger
 
 
 class FakeRandomNumberGenerator:
@@ -671,6 +672,34 @@ class JobGraph(Graph[Job]):
                 f"concurrency={self._concurrency}, start_time={self.start_time})"
             )
 
+    class Template(NamedTuple):
+        """The structure of a `JobGraph` that is computed once, and shared by all the
+        `TaskGraph`s generated from it (see `JobGraph.template`).
+
+        The edges are stored as a compressed sparse row (CSR) adjacency over the
+        indices of the Jobs, i.e., the children of `jobs[i]` are the Jobs at the
+        indices `children[children_offsets[i] : children_offsets[i + 1]]`.
+
+        Attributes:
+            jobs: The Jobs of the JobGraph, in the order of the JobGraph.
+            job_indices: A mapping from the name of each Job to its index.
+            children_offsets: The offsets of the children of each Job.
+            children: The indices of the children of the Jobs.
+            generation_order: The indices of the Jobs in the (breadth-first) order
+                in which their Tasks are generated.
+            is_source: Whether each Job is a source of the JobGraph.
+            critical_path_time: The runtime of the longest path of the JobGraph,
+                with the Jobs that are never executed contributing no runtime.
+        """
+
+        jobs: Tuple[Job, ...]
+        job_indices: Mapping[str, int]
+        children_offsets: Sequence[int]
+        children: Sequence[int]
+        generation_order: Sequence[int]
+        is_source: Tuple[bool, ...]
+        critical_path_time: EventTime
+
     def __init__(
         self,
         name: str,
@@ -787,12 +816,6 @@ class JobGraph(Graph[Job]):
             deadline_bounds = (_flags.min_deadline, _flags.max_deadline)
             use_branch_predicated_deadlines = _flags.use_branch_predicated_deadlines
             resolve_conditionals = _flags.resolve_conditionals_at_submission
-            task_logger = setup_logging(
-                name="Task",
-                log_dir=_flags.log_dir,
-                log_file=_flags.log_file_name,
-                log_level=_flags.log_level,
-            )
         else:
             random_number_generator = None
             deadline_variance = (
@@ -803,7 +826,7 @@ class JobGraph(Graph[Job]):
             deadline_bounds = (0, sys.maxsize)
             use_branch_predicated_deadlines = False
             resolve_conditionals = False
-            task_logger = setup_logging(name="Task")
+        task_logger = get_task_logger(_flags)
 
         # Generate the deadline for all the Tasks.
         # TODO (Sukrit): Right now, this assumes that all Tasks in the TaskGraph come
@@ -814,28 +837,33 @@ class JobGraph(Graph[Job]):
         )
 
         # Generate all the `Task`s from the `Job`s in the graph.
-        job_to_task_mapping = {}
-        for job in self.breadth_first():
-            task_release_time = (
-                release_time
-                if self.is_source(job)
-                else EventTime(-1, EventTime.Unit.US)
-            )
-            job_to_task_mapping[job.name] = Task(
+        template = self.template
+        tasks: List[Optional[Task]] = [None] * len(template.jobs)
+        unreleased_time = EventTime(-1, EventTime.Unit.US)
+        for index in template.generation_order:
+            job = template.jobs[index]
+            tasks[index] = Task(
                 name=job.name,
                 task_graph=task_graph_name,
                 job=job,
                 deadline=task_deadline,
                 timestamp=timestamp,
-                release_time=task_release_time,
+                release_time=(
+                    release_time if template.is_source[index] else unreleased_time
+                ),
                 _logger=task_logger,
             )
 
         # Generate a TaskGraph from the generated Tasks.
         task_graph_mapping = {}
-        for parent, children in self._graph.items():
-            parent_task = job_to_task_mapping[parent.name]
-            task_children = [job_to_task_mapping[child.name] for child in children]
+        children_offsets, children = template.children_offsets, template.children
+        for index, parent_task in enumerate(tasks):
+            task_children = [
+                tasks[child]
+                for child in children[
+                    children_offsets[index] : children_offsets[index + 1]
+                ]
+            ]
             if (
                 resolve_conditionals
                 and parent_task.conditional
@@ -856,7 +884,9 @@ class JobGraph(Graph[Job]):
                         for grand_child_job in self.breadth_first(child.job):
                             if grand_child_job.terminal:
                                 break
-                            grand_child_task = job_to_task_mapping[grand_child_job.name]
+                            grand_child_task = tasks[
+                                template.job_indices[grand_child_job.name]
+                            ]
                             grand_child_task.update_probability(0.0)
             task_graph_mapping[parent_task] = task_children
 
@@ -881,7 +911,7 @@ class JobGraph(Graph[Job]):
                 start=EventTime.zero(),
             )
         else:
-            weighted_task_graph_length = self.__get_completion_time()
+            weighted_task_graph_length = template.critical_path_time
 
         task_graph_deadline = release_time + weighted_task_graph_length.fuzz(
             deadline_variance, deadline_bounds
@@ -961,6 +991,36 @@ class JobGraph(Graph[Job]):
             start=start,
         )
 
+    @property
+    def template(self) -> "JobGraph.Template":
+        """Retrieves the `Template` of this JobGraph, which is computed upon the first
+        request after a change to the structure of the JobGraph.
+
+        Returns:
+            The `JobGraph.Template` shared by the TaskGraphs generated from the graph.
+        """
+        return self._get_cached_structure("template", self.__build_template)
+
+    def __build_template(self) -> "JobGraph.Template":
+        jobs = tuple(self._graph.keys())
+        job_indices = {job.name: index for index, job in enumerate(jobs)}
+        children_offsets, children = array("I", [0]), array("I")
+        for job in jobs:
+            children.extend(job_indices[child.name] for child in self._graph[job])
+            children_offsets.append(len(children))
+        return JobGraph.Template(
+            jobs=jobs,
+            job_indices=job_indices,
+            children_offsets=children_offsets,
+            children=children,
+            generation_order=array(
+                "I",
+                dict.fromkeys(job_indices[job.name] for job in self.breadth_first()),
+            ),
+            is_source=tuple(self.is_source(job) for job in jobs),
+            critical_path_time=self.__get_completion_time(),
+        )
+
     @property
     def completion_time(self) -> EventTime:
         if not self._completion_time and len(self) != 0:
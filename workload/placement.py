@@ -1,13 +1,15 @@
-import random
-import uuid
 from enum import Enum
 from functools import total_ordering
+from itertools import count
 from typing import Optional, Sequence, Union
 
 from utils import EventTime
 
 from .strategy import ExecutionStrategy
 
+# The IDs of the `Placement`s are assigned from a process-wide counter.
+_placement_ids = count()
+
 
 class Placement(object):
     """A mapping of a particular Task / WorkProfile to its executing Worker determined
@@ -66,6 +68,16 @@ class Placement(object):
         def __eq__(self, other) -> bool:
             return self.value == other.value
 
+    __slots__ = (
+        "_placement_type",
+        "_computation",
+        "_placement_time",
+        "_worker_pool_id",
+        "_worker_id",
+        "_strategy",
+        "_id",
+    )
+
     def __init__(
         self,
         type: PlacementType,
@@ -81,7 +93,7 @@ class Placement(object):
         self._worker_pool_id = worker_pool_id
         self._worker_id = worker_id
         self._strategy = strategy
-        self._id = uuid.UUID(int=random.getrandbits(128), version=4)
+        self._id = next(_placement_ids)
 
     def is_placed(self) -> bool:
         """Check if the computation associated with this Placement was placed on a
@@ -169,7 +181,7 @@ class Placement(object):
     @property
     def id(self) -> str:
         """Returns the ID of the Placement."""
-        return self._id
+        return str(self._id)
 
     @property
     def computation_id(self) -> str:
@@ -27,6 +27,9 @@ class Resource(object):
         self._id = (
             uuid.UUID(int=random.getrandbits(128), version=4) if _id is None else _id
         )
+        # The hash is cached since the Resources are used as keys in the
+        # `Resources` indices, and stringifying the UUID on each lookup is costly.
+        self._hash = hash((self._name, str(self._id)))
 
     @property
     def name(self):
@@ -43,7 +46,7 @@ class Resource(object):
         return str(self)
 
     def __hash__(self):
-        return hash((self.name, self.id))
+        return self._hash
 
     def __copy__(self):
         """Copies self and returns a new instance of Resource that shares
@@ -52,6 +55,7 @@ class Resource(object):
         instance = cls.__new__(cls)
         cls.__init__(instance, name=self.name)
         instance._id = self._id
+        instance._hash = self._hash
         return instance
 
     def __deepcopy__(self, memo):
@@ -61,6 +65,7 @@ class Resource(object):
         instance = cls.__new__(cls)
         cls.__init__(instance, name=self.name)
         instance._id = uuid.UUID(self.id)
+        instance._hash = self._hash
         memo[id(self)] = instance
         return instance
 
@@ -42,19 +42,68 @@ class Resources(object):
         else:
             self._logger = utils.setup_logging(name=self.__class__.__name__)
 
+        if not all(map(lambda x: type(x) == Resource, resource_vector)):
+            raise ValueError(
+                "The keys for the resource vector " "should be of type 'Resource'"
+            )
         self._resource_vector = defaultdict(int)
         self.__total_resources = defaultdict(int)
         for resource, quantity in resource_vector.items():
             self._resource_vector[copy(resource)] = quantity
             self.__total_resources[copy(resource)] = quantity
-        if not all(map(lambda x: type(x) == Resource, self._resource_vector)):
-            raise ValueError(
-                "The keys for the resource vector " "should be of type 'Resource'"
-            )
         self._current_allocations: Mapping[
             Union["Task", "WorkProfile"], Sequence[Tuple[Resource, int]]  # noqa: F821
         ] = defaultdict(list)
         self.__virtual = __virtual
+        self.__build_indices()
+
+    def __build_indices(self) -> None:
+        """Builds the indices that answer the queries for the quantities and the
+        allocations of the resources without scanning all the resource instances.
+
+        The indices maintain the available and total quantities of the resources of
+        each name, the resource instances of each name (in their insertion order),
+        and a mapping from each resource instance to the computations allocated on it.
+        """
+        self._available_quantities: Mapping[str, int] = defaultdict(int)
+        self._total_quantities: Mapping[str, int] = defaultdict(int)
+        self._resources_by_name: Mapping[str, List[Resource]] = defaultdict(list)
+        self._any_resources: Mapping[str, Resource] = {}
+        for resource, quantity in self.__total_resources.items():
+            self.__index_resource(resource)
+            self._total_quantities[resource.name] += quantity
+        for resource, quantity in self._resource_vector.items():
+            self._available_quantities[resource.name] += quantity
+        self._allocated_computations: Mapping[
+            Resource, Mapping[Union["Task", "WorkProfile"], List[int]]  # noqa: F821
+        ] = defaultdict(dict)
+        for computation, allocations in self._current_allocations.items():
+            for resource, quantity in allocations:
+                self._allocated_computations[resource].setdefault(
+                    computation, []
+                ).append(quantity)
+
+    def __index_resource(self, resource: Resource) -> None:
+        self._resources_by_name[resource.name].append(resource)
+        if resource.id == "any":
+            self._any_resources[resource.name] = resource
+
+    def __get_quantity(
+        self,
+        resource: Resource,
+        quantities: Mapping[Resource, int],
+        quantities_by_name: Mapping[str, int],
+    ) -> int:
+        """Retrieves the quantity of the given resource from the quantities of the
+        resource instances (if the resource has a specific `id`) or from the
+        aggregate quantities of the resources of its name (otherwise)."""
+        if resource.id == "any":
+            return quantities_by_name.get(resource.name, 0)
+        quantity = quantities.get(resource, 0)
+        any_resource = self._any_resources.get(resource.name)
+        if any_resource is not None:
+            quantity += quantities.get(any_resource, 0)
+        return quantity
 
     def add_resource(self, resource: Resource, quantity: Optional[int] = 1):
         """Add the given quantity of the specified resource.
@@ -66,10 +115,14 @@ class Resources(object):
         """
         if type(resource) != Resource:
             raise ValueError(f"Invalid type for resource: {type(resource)}")
+        if resource not in self.__total_resources:
+            self.__index_resource(resource)
         self._resource_vector[resource] += quantity
         self.__total_resources[resource] += quantity
+        self._available_quantities[resource.name] += quantity
+        self._total_quantities[resource.name] += quantity
         if not self.__virtual:
-            self._logger.debug(f"Added {resource} [quantity={quantity}] to {self}")
+            self._logger.debug("Added %s [quantity=%s] to %s", resource, quantity, self)
 
     def allocate(
         self,
@@ -98,33 +151,45 @@ class Resources(object):
                 f"requested {quantity}, available {available_quantity}"
             )
 
-        # Go over the list of resources and allocate the required number of
-        # resources of the given type.
+        # Go over the list of resources with the given name and allocate the required
+        # number of resources of the given type.
         remaining_quantity = quantity
-        for _resource in self._resource_vector:
+        for _resource in self._resources_by_name.get(resource.name, ()):
             if _resource == resource:
                 _quantity = self._resource_vector[_resource]
                 if _quantity >= remaining_quantity:
                     if not self.__virtual:
                         self._logger.debug(
-                            f"Allocated {_resource} "
-                            f"[quantity={remaining_quantity}] from {self}"
+                            "Allocated %s [quantity=%s] from %s",
+                            _resource,
+                            remaining_quantity,
+                            self,
                         )
                     self._resource_vector[_resource] = _quantity - remaining_quantity
+                    self._available_quantities[_resource.name] -= remaining_quantity
                     self._current_allocations[computation].append(
                         (_resource, remaining_quantity)
                     )
+                    self._allocated_computations[_resource].setdefault(
+                        computation, []
+                    ).append(remaining_quantity)
                     break
                 elif _quantity > 0:
                     if not self.__virtual:
                         self._logger.debug(
-                            f"Allocated {_resource} [quantity={_quantity}] "
-                            f"from {self}"
+                            "Allocated %s [quantity=%s] from %s",
+                            _resource,
+                            _quantity,
+                            self,
                         )
                     self._resource_vector[_resource] = 0
+                    self._available_quantities[_resource.name] -= _quantity
                     self._current_allocations[computation].append(
                         (_resource, _quantity)
                     )
+                    self._allocated_computations[_resource].setdefault(
+                        computation, []
+                    ).append(_quantity)
                 remaining_quantity -= _quantity
 
             if remaining_quantity == 0:
@@ -159,10 +224,18 @@ class Resources(object):
             A `List[Tuple[Union[Task, WorkProfile], int]]` signifying the `computation`
             and the quantity allocated to it.
         """
+        if resource.id == "any":
+            allocated_resources = self._resources_by_name.get(resource.name, ())
+        else:
+            allocated_resources = [resource]
+            if resource.name in self._any_resources:
+                allocated_resources.append(self._any_resources[resource.name])
+
         allocated_tasks = []
-        for computation, allocations in self._current_allocations.items():
-            for allocated_resource, allocated_quantity in allocations:
-                if resource == allocated_resource:
+        for allocated_resource in allocated_resources:
+            allocations = self._allocated_computations.get(allocated_resource, {})
+            for computation, allocated_quantities in allocations.items():
+                for allocated_quantity in allocated_quantities:
                     allocated_tasks.append((computation, allocated_quantity))
         return allocated_tasks
 
@@ -197,8 +270,11 @@ class Resources(object):
         for resource, quantity in resources._resource_vector.items():
             if not self.__virtual:
                 self._logger.debug(
-                    f"Allocating {quantity} of {resource} from {self} to "
-                    f"{computation}."
+                    "Allocating %s of %s from %s to %s.",
+                    quantity,
+                    resource,
+                    self,
+                    computation,
                 )
             self.allocate(resource=resource, computation=computation, quantity=quantity)
 
@@ -216,11 +292,9 @@ class Resources(object):
         Returns:
             The available quantity of the given resource.
         """
-        resource_quantity = 0
-        for _resource, _quantity in self._resource_vector.items():
-            if _resource == resource:
-                resource_quantity += _quantity
-        return resource_quantity
+        return self.__get_quantity(
+            resource, self._resource_vector, self._available_quantities
+        )
 
     def get_allocated_quantity(self, resource: Resource) -> int:
         """Get the quantity of the given `resource` that has been allocated.
@@ -246,11 +320,9 @@ class Resources(object):
         Returns:
             An `int` total quantity of the `resource`.
         """
-        total_quantity = 0
-        for _resource, _quantity in self.__total_resources.items():
-            if _resource == resource:
-                total_quantity += _quantity
-        return total_quantity
+        return self.__get_quantity(
+            resource, self.__total_resources, self._total_quantities
+        )
 
     def deallocate(
         self, computation: Union["Task", "WorkProfile"]  # noqa: F821
@@ -272,16 +344,44 @@ class Resources(object):
 
         for resource, quantity in self._current_allocations[computation]:
             self._resource_vector[resource] += quantity
+            self._available_quantities[resource.name] += quantity
+            self._allocated_computations[resource].pop(computation, None)
 
         del self._current_allocations[computation]
 
+    def _save_allocations(self) -> Tuple[Mapping, Mapping]:
+        """Saves the current allocations of these Resources, so that they can be
+        restored by `_restore_allocations` after tentative changes."""
+        return (
+            defaultdict(int, self._resource_vector),
+            defaultdict(
+                list,
+                (
+                    (computation, list(allocations))
+                    for computation, allocations in self._current_allocations.items()
+                ),
+            ),
+        )
+
+    def _restore_allocations(self, allocations: Tuple[Mapping, Mapping]) -> None:
+        """Restores the allocations saved by `_save_allocations`."""
+        self._resource_vector, self._current_allocations = allocations
+        self.__build_indices()
+
+    def _clear_allocations(self) -> None:
+        """Removes all the allocations from these Resources, making the total
+        quantity of each resource available."""
+        self._restore_allocations(
+            (defaultdict(int, self.__total_resources), defaultdict(list))
+        )
+
     def empty(self) -> bool:
         """Check if the Resources instance has no available resources.
 
         Returns:
             `True` if there are no resources available, `False` otherwise.
         """
-        return all(quantity == 0 for quantity in self._resource_vector.values())
+        return all(quantity == 0 for quantity in self._available_quantities.values())
 
     def get_unique_resource_types(self) -> Mapping[Resource, int]:
         """Returns the total quantity of each unique type of Resource in
@@ -292,14 +392,10 @@ class Resources(object):
             Resource(name, id="any"), and quantity is the total quantity
             of that resource.
         """
-        unique_resource_types = {}
-        for resource in self.__total_resources.keys():
-            if resource.name not in unique_resource_types:
-                resource_type = Resource(name=resource.name, _id="any")
-                unique_resource_types[resource_type] = self.get_total_quantity(
-                    resource_type
-                )
-        return unique_resource_types
+        return {
+            Resource(name=name, _id="any"): quantity
+            for name, quantity in self._total_quantities.items()
+        }
 
     @property
     def resources(self) -> List[Tuple[Resource, int]]:
@@ -433,4 +529,5 @@ class Resources(object):
         resources._resource_vector = resource_vector
         resources.__total_resources = total_resources_vector
         resources._current_allocations = current_allocations
+        resources.__build_indices()
         return resources
@@ -1,13 +1,16 @@
-import random
-import uuid
 from copy import copy, deepcopy
-from functools import cached_property, total_ordering
+from functools import total_ordering
+from itertools import count
 from typing import Iterator, Optional, Sequence
 
 from utils import EventTime
 
 from .resources import Resources
 
+# The IDs of the `ExecutionStrategy`s (and `BatchStrategy`s) are assigned from a
+# process-wide counter.
+_execution_strategy_ids = count()
+
 
 @total_ordering
 class ExecutionStrategy(object):
@@ -27,13 +30,15 @@ class ExecutionStrategy(object):
             if this execution strategy is chosen.
     """
 
+    __slots__ = ("_resources", "_batch_size", "_runtime", "_id", "_hash")
+
     def __init__(
         self, resources: Resources, batch_size: int, runtime: EventTime
     ) -> None:
         self._resources = resources
         self._batch_size = batch_size
         self._runtime = runtime
-        self._id = uuid.UUID(int=random.getrandbits(128), version=4)
+        self._id = next(_execution_strategy_ids)
         self._hash = hash(self._id)
 
     @property
@@ -48,7 +53,7 @@ class ExecutionStrategy(object):
     def runtime(self) -> EventTime:
         return self._runtime
 
-    @cached_property
+    @property
     def id(self) -> str:
         return str(self._id)
 
@@ -114,16 +119,16 @@ class BatchStrategy(ExecutionStrategy):
             if this execution strategy is chosen.
     """
 
+    __slots__ = ()
+
     def __init__(self, execution_strategy=ExecutionStrategy) -> None:
         super().__init__(
             resources=copy(execution_strategy.resources),
             batch_size=execution_strategy.batch_size,
             runtime=copy(execution_strategy.runtime),
         )
-        self._id = uuid.UUID(int=random.getrandbits(128), version=4)
-        self._hash = hash(self._id)
 
-    @cached_property
+    @property
     def id(self) -> str:
         return str(self._id)
 
@@ -1,11 +1,13 @@
 import logging
 import random
 import sys
-import uuid
 from collections import defaultdict, deque
 from enum import Enum
 from functools import cached_property, total_ordering
-from typing import Mapping, Optional, Sequence, Tuple, Union
+from itertools import count
+from typing import Callable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import absl  # noqa: F401
 
 from utils import EventTime, setup_logging
 
@@ -39,6 +41,44 @@ class TaskState(Enum):
 # Only PREEMPTED, SCHEDULED and VIRTUAL tasks can be released.
 RELEASABLE_TASK_STATES = (TaskState.VIRTUAL, TaskState.SCHEDULED, TaskState.PREEMPTED)
 
+# Tasks in the EVICTED, COMPLETED and CANCELLED states will never execute again.
+TERMINAL_TASK_STATES = (TaskState.EVICTED, TaskState.COMPLETED, TaskState.CANCELLED)
+
+# The IDs of the `Task`s are assigned from a process-wide counter.
+_task_ids = count()
+
+# The logger shared by all the `Task`s. Since `logging` caches every logger that is
+# set up for the lifetime of the process, the Tasks must not set up one of their own.
+TASK_LOGGER_NAME = "Task"
+_task_logger: Optional[logging.Logger] = None
+
+
+def get_task_logger(_flags: Optional["absl.flags"] = None) -> logging.Logger:
+    """Retrieves the logger shared by all the `Task`s.
+
+    The logger is set up upon the first invocation (using the logging configuration
+    from the command line flags, if provided), and is returned as is afterwards.
+
+    Args:
+        _flags (`Optional[absl.flags]`): The runtime flags that are used to set up
+            the logger.
+
+    Returns:
+        The `logging.Logger` instance to be used by the Tasks.
+    """
+    global _task_logger
+    if _task_logger is None:
+        if _flags:
+            _task_logger = setup_logging(
+                name=TASK_LOGGER_NAME,
+                log_dir=_flags.log_dir,
+                log_file=_flags.log_file_name,
+                log_level=_flags.log_level,
+            )
+        else:
+            _task_logger = setup_logging(name=TASK_LOGGER_NAME)
+    return _task_logger
+
 
 @total_ordering
 class Task(object):
@@ -72,16 +112,52 @@ class Task(object):
         probability (`float`): The probability with which this Task will be executed.
             If `None`, the probability is retrieved from the creating Job.
         _logger(`Optional[logging.Logger]`): The logger to use to log the
-            results of the execution.
+            results of the execution. If `None`, the logger shared by all the Tasks
+            (see `get_task_logger`) is used.
     """
 
     class Preemption:
+        __slots__ = (
+            "preemption_time",
+            "old_worker_pool",
+            "restart_time",
+            "new_worker_pool",
+        )
+
         def __init__(self, preemption_time, old_worker_pool):
             self.preemption_time = preemption_time
             self.old_worker_pool = old_worker_pool
             self.restart_time = None
             self.new_worker_pool = None
 
+    __slots__ = (
+        "_logger",
+        "_name",
+        "_task_graph",
+        "_creating_job",
+        "_probability",
+        "_profile",
+        "_deadline",
+        "_timestamp",
+        "_id",
+        "_hash",
+        "_intended_release_time",
+        "_release_time",
+        "_scheduling_time",
+        "_scheduler_placement",
+        "_start_time",
+        "_cancellation_time",
+        "_completion_time",
+        "_preemptions",
+        "_remaining_time",
+        "_last_step_time",
+        "_clock",
+        "_state",
+        "_pre_scheduling_state",
+        "_worker_pool_id",
+        "_state_observers",
+    )
+
     def __init__(
         self,
         name: str,
@@ -106,10 +182,7 @@ class Task(object):
                 "fixed completion time is not supported."
             )
         # Set up the logger.
-        if _logger:
-            self._logger = _logger
-        else:
-            self._logger = setup_logging(name=f"{name}_{timestamp}")
+        self._logger = _logger if _logger else get_task_logger()
 
         self._name = name
         self._task_graph = task_graph
@@ -120,7 +193,7 @@ class Task(object):
         self._profile = profile if profile else job.profile
         self._deadline = deadline
         self._timestamp = timestamp
-        self._id = uuid.UUID(int=random.getrandbits(128), version=4)
+        self._id = next(_task_ids)
         self._hash = hash(self._id)
 
         # The timestamps maintained for each state of the task.
@@ -137,15 +210,22 @@ class Task(object):
         # (RUNNING -> EVICTED / COMPLETED)
         self._completion_time = completion_time
         # (RUNNING -> PREEMPTED)
-        self._preemptions = []
+        # The list is only allocated upon the first preemption of the Task.
+        self._preemptions = ()
 
         # The data required for managing the execution of a particular task.
         self._remaining_time = None
         self._last_step_time = -1  # Time when this task was stepped through.
+        # The clock of the simulator when the remaining time is computed on demand.
+        self._clock: Optional[Callable[[], EventTime]] = None
         self._state = TaskState.VIRTUAL
         self._pre_scheduling_state = TaskState.VIRTUAL
         # ID of the worker pool on which the task is running.
         self._worker_pool_id = None
+        # The callbacks invoked (with the Task and its previous state) upon every
+        # change to the state of the Task. The list is only allocated upon the
+        # registration of the first observer.
+        self._state_observers = ()
 
     def release(self, time: Optional[EventTime] = None):
         """Release the task and transition away from the virtual state.
@@ -168,8 +248,10 @@ class Task(object):
             )
         if time is not None:
             self._logger.debug(
-                f"[{time.to(EventTime.Unit.US).time}] Transitioning {self} "
-                f"to {TaskState.RELEASED}."
+                "[%s] Transitioning %s to %s.",
+                time.to(EventTime.Unit.US).time,
+                self,
+                TaskState.RELEASED,
             )
             self._release_time = time
             if self._release_time > self._deadline:
@@ -181,10 +263,12 @@ class Task(object):
         if self._state < TaskState.RELEASED:
             if time:
                 self._logger.debug(
-                    f"[{time.to(EventTime.Unit.US).time}] Released task "
-                    f"{self.unique_name} from state {self._state}."
+                    "[%s] Released task %s from state %s.",
+                    time.to(EventTime.Unit.US).time,
+                    self.unique_name,
+                    self._state,
                 )
-            self._state = TaskState.RELEASED
+            self.__update_state(TaskState.RELEASED)
             self._pre_scheduling_state = TaskState.RELEASED
 
     def schedule(
@@ -217,11 +301,14 @@ class Task(object):
                 f"Task is in state {self.state}."
             )
         self._logger.debug(
-            f"[{time.to(EventTime.Unit.US).time}] Transitioning {self} to "
-            f"{TaskState.SCHEDULED} to be started at {placement.placement_time} "
-            f"on WorkerPool({placement.worker_pool_id})."
+            "[%s] Transitioning %s to %s to be started at %s on WorkerPool(%s).",
+            time.to(EventTime.Unit.US).time,
+            self,
+            TaskState.SCHEDULED,
+            placement.placement_time,
+            placement.worker_pool_id,
         )
-        self._state = TaskState.SCHEDULED
+        self.__update_state(TaskState.SCHEDULED)
         self._scheduling_time = time
         self._scheduler_placement = placement
         self._worker_pool_id = placement.worker_pool_id
@@ -245,10 +332,13 @@ class Task(object):
                 f"Task must be in SCHEDULED state, currently in {self.state}."
             )
         self._logger.debug(
-            f"[{time.to(EventTime.Unit.US).time}] Transitioning {self} to "
-            f"{self._pre_scheduling_state} from {TaskState.SCHEDULED}."
+            "[%s] Transitioning %s to %s from %s.",
+            time.to(EventTime.Unit.US).time,
+            self,
+            self._pre_scheduling_state,
+            TaskState.SCHEDULED,
         )
-        self._state = self._pre_scheduling_state
+        self.__update_state(self._pre_scheduling_state)
         self._scheduling_time = None
         self._scheduler_placement = None
         self._worker_pool_id = None
@@ -283,15 +373,18 @@ class Task(object):
 
         remaining_time = self._remaining_time.fuzz((0, variance))
         self._logger.debug(
-            f"[{time.to(EventTime.Unit.US).time}] Transitioning {self} to "
-            f"{TaskState.RUNNING} with the remaining time {remaining_time}."
+            "[%s] Transitioning %s to %s with the remaining time %s.",
+            time.to(EventTime.Unit.US).time,
+            self,
+            TaskState.RUNNING,
+            remaining_time,
         )
         self._start_time = time if time is not None else self._start_time
         assert (
             self._start_time >= self._release_time
         ), f"Task {self.id} start time must be greater than release time"
         self._last_step_time = time
-        self._state = TaskState.RUNNING
+        self.__update_state(TaskState.RUNNING)
         self.update_remaining_time(remaining_time)
 
     def step(
@@ -345,10 +438,14 @@ class Task(object):
         else:
             self._last_step_time = current_time + step_size
             self._remaining_time -= execution_time
-            self._logger.debug(
-                f"[{current_time.to(EventTime.Unit.US).time}] Stepped {self} for "
-                f"{step_size} steps. Remaining execution time: {self._remaining_time}."
-            )
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    "[%s] Stepped %s for %s steps. Remaining execution time: %s.",
+                    current_time.to(EventTime.Unit.US).time,
+                    self,
+                    step_size,
+                    self._remaining_time,
+                )
             return False
 
     def preempt(self, time: EventTime):
@@ -366,16 +463,20 @@ class Task(object):
         if self.state != TaskState.RUNNING:
             raise ValueError(f"Task {self.id} is not RUNNING right now.")
         self._logger.debug(
-            f"[{time.to(EventTime.Unit.US).time}] Transitioning {self} to "
-            f"{TaskState.PREEMPTED}."
+            "[%s] Transitioning %s to %s.",
+            time.to(EventTime.Unit.US).time,
+            self,
+            TaskState.PREEMPTED,
         )
+        if not self._preemptions:
+            self._preemptions = []
         self._preemptions.append(
             Task.Preemption(
                 preemption_time=time,
                 old_worker_pool=self._worker_pool_id,
             )
         )
-        self._state = TaskState.PREEMPTED
+        self.__update_state(TaskState.PREEMPTED)
         self._worker_pool_id = None
 
     def resume(self, time: EventTime, worker_pool_id: Optional[str] = None):
@@ -401,14 +502,17 @@ class Task(object):
             worker_pool_id if worker_pool_id else self.last_preemption.old_worker_pool
         )
         self._logger.debug(
-            f"[{time.to(EventTime.Unit.US).time}] Transitioning {self} which was "
-            f"PREEMPTED at {self.preemption_time} to {TaskState.RUNNING} on "
-            f"WorkerPool ({new_worker_pool})."
+            "[%s] Transitioning %s which was PREEMPTED at %s to %s on WorkerPool (%s).",
+            time.to(EventTime.Unit.US).time,
+            self,
+            self.preemption_time,
+            TaskState.RUNNING,
+            new_worker_pool,
         )
         self.last_preemption.restart_time = time
         self.last_preemption.new_worker_pool = new_worker_pool
         self._last_step_time = time
-        self._state = TaskState.RUNNING
+        self.__update_state(TaskState.RUNNING)
         self._worker_pool_id = new_worker_pool
 
     def finish(self, time: Optional[EventTime] = None):
@@ -424,14 +528,15 @@ class Task(object):
             raise ValueError(f"Task {self.id} is not RUNNING or PREEMPTED right now.")
         self._completion_time = time if time is not None else self._last_step_time
         if self._remaining_time == EventTime.zero():
-            self._state = TaskState.COMPLETED
+            self.__update_state(TaskState.COMPLETED)
         else:
-            self._state = TaskState.EVICTED
+            self.__update_state(TaskState.EVICTED)
 
         self._worker_pool_id = None
         self._logger.debug(
-            f"[{self._completion_time.to(EventTime.Unit.US).time}] Finished "
-            f"execution of {self}."
+            "[%s] Finished execution of %s.",
+            self._completion_time.to(EventTime.Unit.US).time,
+            self,
         )
 
     def cancel(self, time: EventTime) -> None:
@@ -456,11 +561,53 @@ class Task(object):
         self._cancellation_time = time
         self.update_probability(0.0)
         self.update_remaining_time(EventTime.zero())
-        self._state = TaskState.CANCELLED
+        self.__update_state(TaskState.CANCELLED)
         self._logger.debug(
-            f"[{time.to(EventTime.Unit.US).time}] Cancelled execution of {self}."
+            "[%s] Cancelled execution of %s.", time.to(EventTime.Unit.US).time, self
         )
 
+    def __update_state(self, state: TaskState) -> None:
+        """Transitions the Task to the given state, and notifies the observers."""
+        previous_state = self._state
+        self._state = state
+        for observer in self._state_observers:
+            observer(self, previous_state)
+
+    def _add_state_observer(
+        self, observer: Callable[["Task", TaskState], None]
+    ) -> None:
+        """Registers a callback to be invoked (with the Task and its previous state)
+        upon every change to the state of the Task.
+
+        Args:
+            observer (`Callable[[Task, TaskState], None]`): The callback to register.
+        """
+        if not self._state_observers:
+            self._state_observers = []
+        self._state_observers.append(observer)
+
+    def _remove_state_observer(
+        self, observer: Callable[["Task", TaskState], None]
+    ) -> None:
+        """Unregisters a callback registered using `_add_state_observer`.
+
+        Args:
+            observer (`Callable[[Task, TaskState], None]`): The callback to unregister.
+        """
+        self._state_observers.remove(observer)
+
+    def track_remaining_time(self, clock: Optional[Callable[[], EventTime]]) -> None:
+        """Computes the remaining time of the RUNNING task on demand from its
+        projected completion time and the given clock, so that the task does not
+        need to be stepped to report its remaining time.
+
+        Args:
+            clock (`Optional[Callable[[], EventTime]]`): A callable that returns the
+                current time of the simulator, or `None` to only report the remaining
+                time as of the last step of the task.
+        """
+        self._clock = clock
+
     def update_remaining_time(self, time: EventTime):
         """Updates the remaining time of the task to simulate any runtime
         variabilities.
@@ -539,7 +686,7 @@ class Task(object):
             else all(parents_completion_status)
         )
         self._logger.debug(
-            f"The parent completion status of Task {self} is {parents_complete}."
+            "The parent completion status of Task %s is %s.", self, parents_complete
         )
 
         # If the parents have finished execution, and the task
@@ -618,7 +765,7 @@ class Task(object):
         return self._hash
 
     def __eq__(self, other):
-        return uuid.UUID(self.id) == uuid.UUID(other.id)
+        return self._id == other._id
 
     def __lt__(self, other):
         if self == other:
@@ -637,7 +784,7 @@ class Task(object):
     def unique_name(self) -> str:
         return f"{self._name}@{self._task_graph}"
 
-    @cached_property
+    @property
     def id(self) -> str:
         return str(self._id)
 
@@ -724,6 +871,12 @@ class Task(object):
         execute."""
         if self.state in [TaskState.COMPLETED, TaskState.CANCELLED]:
             return EventTime.zero()
+        elif self.state == TaskState.RUNNING and self._clock is not None:
+            # The task runs uninterrupted since its last step.
+            return max(
+                self._last_step_time + self._remaining_time - self._clock(),
+                EventTime.zero(),
+            )
         elif self.state in [
             TaskState.RUNNING,
             TaskState.PREEMPTED,
@@ -773,6 +926,16 @@ class TaskGraph(Graph[Task]):
             raise ValueError("The name must be a string.")
         self._name = name
         self._job_graph = job_graph
+        # The sink Tasks whose state transitions are counted (see
+        # `__get_sink_state_counts`).
+        self._observed_sink_tasks = set()
+        # The Tasks whose transitions to and from a terminal state are counted (see
+        # `__get_terminal_task_count`).
+        self._observed_tasks = set()
+        # The Tasks indexed by their names and unique names. The indices are built
+        # upon the first lookup, and are then maintained as the Tasks are added to
+        # or removed from the TaskGraph.
+        self._name_indices: Optional[Tuple[dict, dict]] = None
         super().__init__(tasks)
 
     def add_task(self, task: Task, children: Optional[Sequence[Task]] = []):
@@ -784,6 +947,46 @@ class TaskGraph(Graph[Task]):
         """
         self.add_node(task, *children)
 
+    def add_node(self, node: Task, *children: Task):
+        if self._name_indices is not None and node not in self._graph:
+            self.__index_task(node)
+        super().add_node(node, *children)
+
+    def add_child(self, node: Task, child: Task):
+        is_new_child = self._name_indices is not None and child not in self._graph
+        super().add_child(node, child)
+        if is_new_child:
+            self.__index_task(child)
+
+    def remove(self, node: Task):
+        super().remove(node)
+        if self._name_indices is None:
+            return
+        tasks_by_name, tasks_by_unique_name = self._name_indices
+        for index, key in (
+            (tasks_by_name, node.name),
+            (tasks_by_unique_name, node.unique_name),
+        ):
+            indexed_tasks = index[key]
+            indexed_tasks.remove(node)
+            if len(indexed_tasks) == 0:
+                del index[key]
+
+    def __get_name_indices(self) -> Tuple[dict, dict]:
+        """Retrieves the indices of the Tasks by their names and unique names,
+        building them if this is the first lookup."""
+        if self._name_indices is None:
+            self._name_indices = ({}, {})
+            for task in self.get_nodes():
+                self.__index_task(task)
+        return self._name_indices
+
+    def __index_task(self, task: Task) -> None:
+        """Adds the given Task (that is new to the TaskGraph) to the name indices."""
+        tasks_by_name, tasks_by_unique_name = self._name_indices
+        tasks_by_name.setdefault(task.name, []).append(task)
+        tasks_by_unique_name.setdefault(task.unique_name, []).append(task)
+
     def cancel(self, task: Task, time: EventTime) -> Sequence[Task]:
         """Cancels a task along with any tasks that cannot execute as a result
         of this task's cancellation. Note that this method also cancels the
@@ -976,7 +1179,7 @@ class TaskGraph(Graph[Task]):
         Returns:
             A possibly empty `Sequence[Task]` with the given name.
         """
-        return self.filter(lambda task: task.name == task_name)
+        return list(self.__get_name_indices()[0].get(task_name, ()))
 
     def get_schedulable_tasks(
         self,
@@ -1334,7 +1537,9 @@ class TaskGraph(Graph[Task]):
             A `Sequence[Task]` of tasks that have no dependencies on any
             tasks with the same timestamps.
         """
-        return self.filter(self.is_source_task)
+        return self._get_cached_structure(
+            "source_tasks", lambda: self.filter(self.is_source_task)
+        )
 
     def get_sink_tasks(self) -> Sequence[Task]:
         """Retrieve the sink tasks from the instance of the TaskGraph.
@@ -1346,7 +1551,81 @@ class TaskGraph(Graph[Task]):
             A `Sequence[Task]` of tasks that have no dependencies on any
             tasks with the same timestamps.
         """
-        return self.filter(self.is_sink_task)
+        return self._get_cached_structure(
+            "sink_tasks", lambda: self.filter(self.is_sink_task)
+        )
+
+    def __get_sink_state_counts(self) -> List[int]:
+        """Retrieves the number of the sink Tasks that have finished execution and
+        that have been cancelled.
+
+        The counts are computed upon the first query after a change to the structure
+        of the TaskGraph, and are then maintained from the state transitions of the
+        sink Tasks (see `__on_sink_task_state_change`).
+
+        Returns:
+            A `List[int]` with the number of completed and cancelled sink Tasks.
+        """
+        sink_state_counts = self._structure_cache.get("sink_state_counts")
+        if sink_state_counts is None:
+            sink_tasks = self.get_sink_tasks()
+            observed_sink_tasks = set(sink_tasks)
+            for task in self._observed_sink_tasks - observed_sink_tasks:
+                task._remove_state_observer(self.__on_sink_task_state_change)
+            for task in observed_sink_tasks - self._observed_sink_tasks:
+                task._add_state_observer(self.__on_sink_task_state_change)
+            self._observed_sink_tasks = observed_sink_tasks
+            sink_state_counts = [
+                sum(task.is_complete() for task in sink_tasks),
+                sum(task.state == TaskState.CANCELLED for task in sink_tasks),
+            ]
+            self._structure_cache["sink_state_counts"] = sink_state_counts
+        return sink_state_counts
+
+    def __on_sink_task_state_change(self, task: Task, previous_state: TaskState):
+        sink_state_counts = self._structure_cache.get("sink_state_counts")
+        if sink_state_counts is None:
+            # The counts will be recomputed upon the next query.
+            return
+        sink_state_counts[0] += task.is_complete() - (
+            previous_state in (TaskState.EVICTED, TaskState.COMPLETED)
+        )
+        sink_state_counts[1] += (task.state == TaskState.CANCELLED) - (
+            previous_state == TaskState.CANCELLED
+        )
+
+    def __get_terminal_task_count(self) -> int:
+        """Retrieves the number of the Tasks that have reached a terminal state.
+
+        The count is computed upon the first query after a change to the structure
+        of the TaskGraph, and is then maintained from the state transitions of the
+        Tasks (see `__on_task_state_change`).
+
+        Returns:
+            The number of Tasks in a terminal state.
+        """
+        terminal_task_count = self._structure_cache.get("terminal_task_count")
+        if terminal_task_count is None:
+            observed_tasks = set(self._graph)
+            for task in self._observed_tasks - observed_tasks:
+                task._remove_state_observer(self.__on_task_state_change)
+            for task in observed_tasks - self._observed_tasks:
+                task._add_state_observer(self.__on_task_state_change)
+            self._observed_tasks = observed_tasks
+            terminal_task_count = [
+                sum(task.state in TERMINAL_TASK_STATES for task in observed_tasks)
+            ]
+            self._structure_cache["terminal_task_count"] = terminal_task_count
+        return terminal_task_count[0]
+
+    def __on_task_state_change(self, task: Task, previous_state: TaskState):
+        terminal_task_count = self._structure_cache.get("terminal_task_count")
+        if terminal_task_count is None:
+            # The count will be recomputed upon the next query.
+            return
+        terminal_task_count[0] += (task.state in TERMINAL_TASK_STATES) - (
+            previous_state in TERMINAL_TASK_STATES
+        )
 
     def dilate(self, difference: EventTime):
         """Dilate the time between occurrence of events of successive
@@ -1427,7 +1706,18 @@ class TaskGraph(Graph[Task]):
             `True` if all the sink tasks in the TaskGraphs have finished execution,
             and `False` otherwise.
         """
-        return all(task.is_complete() for task in self.get_sink_tasks())
+        return self.__get_sink_state_counts()[0] == len(self.get_sink_tasks())
+
+    def is_terminated(self) -> bool:
+        """Check if all the tasks in the TaskGraph have reached a terminal state
+        (i.e., EVICTED, COMPLETED or CANCELLED), and the TaskGraph will not make any
+        further progress.
+
+        Returns:
+            `True` if none of the tasks in the TaskGraph can be executed anymore, and
+            `False` otherwise.
+        """
+        return self.__get_terminal_task_count() == len(self)
 
     def is_cancelled(self) -> bool:
         """Check if the task graph has been cancelled, and will not finish execution.
@@ -1436,7 +1726,7 @@ class TaskGraph(Graph[Task]):
             `True` if any of the sink tasks in the TaskGraph have been cancelled, and
             `False` otherwise.
         """
-        return any(task.state == TaskState.CANCELLED for task in self.get_sink_tasks())
+        return self.__get_sink_state_counts()[1] > 0
 
     def resolve_conditional(
         self,
@@ -1605,13 +1895,13 @@ class TaskGraph(Graph[Task]):
         Raises:
             `ValueError` if multiple tasks with the same name are found.
         """
-        matched_task = None
-        for task in self.get_nodes():
-            if task.name == name or (unique and task.unique_name == name):
-                if matched_task:
-                    raise ValueError(f"Multiple tasks with the name {name} found.")
-                matched_task = task
-        return matched_task
+        tasks_by_name, tasks_by_unique_name = self.__get_name_indices()
+        matched_tasks = tasks_by_name.get(name, ())
+        if unique and name in tasks_by_unique_name:
+            matched_tasks = [*matched_tasks, *tasks_by_unique_name[name]]
+        if len(matched_tasks) > 1:
+            raise ValueError(f"Multiple tasks with the name {name} found.")
+        return matched_tasks[0] if matched_tasks else None
 
     def update_edges(self, tasks: Mapping[Task, Sequence[Task]]) -> None:
         """Updates the edges inside the TaskGraph according to the new set of tasks.
@@ -1623,6 +1913,7 @@ class TaskGraph(Graph[Task]):
             tasks (`Mapping[Task, Sequence[Task]]`): A mapping of tasks to their
                 children tasks.
         """
+        self._name_indices = None
         super(TaskGraph, self).__init__(tasks)
 
     @property
@@ -0,0 +1,347 @@
+from collections import deque
+from typing import Any, Mapping, Optional, Sequence, Tuple
+
+from utils import EventTime
+
+from . import BranchPredictionPolicy
+from .tasks import Task, TaskGraph, TaskState
+
+# The role that each Task plays in the retrieval of the schedulable tasks. The roles
+# are derived from the state of the Task at the time the TaskGraph was last updated.
+_NOT_SCHEDULABLE = 0  # The task can never be schedulable (e.g., CANCELLED).
+_MARKS_RELEASED = 1  # The task is COMPLETED or RUNNING.
+_RELEASED = 2  # The task is schedulable if released within the lookahead.
+_ALWAYS_SCHEDULABLE = 3  # The task is PREEMPTED or EVICTED.
+_ESTIMATED = 4  # The task is schedulable if expected to be released in time.
+
+
+def _to_us(time: EventTime) -> int:
+    return time.to(EventTime.Unit.US).time
+
+
+def _max(first: Optional[int], second: Optional[int]) -> Optional[int]:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return max(first, second)
+
+
+class _TaskGraphEstimate(object):
+    """The estimated completion times of the tasks of a `TaskGraph`, represented
+    independently of the time at which the schedulable tasks are retrieved.
+
+    The estimated completion time of each task at time `t` is given by the maximum
+    of an `offset`, `t + delay`, and `t + r.remaining_time + distance` for the
+    RUNNING tasks `r` that it depends on. The `offset` is derived from the fixed
+    times of the tasks (e.g., the completion time of COMPLETED parents), the `delay`
+    is derived from the tasks that are assumed to make progress starting at `t`
+    (e.g., the remaining time of RELEASED parents), and the `distance` is the runtime
+    of the path from the RUNNING task. These values are propagated through the
+    TaskGraph in the same way as `TaskGraph.get_schedulable_tasks`, and can thus be
+    reused until the state of any of the tasks of the TaskGraph changes.
+
+    Args:
+        task_graph (`TaskGraph`): The TaskGraph to estimate the completion times for.
+        retract_schedules (`bool`): If `True`, the SCHEDULED tasks are assumed to be
+            placed again.
+        policy (`BranchPredictionPolicy`): The branch prediction policy to use when
+            resolving the conditionals of the TaskGraph.
+        branch_prediction_accuracy (`float`): The accuracy with which the branches
+            should be correctly predicted by the TaskGraph.
+    """
+
+    def __init__(
+        self,
+        task_graph: TaskGraph,
+        retract_schedules: bool,
+        policy: BranchPredictionPolicy,
+        branch_prediction_accuracy: float,
+    ) -> None:
+        # Estimate the completion time of materialized tasks.
+        task_queue = deque([])
+        offsets: Mapping[Task, Optional[int]] = {}
+        delays: Mapping[Task, Optional[int]] = {}
+        distances: Mapping[Task, Mapping[Task, int]] = {}
+        for task in task_graph.get_nodes():
+            offset, delay, distance = None, None, {}
+            if task.state == TaskState.COMPLETED:
+                offset = _to_us(task.completion_time)
+            elif task.state == TaskState.RUNNING:
+                # The remaining time of the RUNNING tasks changes as they are stepped
+                # by the Simulator, and is only retrieved when the tasks are queried.
+                distance = {task: 0}
+            elif task.state in (TaskState.PREEMPTED, TaskState.EVICTED):
+                delay = _to_us(task.remaining_time)
+            elif task.state == TaskState.RELEASED:
+                delay = _to_us(task.remaining_time)
+                offset = _to_us(task.release_time) + delay
+            elif task.state == TaskState.SCHEDULED:
+                if retract_schedules:
+                    slowest_strategy = (
+                        task.available_execution_strategies.get_slowest_strategy()
+                    )
+                    delay = _to_us(slowest_strategy.runtime)
+                else:
+                    offset = _to_us(task.expected_start_time + task.remaining_time)
+            elif task.state in (TaskState.CANCELLED, TaskState.VIRTUAL):
+                continue
+            else:
+                raise ValueError(
+                    f"Task {task.unique_name} in unknown state: {task.state}."
+                )
+            offsets[task], delays[task], distances[task] = offset, delay, distance
+            task_queue.append(task)
+
+        # Propagate the estimates to the VIRTUAL (or retracted SCHEDULED) tasks.
+        while len(task_queue) > 0:
+            task = task_queue.popleft()
+            offset, delay, distance = offsets[task], delays[task], distances[task]
+            if task.conditional:
+                children_tasks = task_graph.resolve_conditional(
+                    task, policy, branch_prediction_accuracy
+                )
+            else:
+                children_tasks = task_graph.get_children(task)
+
+            for child_task in children_tasks:
+                if (
+                    not retract_schedules and child_task.state != TaskState.VIRTUAL
+                ) or (
+                    retract_schedules
+                    and child_task.state not in (TaskState.VIRTUAL, TaskState.SCHEDULED)
+                ):
+                    continue
+
+                slowest_strategy = (
+                    child_task.available_execution_strategies.get_slowest_strategy()
+                )
+                runtime = _to_us(slowest_strategy.runtime)
+                child_offset = None if offset is None else offset + runtime
+                if child_task.release_time:
+                    child_offset = _max(
+                        child_offset, _to_us(child_task.release_time) + runtime
+                    )
+                child_delay = None if delay is None else delay + runtime
+                child_distance = {
+                    running_task: running_distance + runtime
+                    for running_task, running_distance in distance.items()
+                }
+
+                if child_task in offsets:
+                    child_offset = _max(offsets[child_task], child_offset)
+                    child_delay = _max(delays[child_task], child_delay)
+                    for running_task, running_distance in distances[child_task].items():
+                        child_distance[running_task] = _max(
+                            child_distance.get(running_task), running_distance
+                        )
+                    if (
+                        child_offset == offsets[child_task]
+                        and child_delay == delays[child_task]
+                        and child_distance == distances[child_task]
+                    ):
+                        # The estimate of the child task did not increase.
+                        continue
+                offsets[child_task] = child_offset
+                delays[child_task] = child_delay
+                distances[child_task] = child_distance
+                task_queue.append(child_task)
+
+        # Summarize the role of each task in the topologically-sorted order.
+        self.tasks: Sequence[
+            Tuple[
+                Task,
+                int,
+                Optional[int],
+                Optional[int],
+                Optional[int],
+                Mapping[Task, int],
+            ]
+        ] = []
+        for task in task_graph.topological_sort():
+            role, threshold = _NOT_SCHEDULABLE, None
+            if task.state in (TaskState.COMPLETED, TaskState.RUNNING):
+                role = _MARKS_RELEASED
+            elif task.state == TaskState.RELEASED:
+                role, threshold = _RELEASED, _to_us(task.release_time)
+            elif task.state in (TaskState.PREEMPTED, TaskState.EVICTED):
+                role = _ALWAYS_SCHEDULABLE
+            elif task.state == TaskState.VIRTUAL and task in offsets:
+                role, threshold = _ESTIMATED, _to_us(task.remaining_time)
+            elif (
+                retract_schedules
+                and task.state == TaskState.SCHEDULED
+                and task in offsets
+            ):
+                role = _ESTIMATED
+                threshold = _to_us(
+                    task.available_execution_strategies.get_slowest_strategy().runtime
+                )
+            if role == _ESTIMATED:
+                self.tasks.append(
+                    (
+                        task,
+                        role,
+                        threshold,
+                        offsets[task],
+                        delays[task],
+                        distances[task],
+                    )
+                )
+            elif role != _NOT_SCHEDULABLE:
+                self.tasks.append((task, role, threshold, None, None, None))
+
+    def get_schedulable_tasks(
+        self, time: EventTime, lookahead: EventTime, release_taskgraphs: bool
+    ) -> Sequence[Task]:
+        """Retrieves the tasks that are schedulable in the `time + lookahead` horizon
+        according to the estimates."""
+        current_time = _to_us(time)
+        horizon = current_time + _to_us(lookahead)
+        remaining_times: Mapping[Task, int] = {}
+        tasks = []
+        any_released = False
+        for task, role, threshold, offset, delay, distance in self.tasks:
+            if role == _MARKS_RELEASED:
+                any_released = True
+            elif role == _RELEASED:
+                if threshold <= horizon:
+                    tasks.append(task)
+                    any_released = True
+            elif role == _ALWAYS_SCHEDULABLE:
+                tasks.append(task)
+                any_released = True
+            elif any_released and release_taskgraphs:
+                tasks.append(task)
+            else:
+                estimated_completion_time = _max(
+                    offset, None if delay is None else current_time + delay
+                )
+                for running_task, running_distance in distance.items():
+                    if running_task not in remaining_times:
+                        remaining_times[running_task] = _to_us(
+                            running_task.remaining_time
+                        )
+                    estimated_completion_time = _max(
+                        estimated_completion_time,
+                        current_time + remaining_times[running_task] + running_distance,
+                    )
+                if estimated_completion_time <= horizon + threshold:
+                    tasks.append(task)
+                    any_released = True
+        return tasks
+
+
+class SchedulableTaskTracker(object):
+    """Maintains the set of schedulable tasks of the `TaskGraph`s incrementally.
+
+    The tracker caches the estimated completion times of the tasks of each
+    `TaskGraph`, and only recomputes them for the `TaskGraph`s that were updated
+    since the last retrieval of the schedulable tasks. The owner of the tracker is
+    responsible for invoking `invalidate` upon any change to the state of the tasks
+    of a `TaskGraph` (e.g., the release, placement, completion or cancellation of
+    a task).
+    """
+
+    def __init__(self) -> None:
+        self._estimates: Mapping[
+            str, Mapping[Tuple[bool, Any, Any], _TaskGraphEstimate]
+        ] = {}
+        self._conditional_task_graphs: Mapping[str, bool] = {}
+
+    def supports(self, task_graph: TaskGraph, policy: BranchPredictionPolicy) -> bool:
+        """Checks if the schedulable tasks of the given TaskGraph can be maintained
+        incrementally. The conditionals resolved by the `RANDOM` policy differ across
+        invocations, and hence TaskGraphs with conditionals are not supported.
+
+        Args:
+            task_graph (`TaskGraph`): The TaskGraph to check.
+            policy (`BranchPredictionPolicy`): The branch prediction policy to use.
+        """
+        return policy != BranchPredictionPolicy.RANDOM or not self.__is_conditional(
+            task_graph
+        )
+
+    def __is_conditional(self, task_graph: TaskGraph) -> bool:
+        """Checks if the given TaskGraph has any conditional tasks."""
+        if task_graph.name not in self._conditional_task_graphs:
+            self._conditional_task_graphs[task_graph.name] = any(
+                task.conditional for task in task_graph.get_nodes()
+            )
+        return self._conditional_task_graphs[task_graph.name]
+
+    def invalidate(self, task_graph_name: str) -> None:
+        """Invalidates the cached estimates of the given TaskGraph.
+
+        Args:
+            task_graph_name (`str`): The name of the TaskGraph that was updated.
+        """
+        self._estimates.pop(task_graph_name, None)
+
+    def remove(self, task_graph_name: str) -> None:
+        """Removes the state maintained for the given TaskGraph.
+
+        Args:
+            task_graph_name (`str`): The name of the TaskGraph that will not be
+                queried anymore.
+        """
+        self._estimates.pop(task_graph_name, None)
+        self._conditional_task_graphs.pop(task_graph_name, None)
+
+    def get_schedulable_tasks(
+        self,
+        task_graph: TaskGraph,
+        time: EventTime,
+        lookahead: EventTime = EventTime.zero(),
+        preemption: bool = False,
+        retract_schedules: bool = False,
+        worker_pools: "WorkerPools" = None,  # noqa: F821
+        policy: BranchPredictionPolicy = BranchPredictionPolicy.ALL,
+        branch_prediction_accuracy: float = 0.50,
+        release_taskgraphs: bool = False,
+    ) -> Sequence[Task]:
+        """Retrieves the tasks from the given TaskGraph that are expected to be
+        available for scheduling within the horizon defined by `time + lookahead`.
+
+        The method returns the same tasks as `TaskGraph.get_schedulable_tasks`, but
+        reuses the estimates of the completion times of the tasks if the TaskGraph
+        has not been updated since they were computed. The arguments are the same as
+        those of `TaskGraph.get_schedulable_tasks`.
+
+        Raises:
+            `ValueError` if the TaskGraph is not supported with the given `policy`.
+
+        Returns:
+            A list of tasks that are schedulable in the `time + lookahead` horizon.
+        """
+        if not self.supports(task_graph, policy):
+            raise ValueError(
+                f"The SchedulableTaskTracker does not support the TaskGraph "
+                f"{task_graph.name} with the policy {policy}."
+            )
+        # The branch prediction parameters only affect the TaskGraphs with
+        # conditionals, and the estimates are otherwise shared across the policies.
+        if self.__is_conditional(task_graph):
+            parameters = (retract_schedules, policy, branch_prediction_accuracy)
+        else:
+            parameters = (retract_schedules, None, None)
+        estimates = self._estimates.setdefault(task_graph.name, {})
+        estimate = estimates.get(parameters)
+        if estimate is None:
+            estimate = _TaskGraphEstimate(
+                task_graph, retract_schedules, policy, branch_prediction_accuracy
+            )
+            estimates[parameters] = estimate
+
+        tasks = estimate.get_schedulable_tasks(time, lookahead, release_taskgraphs)
+        if preemption:
+            if worker_pools:
+                tasks.extend(worker_pools.get_placed_tasks())
+            else:
+                tasks.extend(
+                    task_graph.filter(
+                        lambda task: task.state
+                        in (TaskState.SCHEDULED, TaskState.RUNNING)
+                    )
+                )
+        return tasks
@@ -1,4 +1,4 @@
-from typing import Callable, Mapping, Optional, Sequence, Set, Tuple
+from typing import Callable, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple
 
 import absl
 
@@ -8,6 +8,46 @@ from workload import BranchPredictionPolicy
 from .jobs import JobGraph
 from .profile import WorkProfile
 from .tasks import Task, TaskGraph
+from .tracker import SchedulableTaskTracker
+
+
+class TaskGraphSummary(NamedTuple):
+    """A compact record of the final statistics of a TaskGraph that was retired
+    from the Workload.
+
+    Attributes:
+        name: The name of the retired TaskGraph.
+        num_tasks: The number of tasks in the retired TaskGraph.
+        release_time: The time at which the TaskGraph was released.
+        deadline: The deadline of the TaskGraph.
+        completion_time: The time at which the TaskGraph completed, or `None` if
+            the TaskGraph was cancelled.
+        cancelled: `True` if the TaskGraph was cancelled, and `False` otherwise.
+    """
+
+    name: str
+    num_tasks: int
+    release_time: EventTime
+    deadline: EventTime
+    completion_time: Optional[EventTime]
+    cancelled: bool
+
+    @staticmethod
+    def from_task_graph(task_graph: TaskGraph) -> "TaskGraphSummary":
+        """Summarizes the given terminated TaskGraph.
+
+        Args:
+            task_graph: The TaskGraph whose tasks have all reached a terminal state.
+        """
+        cancelled = task_graph.is_cancelled()
+        return TaskGraphSummary(
+            name=task_graph.name,
+            num_tasks=len(task_graph),
+            release_time=task_graph.release_time,
+            deadline=task_graph.deadline,
+            completion_time=None if cancelled else task_graph.completion_time,
+            cancelled=cancelled,
+        )
 
 
 class Workload(object):
@@ -57,6 +97,36 @@ class Workload(object):
             self._task_graphs = task_graphs
             self._initialized = True
 
+        # An index of the TaskGraphs that have tasks that can still make progress.
+        # The queries for the schedulable / releasable tasks only walk these
+        # TaskGraphs, and the TaskGraphs are retired from the index upon being
+        # notified of the completion or cancellation of all of their tasks.
+        self._active_task_graphs: Mapping[str, TaskGraph] = dict()
+        # The TaskGraphs that were retired from the index after being cancelled.
+        self._cancelled_task_graphs: Mapping[str, TaskGraph] = dict()
+
+        # If requested, the schedulable tasks are maintained incrementally by only
+        # recomputing them for the TaskGraphs that were updated since the last query.
+        # The consistency of the incremental maintenance can be checked against the
+        # full recomputation of the schedulable tasks for debugging.
+        self._incremental_schedulable_tasks = (
+            _flags.incremental_schedulable_tasks if _flags else False
+        )
+        self._check_schedulable_tasks = (
+            _flags.check_schedulable_tasks if _flags else False
+        )
+        self._schedulable_task_tracker = SchedulableTaskTracker()
+
+        # If requested, the TaskGraphs retired from the index are also dropped from
+        # the Workload, and only a compact summary of their final statistics is kept
+        # so that the memory usage is bounded by the in-flight TaskGraphs.
+        self._retire_task_graphs = _flags.retire_task_graphs if _flags else False
+        self._retired_task_graphs: Mapping[str, TaskGraphSummary] = dict()
+        self._num_retired_cancelled_task_graphs = 0
+        # The TaskGraphs retired since the last call to `pop_retired_task_graphs`.
+        self._recently_retired_task_graphs: List[TaskGraphSummary] = []
+        self.__add_active_task_graphs(list(self._task_graphs.values()))
+
     @staticmethod
     def from_job_graphs(
         job_graphs: Mapping[str, JobGraph], _flags: Optional["absl.flags"] = None
@@ -123,9 +193,11 @@ class Workload(object):
         """
         if not self._initialized:
             for job_graph in self._job_graphs.values():
-                self._task_graphs |= job_graph.generate_task_graphs(
+                task_graphs = job_graph.generate_task_graphs(
                     completion_time, _flags=self._flags
                 )
+                self._task_graphs |= task_graphs
+                self.__add_active_task_graphs(task_graphs.values())
             self._initialized = True
 
     def add_job_graphs(
@@ -140,9 +212,11 @@ class Workload(object):
         """
         self._job_graphs |= {job.name: job for job in new_job_graphs}
         for job_graph in new_job_graphs:
-            self._task_graphs |= job_graph.generate_task_graphs(
+            task_graphs = job_graph.generate_task_graphs(
                 completion_time, _flags=self._flags
             )
+            self._task_graphs |= task_graphs
+            self.__add_active_task_graphs(task_graphs.values())
 
     def add_task_graph(self, task_graph: TaskGraph) -> None:
         """Adds a single TaskGraph to the Workload.
@@ -151,6 +225,7 @@ class Workload(object):
             task_graph: The TaskGraph to be added to the Workload.
         """
         self._task_graphs[task_graph.name] = task_graph
+        self.__add_active_task_graphs([task_graph])
 
     def add_task_graphs(self, task_graphs: Sequence[TaskGraph]) -> None:
         """Adds multiple TaskGraphs to the Workload.
@@ -159,6 +234,7 @@ class Workload(object):
             task_graphs: The TaskGraphs to be added to the Workload.
         """
         self._task_graphs |= {task_graph.name: task_graph for task_graph in task_graphs}
+        self.__add_active_task_graphs(task_graphs)
 
     def get_job_graph(self, name: str) -> Optional[JobGraph]:
         """Retrieves the JobGraph for the given application, if present.
@@ -182,6 +258,15 @@ class Workload(object):
         """
         return self._task_graphs.get(name)
 
+    def notify_task_update(self, task: Task) -> None:
+        """Notifies the Workload that the state of the given task was updated (e.g.,
+        the task was released, scheduled, started or preempted).
+
+        Args:
+            task: The task whose state was updated.
+        """
+        self._schedulable_task_tracker.invalidate(task.task_graph)
+
     def notify_task_completion(
         self,
         task: Task,
@@ -204,7 +289,29 @@ class Workload(object):
             )
 
         task_graph = self._task_graphs[task.task_graph]
-        return task_graph.notify_task_completion(task, finish_time)
+        released_tasks, cancelled_tasks = task_graph.notify_task_completion(
+            task, finish_time
+        )
+        self._schedulable_task_tracker.invalidate(task_graph.name)
+        self.__update_active_task_graph(task_graph)
+        return released_tasks, cancelled_tasks
+
+    def notify_task_cancellation(self, task: Task, cancellation_time: EventTime):
+        """Notifies the Workload of the cancellation of a task.
+
+        Args:
+            task: The task that was cancelled.
+            cancellation_time: The time at which the task was cancelled.
+        """
+        if task.task_graph in self._retired_task_graphs:
+            # The TaskGraph was retired upon the cancellation of an earlier task.
+            return
+        if task.task_graph not in self._task_graphs:
+            raise ValueError(
+                f"The TaskGraph {task.task_graph} was not found in the Workload."
+            )
+        self._schedulable_task_tracker.invalidate(task.task_graph)
+        self.__update_active_task_graph(self._task_graphs[task.task_graph])
 
     def notify_task_graph_completion(
         self, task_graph: TaskGraph, finish_time: EventTime
@@ -218,7 +325,10 @@ class Workload(object):
         Returns:
             The tasks from the next task graph to be scheduled, if any.
         """
-        if task_graph.name not in self._task_graphs:
+        if (
+            task_graph.name not in self._task_graphs
+            and task_graph.name not in self._retired_task_graphs
+        ):
             raise ValueError(
                 f"The TaskGraph {task_graph} was not found in the Workload."
             )
@@ -234,7 +344,7 @@ class Workload(object):
                 _flags=self._flags,
             )
             if task_graph is not None:
-                self._task_graphs[task_graph.name] = task_graph
+                self.add_task_graph(task_graph)
                 return task_graph.get_releasable_tasks()
             else:
                 return []
@@ -248,7 +358,7 @@ class Workload(object):
             A sequence of `Task`s released from the set of `TaskGraph`s.
         """
         released_tasks = []
-        for task_graph in self._task_graphs.values():
+        for task_graph in self._active_task_graphs.values():
             released_tasks.extend(task_graph.get_releasable_tasks())
         return released_tasks
 
@@ -293,9 +403,30 @@ class Workload(object):
             A list of tasks that are schedulable in the `time + lookahead` horizon.
         """
         schedulable_tasks = []
-        for task_graph in self._task_graphs.values():
-            schedulable_tasks.extend(
-                task_graph.get_schedulable_tasks(
+        for task_graph in self._active_task_graphs.values():
+            if (
+                not self._incremental_schedulable_tasks
+                or debug
+                or not self._schedulable_task_tracker.supports(task_graph, policy)
+            ):
+                schedulable_tasks.extend(
+                    task_graph.get_schedulable_tasks(
+                        time,
+                        lookahead,
+                        preemption,
+                        retract_schedules,
+                        worker_pools,
+                        policy,
+                        branch_prediction_accuracy,
+                        release_taskgraphs,
+                        debug,
+                    )
+                )
+                continue
+
+            task_graph_schedulable_tasks = (
+                self._schedulable_task_tracker.get_schedulable_tasks(
+                    task_graph,
                     time,
                     lookahead,
                     preemption,
@@ -304,23 +435,50 @@ class Workload(object):
                     policy,
                     branch_prediction_accuracy,
                     release_taskgraphs,
-                    debug,
                 )
             )
+            if self._check_schedulable_tasks:
+                expected_schedulable_tasks = task_graph.get_schedulable_tasks(
+                    time,
+                    lookahead,
+                    preemption,
+                    retract_schedules,
+                    worker_pools,
+                    policy,
+                    branch_prediction_accuracy,
+                    release_taskgraphs,
+                )
+                if task_graph_schedulable_tasks != expected_schedulable_tasks:
+                    raise RuntimeError(
+                        f"[{time}] The incrementally maintained schedulable tasks "
+                        f"{[task.unique_name for task in task_graph_schedulable_tasks]}"
+                        f" of the TaskGraph {task_graph.name} do not match the "
+                        f"recomputed schedulable tasks "
+                        f"{[task.unique_name for task in expected_schedulable_tasks]}."
+                    )
+            schedulable_tasks.extend(task_graph_schedulable_tasks)
         return schedulable_tasks
 
-    def filter(self, function: Callable[[Task], bool]) -> Sequence[Task]:
-        """Retrieves the tasks from all the TaskGraphs that return `True`
-        on the given function.
+    def filter(
+        self, function: Callable[[Task], bool], include_terminated: bool = False
+    ) -> Sequence[Task]:
+        """Retrieves the tasks from the TaskGraphs that return `True` on the given
+        function.
 
         Args:
             function: The function to execute for each of the task.
+            include_terminated: If `True`, the tasks from the TaskGraphs whose tasks
+                have all reached a terminal state are considered too. Otherwise, only
+                the active TaskGraphs are considered.
 
         Returns:
             A sequence of tasks that return True on the given function.
         """
         filtered_tasks = []
-        for task_graph in self._task_graphs.values():
+        task_graphs = (
+            self._task_graphs if include_terminated else self._active_task_graphs
+        )
+        for task_graph in task_graphs.values():
             filtered_tasks.extend(task_graph.filter(function))
         return filtered_tasks
 
@@ -332,8 +490,8 @@ class Workload(object):
             A (possibly empty) sequence of `TaskGraph`s that have atleast
             one of their tasks in the `CANCELLED` state.
         """
-        cancelled_task_graphs = []
-        for task_graph in self._task_graphs.values():
+        cancelled_task_graphs = list(self._cancelled_task_graphs.values())
+        for task_graph in self._active_task_graphs.values():
             if task_graph.is_cancelled():
                 self._logger.debug("The TaskGraph %s was cancelled.", task_graph.name)
                 cancelled_task_graphs.append(task_graph)
@@ -364,6 +522,66 @@ class Workload(object):
                 )
         return cancelled_task_graphs
 
+    def get_num_cancelled_task_graphs(self) -> int:
+        """Retrieves the number of TaskGraphs that have been cancelled, including the
+        ones that were retired from the Workload.
+
+        Returns:
+            The number of `TaskGraph`s that have atleast one of their sink tasks in
+            the `CANCELLED` state.
+        """
+        return (
+            len(self.get_cancelled_task_graphs())
+            + self._num_retired_cancelled_task_graphs
+        )
+
+    def pop_retired_task_graphs(self) -> Sequence[TaskGraphSummary]:
+        """Retrieves the summaries of the TaskGraphs that were retired from the
+        Workload since the last invocation of this method.
+
+        Returns:
+            A (possibly empty) sequence of `TaskGraphSummary` records.
+        """
+        retired_task_graphs = self._recently_retired_task_graphs
+        self._recently_retired_task_graphs = []
+        return retired_task_graphs
+
+    def __add_active_task_graphs(self, task_graphs: Sequence[TaskGraph]) -> None:
+        """Adds the given TaskGraphs to the index of the active TaskGraphs.
+
+        Args:
+            task_graphs: The TaskGraphs that were added to the Workload.
+        """
+        for task_graph in task_graphs:
+            self._active_task_graphs[task_graph.name] = task_graph
+            self.__update_active_task_graph(task_graph)
+
+    def __update_active_task_graph(self, task_graph: TaskGraph) -> None:
+        """Retires the given TaskGraph from the index of the active TaskGraphs if all
+        of its tasks have reached a terminal state.
+
+        Args:
+            task_graph: The TaskGraph whose tasks changed their state.
+        """
+        if task_graph.name not in self._active_task_graphs:
+            return
+        if task_graph.is_terminated():
+            del self._active_task_graphs[task_graph.name]
+            self._schedulable_task_tracker.remove(task_graph.name)
+            if self._retire_task_graphs:
+                summary = TaskGraphSummary.from_task_graph(task_graph)
+                del self._task_graphs[task_graph.name]
+                self._retired_task_graphs[task_graph.name] = summary
+                self._recently_retired_task_graphs.append(summary)
+                if summary.cancelled:
+                    self._num_retired_cancelled_task_graphs += 1
+            elif task_graph.is_cancelled():
+                self._cancelled_task_graphs[task_graph.name] = task_graph
+            self._logger.debug(
+                "The TaskGraph %s was retired from the set of active TaskGraphs.",
+                task_graph.name,
+            )
+
     def __len__(self) -> int:
         """Returns the total number of Tasks in the Workload."""
         total_tasks = 0
@@ -381,6 +599,22 @@ class Workload(object):
         """Retrieve the TaskGraph instances stored in this Workload."""
         return self._task_graphs
 
+    @property
+    def retired_task_graphs(self) -> Mapping[str, TaskGraphSummary]:
+        """Retrieve the summaries of the TaskGraphs dropped from this Workload."""
+        return self._retired_task_graphs
+
+    @property
+    def num_task_graphs(self) -> int:
+        """Retrieve the number of TaskGraphs added to this Workload, including the
+        ones that were retired."""
+        return len(self._task_graphs) + len(self._retired_task_graphs)
+
+    @property
+    def active_task_graphs(self) -> Mapping[str, TaskGraph]:
+        """Retrieve the TaskGraph instances that can still make progress."""
+        return self._active_task_graphs
+
     @property
     def work_profiles(self) -> Set[WorkProfile]:
         """Retrieve the `WorkProfile`s that constitute this `Workload`."""